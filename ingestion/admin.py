@@ -1,28 +1,61 @@
 from django.contrib import admin
+from django.db import transaction
 
-from ingestion.domain.models import Job, JobAuditEvent, ScrapedContent, SummaryResult, TranslationResult
+from ingestion.application.job_service import JobApplicationService
+from ingestion.application.metrics_service import JobMetricsService
+from ingestion.domain.models import ContentChunk, Crawl, Job, JobAuditEvent, ScrapedContent, SummaryResult, TranslationResult
 
 
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
-    list_display = ("id", "url", "status", "created_at", "completed_at")
+    list_display = ("id", "url", "status", "crawl", "depth", "created_at", "completed_at")
     list_filter = ("status", "created_at")
     search_fields = ("url",)
+    # The hourly rollup is maintained incrementally, so status changes only go through JobApplicationService and
+    # creates/deletes here update it in the same transaction.
+    readonly_fields = ("status", "completed_at", "lease_owner", "lease_expires_at", "attempts")
+
+    def save_model(self, request, obj, form, change):
+        if change:
+            super().save_model(request, obj, form, change)
+            return
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            JobMetricsService().record_created([obj])
+
+    def delete_model(self, request, obj):
+        JobApplicationService().delete_jobs([obj.id])
+
+    def delete_queryset(self, request, queryset):
+        JobApplicationService().delete_jobs(queryset.values_list("id", flat=True))
+
+
+@admin.register(Crawl)
+class CrawlAdmin(admin.ModelAdmin):
+    list_display = ("id", "seed_url", "sitemap", "same_host", "path_prefix", "max_depth", "max_pages", "created_at")
+    search_fields = ("seed_url",)
 
 
 @admin.register(ScrapedContent)
 class ScrapedContentAdmin(admin.ModelAdmin):
-    list_display = ("id", "job", "detected_language")
+    list_display = ("id", "job", "detected_language", "fetch_mode", "fetch_reason", "load_ms", "bytes_transferred", "blocked_requests")
+    list_filter = ("fetch_mode",)
+
+
+@admin.register(ContentChunk)
+class ContentChunkAdmin(admin.ModelAdmin):
+    list_display = ("id", "content", "position", "kind", "language", "heading", "start_offset", "end_offset")
+    list_filter = ("kind", "language")
 
 
 @admin.register(TranslationResult)
 class TranslationResultAdmin(admin.ModelAdmin):
-    list_display = ("id", "job", "translation_engine", "timestamp")
+    list_display = ("id", "job", "translation_engine", "target_language", "chunk_count", "cache_hits", "reused", "timestamp")
 
 
 @admin.register(SummaryResult)
 class SummaryResultAdmin(admin.ModelAdmin):
-    list_display = ("id", "job", "model_name", "prompt_version", "timestamp")
+    list_display = ("id", "job", "model_name", "prompt_version", "cached", "reused", "timestamp")
 
 
 @admin.register(JobAuditEvent)
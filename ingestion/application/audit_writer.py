@@ -0,0 +1,79 @@
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+from ingestion.domain.models import JobAuditEvent
+
+
+class AuditWriter:
+    def __init__(self, buffered: bool = False, max_events: int = 500, flush_interval_seconds: float = 1.0) -> None:
+        self.buffered = buffered
+        self.max_events = max_events
+        self.flush_interval_seconds = flush_interval_seconds
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._events: list[JobAuditEvent] = []
+
+    def record(self, job_id: int, stage: str, detail: str = "") -> None:
+        self.record_events([JobAuditEvent(job_id=job_id, stage=stage, detail=detail)])
+
+    def record_events(self, events: list[JobAuditEvent]) -> None:
+        with self._lock:
+            self._events.extend(events)
+        if not self.buffered or self.pending >= self.max_events:
+            self.flush()
+        else:
+            self.maybe_flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._events)
+
+    def maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            events, self._events = self._events, []
+            self._last_flush = time.monotonic()
+        if not events:
+            return
+        try:
+            with transaction.atomic():
+                JobAuditEvent.objects.bulk_create(events, batch_size=self.max_events)
+        except Exception:
+            # Keep the batch for the next flush rather than dropping audit history on a transient DB error.
+            with self._lock:
+                self._events[:0] = events
+            raise
+
+
+_writer = AuditWriter()
+
+
+def get_audit_writer() -> AuditWriter:
+    return _writer
+
+
+def configure_audit_writer(buffered: bool) -> AuditWriter:
+    global _writer
+    _writer.flush()
+    _writer = AuditWriter(
+        buffered=buffered,
+        max_events=settings.AUDIT_BUFFER_MAX_EVENTS,
+        flush_interval_seconds=settings.AUDIT_BUFFER_FLUSH_INTERVAL_SECONDS,
+    )
+    return _writer
+
+
+def _reset_after_fork() -> None:
+    # Buffered rows belong to the parent, which flushes them itself.
+    global _writer
+    _writer = AuditWriter(buffered=_writer.buffered, max_events=_writer.max_events, flush_interval_seconds=_writer.flush_interval_seconds)
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
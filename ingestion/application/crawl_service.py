@@ -0,0 +1,108 @@
+import logging
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import transaction
+
+from ingestion.application.job_service import JobApplicationService
+from ingestion.domain.models import Crawl, Job
+from ingestion.domain.urls import normalize_and_dedupe, normalize_url
+from ingestion.infrastructure.link_discovery import SitemapError, extract_links, parse_sitemap
+from ingestion.infrastructure.profiling import span
+from ingestion.infrastructure.registry import ServiceRegistry, get_service_registry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CrawlExpansion:
+    job_ids: list[int] = field(default_factory=list)
+    sitemaps: list[str] = field(default_factory=list)
+
+
+class CrawlApplicationService:
+    def __init__(self, registry: ServiceRegistry | None = None) -> None:
+        registry = registry or get_service_registry()
+        self.frontier = registry.crawl_frontier
+        self.fetcher = registry.static_fetcher
+        self.robots = registry.robots if settings.SCRAPER_RESPECT_ROBOTS else None
+        self.jobs = JobApplicationService()
+
+    def start(
+        self,
+        seed_url: str,
+        sitemap: bool = False,
+        same_host: bool = True,
+        path_prefix: str = "",
+        max_depth: int | None = None,
+        max_pages: int | None = None,
+    ) -> tuple[Crawl, CrawlExpansion]:
+        crawl = Crawl.objects.create(
+            seed_url=normalize_url(seed_url),
+            sitemap=sitemap,
+            same_host=same_host,
+            path_prefix=path_prefix,
+            max_depth=settings.CRAWL_DEFAULT_MAX_DEPTH if max_depth is None else max_depth,
+            max_pages=max_pages or settings.CRAWL_DEFAULT_MAX_PAGES,
+        )
+        expansion = CrawlExpansion()
+        if sitemap:
+            expansion.sitemaps = self.frontier.claim_sitemaps(crawl.id, [crawl.seed_url])
+        else:
+            expansion.job_ids = self.enqueue(crawl, [crawl.seed_url], depth=0)
+        logger.info("crawl.started", extra={"crawl_id": crawl.id})
+        return crawl, expansion
+
+    def expand_sitemap(self, crawl_id: int, sitemap_url: str) -> CrawlExpansion:
+        crawl = Crawl.objects.get(id=crawl_id)
+        if self.robots and not self.robots.allowed(sitemap_url):
+            raise ValueError(f"Crawling blocked by robots.txt for URL: {sitemap_url}")
+        max_bytes = settings.CRAWL_SITEMAP_MAX_BYTES
+        with span("crawl.sitemap.fetch"):
+            status, body = self.fetcher.fetch_bytes(sitemap_url, max_bytes=max_bytes)
+        if status != 200:
+            raise SitemapError(f"Sitemap {sitemap_url} returned HTTP {status}")
+        if len(body) > max_bytes:
+            raise SitemapError(f"Sitemap {sitemap_url} exceeds {max_bytes} bytes")
+        with span("crawl.sitemap.parse"):
+            sitemap = parse_sitemap(body, max_bytes=max_bytes)
+        expansion = CrawlExpansion(sitemaps=self.frontier.claim_sitemaps(crawl.id, sitemap.sitemaps))
+        expansion.job_ids = self.enqueue(crawl, sitemap.urls, depth=0)
+        logger.info("crawl.sitemap.expanded", extra={"crawl_id": crawl.id, "succeeded": len(expansion.job_ids)})
+        return expansion
+
+    def discover(self, job: Job, html: str) -> list[int]:
+        crawl = job.crawl
+        if crawl is None or job.depth >= crawl.max_depth or not html:
+            return []
+        with span("crawl.extract_links"):
+            links = extract_links(html, job.url)
+        return self.enqueue(crawl, links, depth=job.depth + 1)
+
+    def wants_links(self, job: Job) -> bool:
+        return job.crawl_id is not None and job.depth < job.crawl.max_depth
+
+    def enqueue(self, crawl: Crawl, urls: list[str], depth: int) -> list[int]:
+        unique, _ = normalize_and_dedupe(urls)
+        candidates = [url for url in unique if crawl.allows(url)]
+        if self.robots:
+            candidates = [url for url in candidates if self.robots.allowed(url)]
+        job_ids: list[int] = []
+        batch_size = settings.CRAWL_ENQUEUE_BATCH_SIZE
+        for offset in range(0, len(candidates), batch_size):
+            # The frontier is the single source of truth for "already seen", so concurrent workers never create a
+            # second job for the same URL within a crawl.
+            claimed = self.frontier.claim(crawl.id, candidates[offset : offset + batch_size], limit=crawl.max_pages)
+            if not claimed:
+                if self.frontier.size(crawl.id) >= crawl.max_pages:
+                    break
+                continue
+            try:
+                with transaction.atomic():
+                    submission = self.jobs.submit_bulk(claimed, batch_size=batch_size, crawl=crawl, depth=depth)
+            except Exception:
+                # Hand the URLs back so the retried expansion submits them instead of treating them as seen.
+                self.frontier.release(crawl.id, claimed)
+                raise
+            job_ids.extend(submission.job_ids)
+        return job_ids
@@ -0,0 +1,195 @@
+import logging
+import os
+import socket
+import threading
+import uuid
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from ingestion.application.audit_writer import get_audit_writer
+from ingestion.application.metrics_service import JobMetricsService, JobTransition
+from ingestion.domain.models import Job, JobAuditEvent, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JOB_TABLE = Job._meta.db_table
+
+# The inner SELECT walks idx_job_status_created in created_at order; SKIP LOCKED lets concurrent workers claim
+# disjoint batches without waiting on each other, and the claim is a single statement/round trip.
+CLAIM_SQL = f"""
+WITH claimable AS (
+    SELECT id FROM {JOB_TABLE}
+    WHERE status = %s
+    ORDER BY created_at
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+)
+UPDATE {JOB_TABLE} AS job
+SET status = %s,
+    lease_owner = %s,
+    lease_expires_at = now() + make_interval(secs => %s),
+    attempts = job.attempts + 1,
+    updated_at = now()
+FROM claimable
+WHERE job.id = claimable.id
+RETURNING job.id, job.created_at
+"""
+
+HEARTBEAT_SQL = f"""
+UPDATE {JOB_TABLE}
+SET lease_expires_at = now() + make_interval(secs => %s), updated_at = now()
+WHERE lease_owner = %s AND status = %s
+"""
+
+RELEASE_SQL = f"""
+UPDATE {JOB_TABLE}
+SET status = %s, lease_owner = '', lease_expires_at = NULL, attempts = GREATEST(attempts - 1, 0), updated_at = now()
+WHERE id = ANY(%s) AND lease_owner = %s AND status = %s
+RETURNING id, created_at
+"""
+
+# Besides expired leases, RUNNING rows that never had one (left behind by a Celery worker before the dispatcher was
+# switched) are recovered once they have not changed for the stale interval.
+RECOVER_SQL = f"""
+WITH expired AS (
+    SELECT id, lease_owner FROM {JOB_TABLE}
+    WHERE status = %s
+      AND (
+          lease_expires_at < now()
+          OR (lease_expires_at IS NULL AND updated_at < now() - make_interval(secs => %s))
+      )
+    FOR UPDATE SKIP LOCKED
+)
+UPDATE {JOB_TABLE} AS job
+SET status = CASE WHEN job.attempts >= %s THEN %s ELSE %s END,
+    error_message = CASE WHEN job.attempts >= %s THEN %s ELSE job.error_message END,
+    completed_at = CASE WHEN job.attempts >= %s THEN now() ELSE job.completed_at END,
+    lease_owner = '',
+    lease_expires_at = NULL,
+    updated_at = now()
+FROM expired
+WHERE job.id = expired.id
+RETURNING job.id, job.status, job.created_at, job.completed_at, expired.lease_owner
+"""
+
+
+def default_worker_id() -> str:
+    # hostname:pid repeats when a container restarts (PID 1, same hostname); the uuid keeps a restarted worker from
+    # heartbeating the leases its crashed predecessor left behind.
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:12]}"
+
+
+class PostgresJobQueue:
+    def __init__(
+        self,
+        owner: str | None = None,
+        lease_seconds: int | None = None,
+        max_attempts: int | None = None,
+        stale_seconds: int | None = None,
+    ) -> None:
+        self.owner = owner or default_worker_id()
+        self.lease_seconds = lease_seconds or settings.JOB_QUEUE_LEASE_SECONDS
+        self.max_attempts = max_attempts or settings.JOB_QUEUE_MAX_ATTEMPTS
+        self.stale_seconds = stale_seconds or settings.JOB_QUEUE_STALE_SECONDS
+        self.metrics = JobMetricsService()
+        self.audit = get_audit_writer()
+
+    def claim(self, limit: int) -> list[int]:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(CLAIM_SQL, [JobStatus.PENDING, limit, JobStatus.RUNNING, self.owner, self.lease_seconds])
+                rows = cursor.fetchall()
+            if not rows:
+                return []
+            self.metrics.record_transitions(
+                [JobTransition(created_at=created_at, old_status=JobStatus.PENDING, new_status=JobStatus.RUNNING) for _, created_at in rows]
+            )
+        # Audit rows go through the (possibly buffered) writer only once the claim has committed.
+        self.audit.record_events(
+            [JobAuditEvent(job_id=job_id, stage=JobStatus.RUNNING, detail=f"Claimed by {self.owner}") for job_id, _ in rows]
+        )
+        job_ids = sorted(job_id for job_id, _ in rows)
+        logger.info("job_queue.claimed", extra={"worker": self.owner, "succeeded": len(job_ids)})
+        return job_ids
+
+    def heartbeat(self) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(HEARTBEAT_SQL, [self.lease_seconds, self.owner, JobStatus.RUNNING])
+            return cursor.rowcount
+
+    def release(self, job_ids: list[int]) -> list[int]:
+        if not job_ids:
+            return []
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(RELEASE_SQL, [JobStatus.PENDING, list(job_ids), self.owner, JobStatus.RUNNING])
+                rows = cursor.fetchall()
+            self.metrics.record_transitions(
+                [JobTransition(created_at=created_at, old_status=JobStatus.RUNNING, new_status=JobStatus.PENDING) for _, created_at in rows]
+            )
+        return [job_id for job_id, _ in rows]
+
+    def recover_expired(self) -> tuple[list[int], list[int]]:
+        error = f"Lease expired after {self.max_attempts} attempts"
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    RECOVER_SQL,
+                    [
+                        JobStatus.RUNNING,
+                        self.stale_seconds,
+                        self.max_attempts,
+                        JobStatus.FAILED,
+                        JobStatus.PENDING,
+                        self.max_attempts,
+                        error,
+                        self.max_attempts,
+                    ],
+                )
+                rows = cursor.fetchall()
+            if not rows:
+                return [], []
+            self.metrics.record_transitions(
+                [
+                    JobTransition(created_at=created_at, old_status=JobStatus.RUNNING, new_status=status, new_completed_at=completed_at)
+                    for _, status, created_at, completed_at, _ in rows
+                ]
+            )
+        self.audit.record_events(
+            [
+                JobAuditEvent(job_id=job_id, stage=status, detail=error if status == JobStatus.FAILED else self._requeue_detail(owner))
+                for job_id, status, _, _, owner in rows
+            ]
+        )
+        requeued = [job_id for job_id, status, _, _, _ in rows if status == JobStatus.PENDING]
+        failed = [job_id for job_id, status, _, _, _ in rows if status == JobStatus.FAILED]
+        logger.warning("job_queue.recovered", extra={"succeeded": len(requeued), "failed": len(failed)})
+        return requeued, failed
+
+    def _requeue_detail(self, previous_owner: str) -> str:
+        if previous_owner:
+            return "Lease expired; requeued"
+        return f"Running without a lease for over {self.stale_seconds}s; requeued"
+
+
+class LeaseHeartbeat(threading.Thread):
+    def __init__(self, queue: PostgresJobQueue, interval_seconds: float | None = None) -> None:
+        super().__init__(name="job-queue-heartbeat", daemon=True)
+        self.queue = queue
+        self.interval_seconds = interval_seconds or max(1.0, queue.lease_seconds / 3)
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        try:
+            while not self._stopped.wait(self.interval_seconds):
+                try:
+                    self.queue.heartbeat()
+                except Exception as exc:
+                    logger.error("job_queue.heartbeat.failed", extra={"error": str(exc)})
+        finally:
+            connection.close()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
@@ -1,61 +1,136 @@
 import logging
-from datetime import timedelta
+from dataclasses import dataclass, field
+from typing import Iterable
 
-from django.db.models import Avg, DurationField, ExpressionWrapper, F
+from django.db import connection, transaction
 from django.utils import timezone
 
-from ingestion.domain.models import Job, JobAuditEvent, JobStatus
+from ingestion.application.audit_writer import get_audit_writer
+from ingestion.application.metrics_service import JobMetricsService, JobTransition
+from ingestion.domain.models import Crawl, Job, JobAuditEvent, JobStatus
+from ingestion.domain.urls import normalize_and_dedupe
 
 logger = logging.getLogger(__name__)
 
+JOB_TABLE = Job._meta.db_table
+
+# One round trip per transition batch: the CTE locks the rows and captures the previous status/completed_at that the
+# metrics rollup needs, so there is no fetch-then-save.
+TRANSITION_SQL = f"""
+WITH previous AS (
+    SELECT id, status, completed_at FROM {JOB_TABLE}
+    WHERE id = ANY(%s)
+    FOR UPDATE
+)
+UPDATE {JOB_TABLE} AS job
+SET status = %s,
+    completed_at = COALESCE(%s, job.completed_at),
+    error_message = COALESCE(%s, job.error_message),
+    updated_at = now()
+FROM previous
+WHERE job.id = previous.id
+RETURNING job.id, job.created_at, previous.status, previous.completed_at, job.completed_at
+"""
+
+
+@dataclass
+class BulkSubmission:
+    job_ids: list[int] = field(default_factory=list)
+    rejected: list[str] = field(default_factory=list)
+    duplicates: int = 0
+
 
 class JobApplicationService:
+    def __init__(self) -> None:
+        self.metrics = JobMetricsService()
+        self.audit = get_audit_writer()
+
     def submit(self, url: str) -> Job:
         job = Job.objects.create(url=url, status=JobStatus.PENDING)
-        JobAuditEvent.objects.create(job=job, stage="submit_job", detail="Job submitted")
+        self.audit.record(job.id, "submit_job", "Job submitted")
+        self.metrics.record_created([job])
         logger.info("job.submitted", extra={"job_id": job.id})
         return job
 
-    def update_status(self, job_id: int, status: str, detail: str = "") -> Job:
-        job = Job.objects.get(id=job_id)
-        job.status = status
-        if status == JobStatus.COMPLETED:
-            job.completed_at = timezone.now()
-        job.save(update_fields=["status", "completed_at"] if status == JobStatus.COMPLETED else ["status"])
-        JobAuditEvent.objects.create(job=job, stage=status, detail=detail)
+    def submit_bulk(
+        self,
+        urls: Iterable[str],
+        batch_size: int = 1000,
+        crawl: Crawl | None = None,
+        depth: int = 0,
+    ) -> BulkSubmission:
+        urls = list(urls)
+        unique, rejected = normalize_and_dedupe(urls)
+        submission = BulkSubmission(rejected=rejected, duplicates=len(urls) - len(unique) - len(rejected))
+        detail = f"Job submitted (crawl #{crawl.id}, depth {depth})" if crawl else "Job submitted (bulk)"
+        for offset in range(0, len(unique), batch_size):
+            jobs = Job.objects.bulk_create(
+                [
+                    Job(url=url, status=JobStatus.PENDING, crawl=crawl, depth=depth)
+                    for url in unique[offset : offset + batch_size]
+                ],
+            )
+            JobAuditEvent.objects.bulk_create(
+                [JobAuditEvent(job_id=job.id, stage="submit_job", detail=detail) for job in jobs],
+            )
+            self.metrics.record_created(jobs)
+            submission.job_ids.extend(job.id for job in jobs)
+        logger.info(
+            "job.bulk_submitted",
+            extra={"succeeded": len(submission.job_ids), "failed": len(submission.rejected)},
+        )
+        return submission
+
+    def transition(
+        self,
+        job_ids: list[int],
+        status: str,
+        error_message: str | None = None,
+        detail: str | None = None,
+    ) -> list[JobTransition]:
+        if not job_ids:
+            return []
+        finished = status in (JobStatus.COMPLETED, JobStatus.FAILED)
+        if status == JobStatus.COMPLETED and error_message is None:
+            error_message = ""
+        # Rollup deltas commit with the status change: a worker killed before its next audit flush may lose audit
+        # rows, but the incremental dashboard counters can never drift from the jobs table.
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(TRANSITION_SQL, [list(job_ids), status, timezone.now() if finished else None, error_message])
+                rows = cursor.fetchall()
+            transitions = [
+                JobTransition(
+                    created_at=created_at,
+                    old_status=old_status,
+                    new_status=status,
+                    old_completed_at=old_completed_at,
+                    new_completed_at=new_completed_at,
+                )
+                for _, created_at, old_status, old_completed_at, new_completed_at in rows
+            ]
+            self.metrics.record_transitions(transitions)
+        if detail is not None:
+            self.audit.record_events([JobAuditEvent(job_id=row[0], stage=status, detail=detail) for row in rows])
+        return transitions
+
+    def update_status(self, job_id: int, status: str, detail: str = "") -> None:
+        self.transition([job_id], status, detail=detail)
         logger.info("job.status.updated", extra={"job_id": job_id})
-        return job
 
-    def fail_job(self, job_id: int, error_message: str) -> Job:
-        job = Job.objects.get(id=job_id)
-        job.mark_failed(error_message)
-        JobAuditEvent.objects.create(job=job, stage="failed", detail=error_message)
+    def fail_job(self, job_id: int, error_message: str) -> None:
+        self.transition([job_id], JobStatus.FAILED, error_message=error_message, detail=error_message)
         logger.error("job.failed", extra={"job_id": job_id, "error": error_message})
-        return job
 
-    def dashboard_metrics(self) -> dict[str, float | int]:
-        total_jobs = Job.objects.count()
-        completed_jobs = Job.objects.filter(status=JobStatus.COMPLETED).count()
-        failed_jobs = Job.objects.filter(status=JobStatus.FAILED).count()
+    def delete_jobs(self, job_ids: Iterable[int]) -> int:
+        with transaction.atomic():
+            jobs = list(
+                Job.objects.select_for_update().filter(id__in=list(job_ids)).only("id", "status", "created_at", "completed_at")
+            )
+            self.metrics.record_deleted(jobs)
+            Job.objects.filter(id__in=[job.id for job in jobs]).delete()
+        logger.info("job.deleted", extra={"succeeded": len(jobs)})
+        return len(jobs)
 
-        avg_expr = ExpressionWrapper(
-            F("completed_at") - F("created_at"),
-            output_field=DurationField(),
-        )
-        avg_duration_raw = (
-            Job.objects.filter(completed_at__isnull=False)
-            .annotate(duration=avg_expr)
-            .aggregate(avg_duration=Avg("duration"))["avg_duration"]
-        )
-        avg_processing_time = 0.0
-        if isinstance(avg_duration_raw, timedelta):
-            avg_processing_time = avg_duration_raw.total_seconds()
-
-        success_rate = round((completed_jobs / total_jobs) * 100, 2) if total_jobs else 0.0
-
-        return {
-            "total_jobs": total_jobs,
-            "success_rate": success_rate,
-            "avg_processing_time": round(avg_processing_time, 2),
-            "failure_count": failed_jobs,
-        }
+    def dashboard_metrics(self) -> dict:
+        return self.metrics.dashboard_metrics()
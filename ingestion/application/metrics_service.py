@@ -0,0 +1,96 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Sum
+from django.utils import timezone
+
+from ingestion.domain.models import Job, JobMetricsRollup, JobStatus
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_CACHE_KEY = "ingestion:dashboard_metrics"
+COUNTER_FIELDS = ("pending", "running", "failed", "completed", "finished_count", "duration_seconds_sum")
+METRIC_WINDOWS = {"last_hour": timedelta(hours=1), "last_day": timedelta(days=1)}
+
+
+@dataclass
+class JobTransition:
+    created_at: datetime
+    old_status: str | None
+    new_status: str | None
+    old_completed_at: datetime | None = None
+    new_completed_at: datetime | None = None
+
+
+def bucket_for(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+class JobMetricsService:
+    def record_created(self, jobs: list[Job]) -> None:
+        self.record_transitions([JobTransition(created_at=job.created_at, old_status=None, new_status=job.status) for job in jobs])
+
+    def record_deleted(self, jobs: list[Job]) -> None:
+        self.record_transitions(
+            [JobTransition(created_at=job.created_at, old_status=job.status, new_status=None, old_completed_at=job.completed_at) for job in jobs]
+        )
+
+    def record_transitions(self, transitions: list[JobTransition]) -> None:
+        deltas: defaultdict[datetime, dict[str, float]] = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+        for transition in transitions:
+            delta = deltas[bucket_for(transition.created_at)]
+            old_status = str(transition.old_status) if transition.old_status else None
+            new_status = str(transition.new_status) if transition.new_status else None
+            if old_status != new_status:
+                if old_status:
+                    delta[old_status] -= 1
+                if new_status:
+                    delta[new_status] += 1
+            if transition.old_completed_at:
+                delta["finished_count"] -= 1
+                delta["duration_seconds_sum"] -= (transition.old_completed_at - transition.created_at).total_seconds()
+            if transition.new_completed_at:
+                delta["finished_count"] += 1
+                delta["duration_seconds_sum"] += (transition.new_completed_at - transition.created_at).total_seconds()
+
+        rows = [(bucket, *(delta[field] for field in COUNTER_FIELDS)) for bucket, delta in deltas.items() if any(delta.values())]
+        if rows:
+            self._upsert(rows)
+
+    def dashboard_metrics(self) -> dict:
+        metrics = cache.get(DASHBOARD_CACHE_KEY)
+        if metrics is None:
+            metrics = self._summarize(JobMetricsRollup.objects.all())
+            current_bucket = bucket_for(timezone.now())
+            for name, window in METRIC_WINDOWS.items():
+                # Rollups are hour-granular: a window is the current bucket plus the whole hours before it.
+                since = current_bucket - window + timedelta(hours=1)
+                metrics[name] = self._summarize(JobMetricsRollup.objects.filter(bucket_start__gte=since))
+            cache.set(DASHBOARD_CACHE_KEY, metrics, settings.DASHBOARD_METRICS_CACHE_TTL)
+        return metrics
+
+    def _summarize(self, rollups) -> dict[str, float | int]:
+        totals = rollups.aggregate(**{field: Sum(field) for field in COUNTER_FIELDS})
+        totals = {field: totals[field] or 0 for field in COUNTER_FIELDS}
+        total_jobs = int(sum(totals[str(status)] for status in JobStatus))
+        finished = totals["finished_count"]
+        return {
+            "total_jobs": total_jobs,
+            "success_rate": round((totals[str(JobStatus.COMPLETED)] / total_jobs) * 100, 2) if total_jobs else 0.0,
+            "avg_processing_time": round(totals["duration_seconds_sum"] / finished, 2) if finished else 0.0,
+            "failure_count": int(totals[str(JobStatus.FAILED)]),
+        }
+
+    def _upsert(self, rows: list[tuple]) -> None:
+        table = JobMetricsRollup._meta.db_table
+        columns = ", ".join(("bucket_start", *COUNTER_FIELDS))
+        increments = ", ".join(f"{field} = {table}.{field} + EXCLUDED.{field}" for field in COUNTER_FIELDS)
+        placeholders = ", ".join(["(" + ", ".join(["%s"] * (len(COUNTER_FIELDS) + 1)) + ")"] * len(rows))
+        sql = f"INSERT INTO {table} ({columns}) VALUES {placeholders} ON CONFLICT (bucket_start) DO UPDATE SET {increments}"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [value for row in sorted(rows) for value in row])
@@ -1,73 +1,514 @@
+import asyncio
+import hashlib
+import json
 import logging
 import time
+from collections import Counter
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, Iterator
 
-from ingestion.domain.models import Job, JobStatus, ScrapedContent, SummaryResult, TranslationResult
-from ingestion.infrastructure.scraper import PlaywrightScraperService
-from ingestion.infrastructure.storage import S3StorageService
-from ingestion.infrastructure.summarization import DummySummarizationService
-from ingestion.infrastructure.translation import DummyTranslationService
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import Subquery, Value
+from django.db.models.functions import Coalesce
+
+from ingestion.application.audit_writer import get_audit_writer
+from ingestion.application.crawl_service import CrawlApplicationService
+from ingestion.application.job_service import JobApplicationService
+from ingestion.domain.models import (
+    ContentChunk,
+    Job,
+    JobStatus,
+    ScrapedContent,
+    SummaryResult,
+    TranslationResult,
+)
+from ingestion.infrastructure.chunking import iter_chunks
+from ingestion.infrastructure.hashing import text_hash
+from ingestion.infrastructure.language_detection import get_language_detector, primary_language
+from ingestion.infrastructure.metrics import host_of, stage_timer
+from ingestion.infrastructure.profiling import span, start_profile_session
+from ingestion.infrastructure.registry import ServiceRegistry, get_service_registry
+from ingestion.infrastructure.scraper import FetchValidators, ScrapeResult
+from ingestion.infrastructure.summary_cache import CachedSummary, SummaryResultCache
+from ingestion.infrastructure.translation_cache import CachedTranslation, TranslationCacheKey
 
 logger = logging.getLogger(__name__)
 
+CHUNK_BATCH_SIZE = 200
+CHUNK_COPY_FIELDS = (
+    "position",
+    "kind",
+    "heading",
+    "start_offset",
+    "end_offset",
+    "text",
+    "text_hash",
+    "language",
+    "translated_text",
+)
+PASSTHROUGH_ENGINE = "passthrough"
+
 
 class RegulatoryPipelineService:
-    def __init__(self) -> None:
-        self.scraper = PlaywrightScraperService()
-        self.storage = S3StorageService()
-        self.translator = DummyTranslationService()
-        self.summarizer = DummySummarizationService()
+    def __init__(self, registry: ServiceRegistry | None = None) -> None:
+        registry = registry or get_service_registry()
+        self.scraper = registry.scraper
+        self.robots = registry.robots
+        self.host_limiter = registry.host_limiter
+        self.async_scraper = registry.async_scraper
+        self.storage = registry.storage
+        self.translator = registry.translator
+        self.translation_cache = registry.translation_cache
+        self.summarizer = registry.map_reduce_summarizer
+        self.summary_cache = registry.summary_cache
+        self.jobs = JobApplicationService()
+        self.audit = get_audit_writer()
+        self.crawls = CrawlApplicationService(registry)
+        self.discovered_job_ids: list[int] = []
+
+    @contextmanager
+    def profiled(self, job_id: int, stage: str, force: bool = False) -> Iterator[None]:
+        session = start_profile_session(f"job-{job_id}-{stage}", force=force)
+        if session is None:
+            yield
+            return
+        try:
+            with session:
+                yield
+        finally:
+            self.audit.record(job_id, f"profile:{stage}", json.dumps(session.report()))
+
+    def run(self, job_id: int, refresh_summary: bool = False) -> int:
+        job = Job.objects.get(id=job_id)
+        try:
+            scraped = self._scrape_job(job, flush_storage=False)
+            translation = self._translate_content(scraped)
+            self._summarize_job(job, scraped, translation, refresh_summary=refresh_summary)
+        finally:
+            self.storage.flush()
+        self._complete_job(job)
+        return job_id
+
+    def throttle_delay(self, job_id: int) -> float:
+        url = Job.objects.values_list("url", flat=True).get(id=job_id)
+        interval = settings.SCRAPER_HOST_MIN_INTERVAL_SECONDS
+        if self.scraper.respect_robots:
+            with span("scrape.robots"):
+                interval = max(interval, self.robots.crawl_delay(url))
+        return self.host_limiter.acquire(host_of(url), interval)
 
     def scrape(self, job_id: int) -> int:
         job = Job.objects.get(id=job_id)
+        self._scrape_job(job)
+        return job_id
+
+    def _scrape_job(self, job: Job, flush_storage: bool = True) -> ScrapedContent:
+        self.jobs.transition([job.id], JobStatus.RUNNING)
         job.status = JobStatus.RUNNING
-        job.save(update_fields=["status"])
         start = time.monotonic()
 
-        scraped = self.scraper.scrape_url(job.url)
-        html_ref = self.storage.upload_html(scraped.raw_html, job_id=job.id)
+        with stage_timer("scrape", host_of(job.url)):
+            with span("db.previous_content"):
+                previous = self._previous_content(job)
+            validators = FetchValidators(etag=previous.etag, last_modified=previous.last_modified) if previous else None
+            if self.crawls.wants_links(job):
+                # A 304 has no body to follow links from.
+                validators = None
+            scraped = self.scraper.scrape_url(job.url, validators=validators)
+            try:
+                with span("pipeline.persist_scrape"):
+                    content = self._persist_scrape(job, scraped, previous)
+            finally:
+                if flush_storage:
+                    self.storage.flush()
+            self.discovered_job_ids.extend(self.crawls.discover(job, scraped.raw_html))
+        logger.info("pipeline.scrape.completed", extra={"job_id": job.id, "duration_seconds": round(time.monotonic() - start, 2)})
+        return content
+
+    def scrape_batch(self, job_ids: list[int]) -> tuple[list[int], dict[int, str]]:
+        jobs = list(Job.objects.filter(id__in=job_ids).order_by("id"))
+        self.jobs.transition([job.id for job in jobs], JobStatus.RUNNING)
+        start = time.monotonic()
+
+        results = asyncio.run(self.async_scraper.scrape_many([job.url for job in jobs]))
+
+        succeeded: list[int] = []
+        failed: dict[int, str] = {}
+        try:
+            for job, result in zip(jobs, results):
+                if isinstance(result, BaseException):
+                    failed[job.id] = str(result) or type(result).__name__
+                    continue
+                # One job's storage or database error must not strand the rest of the batch in RUNNING.
+                try:
+                    self._persist_scrape(job, result, self._previous_content(job))
+                    self.discovered_job_ids.extend(self.crawls.discover(job, result.raw_html))
+                except Exception as exc:
+                    logger.exception("pipeline.scrape_batch.persist_failed", extra={"job_id": job.id})
+                    failed[job.id] = str(exc) or type(exc).__name__
+                    continue
+                succeeded.append(job.id)
+        finally:
+            self.storage.flush()
+        logger.info(
+            "pipeline.scrape_batch.completed",
+            extra={"duration_seconds": round(time.monotonic() - start, 2), "succeeded": len(succeeded), "failed": len(failed)},
+        )
+        return succeeded, failed
+
+    def _previous_content(self, job: Job) -> ScrapedContent | None:
+        return (
+            ScrapedContent.objects.filter(job__url=job.url, job__status=JobStatus.COMPLETED)
+            .exclude(job=job)
+            .exclude(content_hash="")
+            .order_by("-job__completed_at")
+            .first()
+        )
+
+    def _persist_scrape(self, job: Job, scraped: ScrapeResult, previous: ScrapedContent | None) -> ScrapedContent:
+        if previous and (scraped.not_modified or text_hash(scraped.cleaned_text) == previous.content_hash):
+            return self._reuse_scrape(job, previous, scraped)
+        return self._store_scrape(job, scraped)
 
-        ScrapedContent.objects.update_or_create(
+    def _store_scrape(self, job: Job, scraped: ScrapeResult) -> ScrapedContent:
+        artifact = self.storage.upload_html_in_background(scraped.raw_html, job_id=job.id)
+        content, _ = ScrapedContent.objects.update_or_create(
             job=job,
             defaults={
-                "raw_html": html_ref,
+                "raw_html": artifact.uri,
+                "raw_html_sha256": artifact.sha256,
+                "raw_html_size": artifact.size_bytes,
                 "cleaned_text": scraped.cleaned_text,
                 "detected_language": scraped.detected_language,
+                "fetch_mode": scraped.fetch_mode,
+                "fetch_reason": scraped.fetch_reason,
+                "etag": scraped.etag,
+                "last_modified": scraped.last_modified,
+                "content_hash": text_hash(scraped.cleaned_text),
+                "load_ms": scraped.load_ms,
+                "bytes_transferred": scraped.bytes_transferred,
+                "blocked_requests": scraped.blocked_requests,
+                "reused_from": None,
             },
         )
-        logger.info("pipeline.scrape.completed", extra={"job_id": job_id, "duration_seconds": round(time.monotonic() - start, 2)})
-        return job_id
+        content.job = job
+        with span("db.chunks_write"):
+            language = self._write_chunks(content, scraped.cleaned_text)
+        # The page's lang attribute is only a fallback when the text itself is inconclusive.
+        if language != "unknown" and language != content.detected_language:
+            content.detected_language = language
+            ScrapedContent.objects.filter(id=content.id).update(detected_language=language)
+        return content
+
+    def _reuse_scrape(self, job: Job, previous: ScrapedContent, scraped: ScrapeResult) -> ScrapedContent:
+        content, _ = ScrapedContent.objects.update_or_create(
+            job=job,
+            defaults={
+                "raw_html": previous.raw_html,
+                "raw_html_sha256": previous.raw_html_sha256,
+                "raw_html_size": previous.raw_html_size,
+                "cleaned_text": previous.cleaned_text,
+                "detected_language": previous.detected_language,
+                "fetch_mode": scraped.fetch_mode,
+                "fetch_reason": "not_modified" if scraped.not_modified else "content_unchanged",
+                "etag": scraped.etag or previous.etag,
+                "last_modified": scraped.last_modified or previous.last_modified,
+                "content_hash": previous.content_hash,
+                "load_ms": scraped.load_ms,
+                "bytes_transferred": scraped.bytes_transferred,
+                "blocked_requests": scraped.blocked_requests,
+                "reused_from": previous.job,
+            },
+        )
+        content.job = job
+        with span("db.chunks_write"):
+            self._copy_chunks(content, previous)
+        self.audit.record(job.id, "not_modified", f"Content unchanged since job #{previous.job_id}; reusing its results")
+        logger.info("pipeline.scrape.not_modified", extra={"job_id": job.id})
+        return content
+
+    def _write_chunks(self, content: ScrapedContent, text: str) -> str:
+        ContentChunk.objects.filter(content=content).delete()
+        detector = get_language_detector()
+        weights: Counter[str] = Counter()
+
+        def rows() -> Iterator[ContentChunk]:
+            for chunk in iter_chunks(text, max_chars=settings.CONTENT_CHUNK_MAX_CHARS):
+                language = detector.detect(chunk.text).language
+                if language != "unknown":
+                    weights[language] += len(chunk.text)
+                yield ContentChunk(
+                    content=content,
+                    position=chunk.position,
+                    kind=chunk.kind,
+                    heading=chunk.heading[:256],
+                    start_offset=chunk.start_offset,
+                    end_offset=chunk.end_offset,
+                    text=chunk.text,
+                    text_hash=chunk.text_hash,
+                    language=language,
+                )
+
+        with span("language.detect"):
+            self._bulk_create_chunks(rows())
+        return weights.most_common(1)[0][0] if weights else "unknown"
+
+    def _copy_chunks(self, content: ScrapedContent, source: ScrapedContent) -> None:
+        ContentChunk.objects.filter(content=content).delete()
+        source_chunks = self._chunk_queryset(source).values(*CHUNK_COPY_FIELDS).iterator(chunk_size=CHUNK_BATCH_SIZE)
+        self._bulk_create_chunks(ContentChunk(content=content, **row) for row in source_chunks)
+
+    def _bulk_create_chunks(self, rows: Iterable[ContentChunk]) -> None:
+        rows = iter(rows)
+        while batch := list(islice(rows, CHUNK_BATCH_SIZE)):
+            ContentChunk.objects.bulk_create(batch)
+
+    def _chunk_queryset(self, content: ScrapedContent):
+        chunks = ContentChunk.objects.filter(content=content).order_by("position")
+        if not chunks.exists() and content.cleaned_text:
+            # Content scraped before chunking existed is chunked on first use.
+            self._write_chunks(content, content.cleaned_text)
+        return chunks
 
     def translate(self, job_id: int) -> int:
-        scraped = ScrapedContent.objects.select_related("job").get(job_id=job_id)
+        scraped = ScrapedContent.objects.select_related("job").defer("cleaned_text").get(job_id=job_id)
+        self._translate_content(scraped)
+        return job_id
+
+    def _translate_content(self, scraped: ScrapedContent) -> TranslationResult:
         start = time.monotonic()
-        translated = self.translator.translate(scraped.cleaned_text, scraped.detected_language)
-        TranslationResult.objects.create(
-            job=scraped.job,
-            translated_text=translated.translated_text,
-            translation_engine=translated.engine,
-        )
-        logger.info("pipeline.translate.completed", extra={"job_id": job_id, "duration_seconds": round(time.monotonic() - start, 2)})
+        with stage_timer("translate", host_of(scraped.job.url)):
+            reusable = self._reusable_translation(scraped)
+            if reusable:
+                translation = TranslationResult.objects.create(
+                    job=scraped.job,
+                    translated_text=reusable.translated_text,
+                    translation_engine=reusable.translation_engine,
+                    translator=reusable.translator,
+                    target_language=reusable.target_language,
+                    chunk_count=reusable.chunk_count,
+                    cache_hits=reusable.chunk_count,
+                    reused=True,
+                )
+                logger.info(
+                    "pipeline.translate.reused",
+                    extra={"job_id": scraped.job_id, "duration_seconds": round(time.monotonic() - start, 2)},
+                )
+                return translation
+
+            engine, chunk_count, cache_hits = self._translate_chunks(scraped)
+            with span("db.translation_write"):
+                translation = TranslationResult.objects.create(
+                    job=scraped.job,
+                    translated_text="",
+                    translation_engine=engine,
+                    translator=self.translator.name,
+                    target_language=settings.TRANSLATION_TARGET_LANGUAGE,
+                    chunk_count=chunk_count,
+                    cache_hits=cache_hits,
+                )
+                # Stitch the chunk translations in the database so the full text never passes through the worker.
+                stitched = (
+                    ContentChunk.objects.filter(content_id=scraped.id)
+                    .values("content_id")
+                    .annotate(text=StringAgg("translated_text", delimiter="\n", ordering="position"))
+                    .values("text")
+                )
+                TranslationResult.objects.filter(id=translation.id).update(
+                    translated_text=Coalesce(Subquery(stitched), Value(""))
+                )
+            logger.info(
+                "pipeline.translate.completed",
+                extra={
+                    "job_id": scraped.job_id,
+                    "duration_seconds": round(time.monotonic() - start, 2),
+                    "chunk_count": chunk_count,
+                    "cache_hits": cache_hits,
+                },
+            )
+            return translation
+
+    def _translate_chunks(self, scraped: ScrapedContent) -> tuple[str, int, int]:
+        engine = ""
+        chunk_count = cache_hits = 0
+        chunks = self._chunk_queryset(scraped).only("id", "text", "text_hash", "language").iterator(chunk_size=CHUNK_BATCH_SIZE)
+        while batch := list(islice(chunks, CHUNK_BATCH_SIZE)):
+            batch_engine, batch_hits = self._translate_chunk_batch(batch, scraped.detected_language)
+            ContentChunk.objects.bulk_update(batch, ["translated_text"])
+            engine = batch_engine or engine
+            chunk_count += len(batch)
+            cache_hits += batch_hits
+        return engine or PASSTHROUGH_ENGINE, chunk_count, cache_hits
+
+    def _translate_chunk_batch(self, chunks: list[ContentChunk], document_language: str) -> tuple[str, int]:
+        target_language = settings.TRANSLATION_TARGET_LANGUAGE
+        # Chunks already in the target language are copied through; mixed documents only translate the rest.
+        pending: list[tuple[ContentChunk, TranslationCacheKey]] = []
+        for chunk in chunks:
+            source_language = chunk.language if chunk.language not in ("", "unknown") else primary_language(document_language)
+            if source_language == primary_language(target_language):
+                chunk.translated_text = chunk.text
+            else:
+                pending.append((chunk, TranslationCacheKey(chunk.text_hash, source_language, target_language, self.translator.name)))
+        if not pending:
+            return "", 0
+
+        with span("translate.cache_lookup"):
+            cached = self.translation_cache.get_many(list({key for _, key in pending})) if self.translation_cache else {}
+
+        # Only misses reach the provider; repeated chunks within the batch are translated once.
+        misses: dict[TranslationCacheKey, str] = {}
+        for chunk, key in pending:
+            if key not in cached and key not in misses:
+                misses[key] = chunk.text
+        by_language: dict[str, list[TranslationCacheKey]] = {}
+        for key in misses:
+            by_language.setdefault(key.source_language, []).append(key)
+        fresh: dict[TranslationCacheKey, CachedTranslation] = {}
+        for source_language, keys in by_language.items():
+            with span("translate.provider"):
+                responses = self.translator.translate_many([misses[key] for key in keys], source_language, target_language)
+            for key, response in zip(keys, responses):
+                fresh[key] = CachedTranslation(translated_text=response.translated_text, engine=response.engine)
+
+        engine = ""
+        for chunk, key in pending:
+            entry = cached.get(key) or fresh[key]
+            chunk.translated_text = entry.translated_text
+            engine = entry.engine
+        hits = len(pending) - len(misses)
+        if fresh and self.translation_cache:
+            with span("translate.cache_store"):
+                self.translation_cache.set_many(fresh)
+        return engine, hits
+
+    def summarize(self, job_id: int, refresh_summary: bool = False) -> int:
+        job = Job.objects.select_related("scraped_content").defer("scraped_content__cleaned_text").get(id=job_id)
+        latest_translation = job.translations.defer("translated_text").order_by("-timestamp").first()
+        self._summarize_job(job, job.scraped_content, latest_translation, refresh_summary=refresh_summary)
         return job_id
 
-    def summarize(self, job_id: int) -> int:
-        job = Job.objects.get(id=job_id)
-        latest_translation = job.translations.order_by("-timestamp").first()
-        source_text = latest_translation.translated_text if latest_translation else job.scraped_content.cleaned_text
+    def _summarize_job(
+        self,
+        job: Job,
+        scraped: ScrapedContent,
+        translation: TranslationResult | None,
+        refresh_summary: bool = False,
+    ) -> SummaryResult:
+        job_id = job.id
         start = time.monotonic()
-        summary = self.summarizer.summarize(source_text)
-        SummaryResult.objects.create(
-            job=job,
-            summary_text=summary.summary_text,
-            model_name=summary.model_name,
-            prompt_version=summary.prompt_version,
-            temperature=summary.temperature,
-            token_usage=summary.token_usage,
+        with stage_timer("summarize", host_of(job.url)):
+            source_hash = self._summary_source_hash(scraped, translation)
+            reusable = None if refresh_summary else self._reusable_summary(scraped, source_hash)
+            if reusable:
+                summary_result = SummaryResult.objects.create(
+                    job=job,
+                    summary_text=reusable.summary_text,
+                    model_name=reusable.model_name,
+                    prompt_version=reusable.prompt_version,
+                    temperature=reusable.temperature,
+                    token_usage=0,
+                    source_hash=source_hash,
+                    reused=True,
+                )
+                logger.info("pipeline.summarize.reused", extra={"job_id": job_id, "duration_seconds": round(time.monotonic() - start, 2)})
+                return summary_result
+
+            with span("summarize.cache_lookup"):
+                cache_key = SummaryResultCache.key(
+                    source_hash, self.summarizer.model_name, self.summarizer.prompt_version, self.summarizer.temperature
+                )
+                cached = self.summary_cache.get(cache_key) if self.summary_cache and not refresh_summary else None
+            if cached:
+                summary_result = SummaryResult.objects.create(
+                    job=job,
+                    summary_text=cached.summary_text,
+                    model_name=self.summarizer.model_name,
+                    prompt_version=self.summarizer.prompt_version,
+                    temperature=self.summarizer.temperature,
+                    token_usage=0,
+                    source_hash=source_hash,
+                    cached=True,
+                )
+                logger.info("pipeline.summarize.cached", extra={"job_id": job_id, "duration_seconds": round(time.monotonic() - start, 2)})
+                return summary_result
+
+            with span("summarize.provider"):
+                summary = self.summarizer.summarize(self._summary_source(scraped, translation))
+            with span("db.summary_write"):
+                summary_result = SummaryResult.objects.create(
+                    job=job,
+                    summary_text=summary.summary_text,
+                    model_name=summary.model_name,
+                    prompt_version=summary.prompt_version,
+                    temperature=summary.temperature,
+                    token_usage=summary.token_usage,
+                    source_hash=source_hash,
+                )
+            if self.summary_cache:
+                self.summary_cache.set(cache_key, CachedSummary(summary_text=summary.summary_text, token_usage=summary.token_usage))
+            logger.info("pipeline.summarize.completed", extra={"job_id": job_id, "duration_seconds": round(time.monotonic() - start, 2)})
+            return summary_result
+
+    def _summary_source_hash(self, scraped: ScrapedContent, translation: TranslationResult | None) -> str:
+        # A chunk's translation is determined by its source hash, engine and target language (the translation cache
+        # relies on the same), so hashing the stored chunk hashes identifies the input without reading any chunk text.
+        digest = hashlib.sha256()
+        if translation is not None:
+            digest.update(f"{translation.translation_engine}:{settings.TRANSLATION_TARGET_LANGUAGE}:".encode("utf-8"))
+        hashes = self._chunk_queryset(scraped).values_list("text_hash", flat=True).iterator(chunk_size=CHUNK_BATCH_SIZE)
+        for chunk_hash in hashes:
+            digest.update(chunk_hash.encode("ascii"))
+        return digest.hexdigest()
+
+    def _summary_source(self, scraped: ScrapedContent, translation: TranslationResult | None) -> Iterator[str]:
+        chunks = self._chunk_queryset(scraped)
+        if translation is None:
+            return chunks.values_list("text", flat=True).iterator(chunk_size=CHUNK_BATCH_SIZE)
+        if chunks.filter(translated_text="").exists():
+            # Translations made before chunking only exist as one stitched text.
+            return iter([translation.translated_text])
+        return chunks.values_list("translated_text", flat=True).iterator(chunk_size=CHUNK_BATCH_SIZE)
+
+    def _reusable_translation(self, scraped: ScrapedContent) -> TranslationResult | None:
+        # Unchanged content only carries over output made with the current configuration; rows from before the
+        # translator and target language were recorded never match.
+        if not scraped.reused_from_id:
+            return None
+        return (
+            TranslationResult.objects.filter(
+                job_id=scraped.reused_from_id,
+                translator=self.translator.name,
+                target_language=settings.TRANSLATION_TARGET_LANGUAGE,
+            )
+            .order_by("-timestamp")
+            .first()
+        )
+
+    def _reusable_summary(self, scraped: ScrapedContent, source_hash: str) -> SummaryResult | None:
+        if not scraped.reused_from_id:
+            return None
+        return (
+            SummaryResult.objects.filter(
+                job_id=scraped.reused_from_id,
+                source_hash=source_hash,
+                model_name=self.summarizer.model_name,
+                prompt_version=self.summarizer.prompt_version,
+                temperature=self.summarizer.temperature,
+            )
+            .order_by("-timestamp")
+            .first()
         )
-        logger.info("pipeline.summarize.completed", extra={"job_id": job_id, "duration_seconds": round(time.monotonic() - start, 2)})
-        return job_id
 
     def complete(self, job_id: int) -> int:
-        job = Job.objects.get(id=job_id)
-        job.mark_completed()
-        logger.info("pipeline.complete", extra={"job_id": job_id})
+        job = Job.objects.only("id", "url").get(id=job_id)
+        self._complete_job(job)
         return job_id
+
+    def _complete_job(self, job: Job) -> None:
+        with stage_timer("complete", host_of(job.url)):
+            with span("db.complete"):
+                self.jobs.transition([job.id], JobStatus.COMPLETED)
+        logger.info("pipeline.complete", extra={"job_id": job.id})
@@ -0,0 +1,56 @@
+import csv
+import json
+from typing import Iterable, Iterator
+
+SUPPORTED_FORMATS = ("txt", "jsonl", "csv")
+
+
+class UrlSourceError(ValueError):
+    pass
+
+
+def detect_format(filename: str) -> str:
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else "txt"
+    return extension if extension in SUPPORTED_FORMATS else "txt"
+
+
+def iter_urls(lines: Iterable[str], fmt: str = "txt") -> Iterator[str]:
+    if fmt == "csv":
+        yield from _iter_csv(lines)
+        return
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if fmt == "jsonl":
+            yield _jsonl_url(line, number)
+        else:
+            yield line
+
+
+def _jsonl_url(line: str, number: int) -> str:
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise UrlSourceError(f"Line {number}: invalid JSON ({exc.msg})") from exc
+    url = record.get("url") if isinstance(record, dict) else record
+    if not isinstance(url, str) or not url.strip():
+        raise UrlSourceError(f"Line {number}: expected a non-empty string 'url'")
+    return url.strip()
+
+
+def _iter_csv(lines: Iterable[str]) -> Iterator[str]:
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    lowered = [column.strip().lower() for column in header]
+    if "url" in lowered:
+        column = lowered.index("url")
+    else:
+        column = 0
+        if header and header[0].strip():
+            yield header[0].strip()
+    for row in reader:
+        if len(row) > column and row[column].strip():
+            yield row[column].strip()
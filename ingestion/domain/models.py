@@ -1,3 +1,5 @@
+from urllib.parse import urlsplit
+
 from django.db import models
 from django.utils import timezone
 
@@ -9,44 +11,124 @@ class JobStatus(models.TextChoices):
     COMPLETED = "completed", "Completed"
 
 
+class Crawl(models.Model):
+    seed_url = models.URLField(max_length=2048)
+    sitemap = models.BooleanField(default=False, help_text="Seed URL is a sitemap or sitemap index")
+    same_host = models.BooleanField(default=True)
+    path_prefix = models.CharField(max_length=512, blank=True)
+    max_depth = models.PositiveSmallIntegerField(default=2, help_text="Link hops followed from seed pages")
+    max_pages = models.PositiveIntegerField(default=5000)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def allows(self, url: str) -> bool:
+        parts = urlsplit(url)
+        if self.same_host and parts.hostname != urlsplit(self.seed_url).hostname:
+            return False
+        return parts.path.startswith(self.path_prefix or "/")
+
+
 class Job(models.Model):
     url = models.URLField(max_length=2048)
     status = models.CharField(max_length=20, choices=JobStatus.choices, default=JobStatus.PENDING, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     error_message = models.TextField(blank=True)
+    crawl = models.ForeignKey(Crawl, null=True, blank=True, on_delete=models.SET_NULL, related_name="jobs")
+    depth = models.PositiveSmallIntegerField(default=0)
+    lease_owner = models.CharField(max_length=255, blank=True, help_text="Queue worker holding the job")
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
 
     class Meta:
         indexes = [
             models.Index(fields=["status", "created_at"], name="idx_job_status_created"),
+            models.Index(fields=["url", "status"], name="idx_job_url_status"),
+            models.Index(
+                fields=["lease_expires_at"],
+                name="idx_job_running_lease",
+                condition=models.Q(status="running"),
+            ),
         ]
 
-    def mark_completed(self) -> None:
-        self.status = JobStatus.COMPLETED
-        self.completed_at = timezone.now()
-        self.error_message = ""
-        self.save(update_fields=["status", "completed_at", "error_message"])
-
-    def mark_failed(self, error_message: str) -> None:
-        self.status = JobStatus.FAILED
-        self.error_message = error_message
-        self.completed_at = timezone.now()
-        self.save(update_fields=["status", "error_message", "completed_at"])
-
 
 class ScrapedContent(models.Model):
     job = models.OneToOneField(Job, on_delete=models.CASCADE, related_name="scraped_content")
     raw_html = models.CharField(max_length=1024, help_text="S3 object reference")
+    raw_html_sha256 = models.CharField(max_length=64, blank=True, db_index=True)
+    raw_html_size = models.PositiveIntegerField(default=0)
     cleaned_text = models.TextField()
     detected_language = models.CharField(max_length=32, default="unknown")
+    fetch_mode = models.CharField(max_length=16, default="browser")
+    fetch_reason = models.CharField(max_length=128, blank=True)
+    etag = models.CharField(max_length=256, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    load_ms = models.PositiveIntegerField(default=0, help_text="Browser navigation plus readiness wait")
+    bytes_transferred = models.PositiveBigIntegerField(default=0)
+    blocked_requests = models.PositiveIntegerField(default=0)
+    reused_from = models.ForeignKey(
+        Job,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        help_text="Earlier job whose unchanged content and results were reused",
+    )
+
+
+class ContentChunk(models.Model):
+    content = models.ForeignKey(ScrapedContent, on_delete=models.CASCADE, related_name="chunks")
+    position = models.PositiveIntegerField()
+    kind = models.CharField(max_length=16, default="text")
+    heading = models.CharField(max_length=256, blank=True)
+    start_offset = models.PositiveIntegerField(help_text="Offset into ScrapedContent.cleaned_text")
+    end_offset = models.PositiveIntegerField()
+    text = models.TextField()
+    text_hash = models.CharField(max_length=64, db_index=True)
+    language = models.CharField(max_length=16, blank=True)
+    translated_text = models.TextField(blank=True)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["content", "position"], name="uniq_chunk_position")]
+        ordering = ["position"]
 
 
 class TranslationResult(models.Model):
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="translations")
     translated_text = models.TextField()
     translation_engine = models.CharField(max_length=128)
+    translator = models.CharField(max_length=128, blank=True, help_text="Configured translation service")
+    target_language = models.CharField(max_length=32, blank=True)
+    chunk_count = models.PositiveIntegerField(default=0)
+    cache_hits = models.PositiveIntegerField(default=0)
+    reused = models.BooleanField(default=False, help_text="Copied from the job whose content was unchanged")
     timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
 
+    @property
+    def cache_hit_rate(self) -> float:
+        return self.cache_hits / self.chunk_count if self.chunk_count else 0.0
+
+
+class TranslationCacheEntry(models.Model):
+    text_hash = models.CharField(max_length=64)
+    source_language = models.CharField(max_length=32)
+    target_language = models.CharField(max_length=32)
+    engine = models.CharField(max_length=128, help_text="Translation service that produced the entry")
+    translated_text = models.TextField()
+    response_engine = models.CharField(max_length=128)
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["text_hash", "source_language", "target_language", "engine"],
+                name="uniq_translation_cache_key",
+            )
+        ]
+
 
 class SummaryResult(models.Model):
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="summaries")
@@ -55,6 +137,9 @@ class SummaryResult(models.Model):
     prompt_version = models.CharField(max_length=64)
     temperature = models.FloatField(default=0.2)
     token_usage = models.PositiveIntegerField(default=0)
+    source_hash = models.CharField(max_length=64, blank=True, help_text="Hash of the summarized input text")
+    cached = models.BooleanField(default=False, help_text="Served from the summary result cache")
+    reused = models.BooleanField(default=False, help_text="Copied from the job whose content was unchanged")
     timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
 
 
@@ -66,3 +151,13 @@ class JobAuditEvent(models.Model):
 
     class Meta:
         indexes = [models.Index(fields=["job", "stage", "created_at"], name="idx_job_audit_stage")]
+
+
+class JobMetricsRollup(models.Model):
+    bucket_start = models.DateTimeField(unique=True, help_text="Hour in which the counted jobs were created")
+    pending = models.IntegerField(default=0)
+    running = models.IntegerField(default=0)
+    failed = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    finished_count = models.IntegerField(default=0)
+    duration_seconds_sum = models.FloatField(default=0.0)
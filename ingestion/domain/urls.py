@@ -0,0 +1,35 @@
+from urllib.parse import urlsplit, urlunsplit
+
+MAX_URL_LENGTH = 2048
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        raise ValueError(f"Unsupported URL: {url}")
+
+    netloc = parts.hostname.lower()
+    if parts.port and parts.port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{parts.port}"
+    normalized = urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+    if len(normalized) > MAX_URL_LENGTH:
+        raise ValueError(f"URL exceeds {MAX_URL_LENGTH} characters: {url[:80]}")
+    return normalized
+
+
+def normalize_and_dedupe(urls) -> tuple[list[str], list[str]]:
+    seen: set[str] = set()
+    unique: list[str] = []
+    rejected: list[str] = []
+    for url in urls:
+        try:
+            normalized = normalize_url(url)
+        except ValueError:
+            rejected.append(url)
+            continue
+        if normalized not in seen:
+            seen.add(normalized)
+            unique.append(normalized)
+    return unique, rejected
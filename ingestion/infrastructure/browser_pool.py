@@ -0,0 +1,137 @@
+import atexit
+import logging
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+from django.conf import settings
+from playwright.sync_api import Browser, Page, Playwright, sync_playwright
+from playwright.sync_api import Error as PlaywrightError
+
+from ingestion.infrastructure.profiling import span
+
+logger = logging.getLogger(__name__)
+
+HEAP_PROBE_SCRIPT = "() => (performance.memory && performance.memory.usedJSHeapSize) || 0"
+
+
+@dataclass
+class BrowserSlot:
+    browser: Browser
+    pages_served: int = 0
+    peak_heap_bytes: int = 0
+
+
+class BrowserPool:
+    def __init__(self, size: int = 1, max_pages_per_browser: int = 100, max_heap_mb: int = 512) -> None:
+        self.size = max(1, size)
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_heap_bytes = max_heap_mb * 1024 * 1024
+        self._playwright: Playwright | None = None
+        self._slots: list[BrowserSlot | None] = [None] * self.size
+        self._next_slot = 0
+        self._pid = os.getpid()
+
+    @contextmanager
+    def page(self) -> Iterator[Page]:
+        with span("browser_pool.checkout"):
+            index, slot = self._checkout()
+            context = slot.browser.new_context()
+            page = context.new_page()
+        try:
+            yield page
+            slot.peak_heap_bytes = max(slot.peak_heap_bytes, self._probe_heap(page))
+        finally:
+            slot.pages_served += 1
+            try:
+                context.close()
+            except PlaywrightError:
+                pass
+            self._checkin(index, slot)
+
+    def close(self) -> None:
+        if self._pid != os.getpid():
+            self._forget()
+            return
+        for index, slot in enumerate(self._slots):
+            if slot is not None:
+                self._close_browser(slot)
+                self._slots[index] = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def _checkout(self) -> tuple[int, BrowserSlot]:
+        if self._pid != os.getpid():
+            self._forget()
+        index = self._next_slot
+        self._next_slot = (self._next_slot + 1) % self.size
+        slot = self._slots[index]
+        if slot is None or not slot.browser.is_connected():
+            if slot is not None:
+                logger.warning("browser_pool.browser.crashed", extra={"browser_slot": index})
+            slot = BrowserSlot(browser=self._launch())
+            self._slots[index] = slot
+        return index, slot
+
+    def _checkin(self, index: int, slot: BrowserSlot) -> None:
+        if slot.pages_served >= self.max_pages_per_browser:
+            reason = "max_pages"
+        elif slot.peak_heap_bytes >= self.max_heap_bytes:
+            reason = "max_heap"
+        elif not slot.browser.is_connected():
+            reason = "disconnected"
+        else:
+            return
+        logger.info("browser_pool.browser.recycled", extra={"browser_slot": index, "reason": reason})
+        self._close_browser(slot)
+        self._slots[index] = None
+
+    def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        return self._playwright.chromium.launch(headless=True)
+
+    def _probe_heap(self, page: Page) -> int:
+        try:
+            return int(page.evaluate(HEAP_PROBE_SCRIPT))
+        except PlaywrightError:
+            return 0
+
+    def _close_browser(self, slot: BrowserSlot) -> None:
+        try:
+            slot.browser.close()
+        except PlaywrightError:
+            pass
+
+    def _forget(self) -> None:
+        # Playwright handles inherited across fork belong to the parent's driver process.
+        self._playwright = None
+        self._slots = [None] * self.size
+        self._next_slot = 0
+        self._pid = os.getpid()
+
+
+_pool: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool:
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool(
+            size=settings.SCRAPER_BROWSER_POOL_SIZE,
+            max_pages_per_browser=settings.SCRAPER_BROWSER_MAX_PAGES,
+            max_heap_mb=settings.SCRAPER_BROWSER_MAX_HEAP_MB,
+        )
+    return _pool
+
+
+def close_browser_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+
+atexit.register(close_browser_pool)
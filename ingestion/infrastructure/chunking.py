@@ -0,0 +1,68 @@
+import re
+from dataclasses import dataclass
+from typing import Iterator
+
+from ingestion.infrastructure.hashing import text_hash
+
+LINE_PATTERN = re.compile(r"\S(?:[^\n]*\S)?")
+HEADING_PATTERN = re.compile(
+    r"(?:article|artikel|articolo|art[ií]culo|art\.|section|secci[oó]n|chapter|chapitre|kapitel|cap[ií]tulo|"
+    r"title|titre|titel|part|annex|annexe|anhang|anexo|schedule|appendix|§)\s*[\dIVXLC]+\b",
+    re.IGNORECASE,
+)
+MAX_HEADING_CHARS = 200
+
+
+@dataclass
+class TextChunk:
+    position: int
+    kind: str
+    heading: str
+    start_offset: int
+    end_offset: int
+    text: str
+    text_hash: str
+
+
+def _line_spans(text: str, max_chars: int) -> Iterator[tuple[int, int]]:
+    for match in LINE_PATTERN.finditer(text):
+        start, end = match.span()
+        while end - start > max_chars:
+            cut = text.rfind(" ", start + 1, start + max_chars)
+            if cut == -1:
+                cut = start + max_chars
+            yield start, cut
+            start = cut
+            while start < end and text[start].isspace():
+                start += 1
+        yield start, end
+
+
+def iter_chunks(text: str, max_chars: int = 4000) -> Iterator[TextChunk]:
+    # Chunks are exact slices of the text, so offsets stay valid against cleaned_text.
+    position = 0
+    heading = ""
+    chunk_start: int | None = None
+    chunk_end = 0
+    chunk_kind = "text"
+    chunk_heading = ""
+
+    for line_start, line_end in _line_spans(text, max_chars):
+        line = text[line_start:line_end]
+        is_heading = len(line) <= MAX_HEADING_CHARS and HEADING_PATTERN.match(line) is not None
+        if chunk_start is not None and (is_heading or line_end - chunk_start > max_chars):
+            body = text[chunk_start:chunk_end]
+            yield TextChunk(position, chunk_kind, chunk_heading, chunk_start, chunk_end, body, text_hash(body))
+            position += 1
+            chunk_start = None
+        if is_heading:
+            heading = line
+        if chunk_start is None:
+            chunk_start = line_start
+            chunk_kind = "section" if is_heading else "text"
+            chunk_heading = heading
+        chunk_end = line_end
+
+    if chunk_start is not None:
+        body = text[chunk_start:chunk_end]
+        yield TextChunk(position, chunk_kind, chunk_heading, chunk_start, chunk_end, body, text_hash(body))
@@ -0,0 +1,52 @@
+import hashlib
+
+from ingestion.infrastructure.redis_client import get_redis
+
+# Adds each URL digest to the crawl's seen-set and returns the (0-based) indexes of the ones that were new,
+# stopping once the set holds `limit` members. Running it server-side makes claim-and-cap atomic across workers.
+CLAIM_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local count = redis.call('SCARD', KEYS[1])
+local accepted = {}
+for i = 3, #ARGV do
+    if limit > 0 and count >= limit then
+        break
+    end
+    if redis.call('SADD', KEYS[1], ARGV[i]) == 1 then
+        count = count + 1
+        accepted[#accepted + 1] = i - 3
+    end
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+return accepted
+"""
+
+
+def url_digest(url: str) -> bytes:
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+
+
+class CrawlFrontier:
+    def __init__(self, ttl_seconds: int = 7 * 24 * 3600) -> None:
+        self.ttl_seconds = ttl_seconds
+
+    def claim(self, crawl_id: int, urls: list[str], limit: int = 0) -> list[str]:
+        return self._claim(f"crawl:{crawl_id}:pages", urls, limit)
+
+    def claim_sitemaps(self, crawl_id: int, urls: list[str]) -> list[str]:
+        return self._claim(f"crawl:{crawl_id}:sitemaps", urls, 0)
+
+    def release(self, crawl_id: int, urls: list[str]) -> None:
+        if urls:
+            get_redis().srem(f"crawl:{crawl_id}:pages", *(url_digest(url) for url in urls))
+
+    def size(self, crawl_id: int) -> int:
+        return get_redis().scard(f"crawl:{crawl_id}:pages")
+
+    def _claim(self, key: str, urls: list[str], limit: int) -> list[str]:
+        if not urls:
+            return []
+        script = get_redis().register_script(CLAIM_SCRIPT)
+        accepted = script(keys=[key], args=[self.ttl_seconds, limit, *(url_digest(url) for url in urls)])
+        return [urls[index] for index in accepted]
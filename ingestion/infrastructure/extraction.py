@@ -0,0 +1,217 @@
+import re
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+from typing import Iterable, Iterator
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+BOILERPLATE_TAGS = ("script", "style", "noscript", "svg", "header", "footer", "nav", "form")
+# bs4 keeps these subtrees (so a main inside a template is still found) but get_text() skips their strings.
+NON_TEXT_TAGS = ("template", "rt", "rp")
+# Elements html.parser-based bs4 never pushes onto its open-element stack.
+VOID_TAGS = frozenset(
+    (
+        "area", "base", "basefont", "bgsound", "br", "col", "command", "embed", "frame", "hr", "image", "img",
+        "input", "isindex", "keygen", "link", "menuitem", "meta", "nextid", "param", "source", "spacer", "track",
+        "wbr",
+    )
+)
+BLANK_LINES_PATTERN = re.compile(r"\n{2,}")
+BODY_TAG_PATTERN = re.compile(r"<body[\s/>]", re.IGNORECASE)
+STREAM_CHUNK_CHARS = 64 * 1024
+
+
+def _finalize(segments: Iterable[str]) -> str:
+    return BLANK_LINES_PATTERN.sub("\n\n", "\n".join(segments)).strip()
+
+
+def iter_html_chunks(html: str, chunk_chars: int = STREAM_CHUNK_CHARS) -> Iterator[str]:
+    for offset in range(0, len(html), chunk_chars):
+        yield html[offset : offset + chunk_chars]
+
+
+class TextExtractor(ABC):
+    name: str
+
+    @abstractmethod
+    def extract(self, html: str) -> str:
+        raise NotImplementedError
+
+
+class BeautifulSoupTextExtractor(TextExtractor):
+    name = "bs4"
+
+    def __init__(self, parser: str = "html.parser") -> None:
+        self.parser = parser
+
+    def extract(self, html: str) -> str:
+        soup = BeautifulSoup(html, self.parser)
+        for tag in soup(list(BOILERPLATE_TAGS)):
+            tag.decompose()
+        main = soup.find("main") or soup.find("article") or soup.body or soup
+        return _finalize([main.get_text(separator="\n", strip=True)])
+
+
+class LxmlTextExtractor(TextExtractor):
+    name = "lxml"
+
+    def __init__(self) -> None:
+        if lxml is None:
+            raise ImproperlyConfigured("The lxml text extractor requires the lxml package")
+
+    def extract(self, html: str) -> str:
+        if not html.strip():
+            return ""
+        try:
+            document = lxml.html.document_fromstring(html)
+        except etree.ParserError:
+            return ""
+        etree.strip_elements(document, *BOILERPLATE_TAGS, with_tail=False)
+        root = document.find(".//main")
+        if root is None:
+            root = document.find(".//article")
+        if root is None and BODY_TAG_PATTERN.search(html):
+            # libxml2 always synthesizes a body; bs4 only has one when the markup does.
+            root = document.find("body")
+        if root is None:
+            root = document
+        if any(ancestor.tag in NON_TEXT_TAGS for ancestor in root.iterancestors()):
+            return ""
+        etree.strip_elements(root, *NON_TEXT_TAGS, with_tail=False)
+        return _finalize(self._iter_strings(root))
+
+    def _iter_strings(self, root) -> Iterator[str]:
+        for element in root.iter():
+            # Comments and processing instructions keep their tail text but not their own.
+            if isinstance(element.tag, str) and element.text:
+                text = element.text.strip()
+                if text:
+                    yield text
+            if element is not root and element.tail:
+                tail = element.tail.strip()
+                if tail:
+                    yield tail
+
+
+class _BoilerplateDroppingParser(HTMLParser):
+    # Mirrors BeautifulSoupTextExtractor over html.parser: an end tag closes every element opened after its match and
+    # stray end tags are ignored. One segment per text node, from the first main/article if any, else the body, else
+    # the whole document.
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.stack: list[str] = []
+        self.skip_depth = 0
+        self.text_skip_depth = 0
+        # Stack depth of the first main/article/body while it is open, 0 once closed, None until seen.
+        self.roots: dict[str, int | None] = {"main": None, "article": None, "body": None}
+        self.segments: dict[str, list[str]] = {"main": [], "article": [], "body": [], "document": []}
+        self._pending: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self._flush()
+        if tag in VOID_TAGS:
+            return
+        self.stack.append(tag)
+        if tag in BOILERPLATE_TAGS:
+            self.skip_depth += 1
+        elif tag in NON_TEXT_TAGS:
+            self.text_skip_depth += 1
+        elif tag in self.roots and self.roots[tag] is None and not self.skip_depth:
+            self.roots[tag] = len(self.stack)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        if tag not in self.stack:
+            return
+        while self.stack:
+            closed = self.stack.pop()
+            if closed in BOILERPLATE_TAGS:
+                self.skip_depth -= 1
+            elif closed in NON_TEXT_TAGS:
+                self.text_skip_depth -= 1
+            if closed == tag:
+                break
+        for root, depth in self.roots.items():
+            if depth and depth > len(self.stack):
+                self.roots[root] = 0
+
+    def handle_data(self, data: str) -> None:
+        # The parser emits a text node in pieces at feed() boundaries; buffer until the next tag so words are not split.
+        if not self.skip_depth and not self.text_skip_depth:
+            self._pending.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+    def result(self) -> list[str]:
+        for root in ("main", "article", "body"):
+            if self.roots[root] is not None:
+                return self.segments[root]
+        return self.segments["document"]
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        text = "".join(self._pending).strip()
+        self._pending.clear()
+        if not text:
+            return
+        self.segments["document"].append(text)
+        for root, depth in self.roots.items():
+            if depth:
+                self.segments[root].append(text)
+
+
+class StreamingTextExtractor(TextExtractor):
+    name = "streaming"
+
+    def extract(self, html: str) -> str:
+        return self.extract_stream(iter_html_chunks(html))
+
+    def extract_stream(self, chunks: Iterable[str]) -> str:
+        # Boilerplate subtrees are discarded as they are parsed, so no tree is ever built.
+        parser = _BoilerplateDroppingParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        parser.close()
+        return _finalize(parser.result())
+
+
+EXTRACTORS: dict[str, type[TextExtractor]] = {
+    BeautifulSoupTextExtractor.name: BeautifulSoupTextExtractor,
+    LxmlTextExtractor.name: LxmlTextExtractor,
+    StreamingTextExtractor.name: StreamingTextExtractor,
+}
+
+
+def available_extractors() -> list[str]:
+    return [name for name in EXTRACTORS if name != LxmlTextExtractor.name or lxml is not None]
+
+
+def get_text_extractor(name: str | None = None) -> TextExtractor:
+    name = name or settings.SCRAPER_TEXT_EXTRACTOR
+    if name == "auto":
+        # bs4 is the reference output that content hashes, chunking and cache keys were built on, so the default must
+        # not depend on which optional packages happen to be installed. The faster backends are opt-in.
+        name = BeautifulSoupTextExtractor.name
+    if name not in EXTRACTORS:
+        raise ImproperlyConfigured(f"Unsupported text extractor: {name}")
+    return EXTRACTORS[name]()
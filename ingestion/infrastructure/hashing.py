@@ -0,0 +1,12 @@
+import hashlib
+import re
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
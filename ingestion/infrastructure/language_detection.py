@@ -0,0 +1,96 @@
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+SEEDS_PATH = Path(__file__).parent / "language_data" / "seeds.json"
+NON_LETTER_PATTERN = re.compile(r"[^\w']+|[\d_]+")
+NGRAM_SIZES = (2, 3, 4)
+MIN_NGRAMS = 30
+
+
+@dataclass
+class LanguageGuess:
+    language: str
+    confidence: float
+
+
+def _ngrams(text: str) -> Counter:
+    grams: Counter = Counter()
+    for word in NON_LETTER_PATTERN.sub(" ", text.lower()).split():
+        padded = f" {word} "
+        for size in NGRAM_SIZES:
+            for offset in range(len(padded) - size + 1):
+                grams[padded[offset : offset + size]] += 1
+    return grams
+
+
+@dataclass
+class LanguageProfile:
+    log_probs: dict[str, float]
+    unseen_log_prob: float
+
+
+def build_profiles(seeds: dict[str, str], smoothing: float = 0.5) -> dict[str, LanguageProfile]:
+    counts = {language: _ngrams(text) for language, text in seeds.items()}
+    vocabulary = len(set().union(*counts.values()))
+    profiles = {}
+    for language, grams in counts.items():
+        denominator = sum(grams.values()) + smoothing * vocabulary
+        profiles[language] = LanguageProfile(
+            log_probs={gram: math.log((count + smoothing) / denominator) for gram, count in grams.items()},
+            unseen_log_prob=math.log(smoothing / denominator),
+        )
+    return profiles
+
+
+@lru_cache(maxsize=1)
+def _seed_profiles() -> dict[str, LanguageProfile]:
+    return build_profiles(json.loads(SEEDS_PATH.read_text(encoding="utf-8")))
+
+
+class NgramLanguageDetector:
+    def __init__(
+        self,
+        profiles: dict[str, LanguageProfile] | None = None,
+        sample_chars: int = 512,
+        min_confidence: float = 0.02,
+    ) -> None:
+        self.profiles = profiles or _seed_profiles()
+        self.sample_chars = sample_chars
+        self.min_confidence = min_confidence
+
+    @property
+    def languages(self) -> list[str]:
+        return sorted(self.profiles)
+
+    def detect(self, text: str) -> LanguageGuess:
+        grams = _ngrams(text[: self.sample_chars])
+        total = sum(grams.values())
+        if total < MIN_NGRAMS:
+            return LanguageGuess("unknown", 0.0)
+        scores = sorted(
+            (
+                sum(count * profile.log_probs.get(gram, profile.unseen_log_prob) for gram, count in grams.items()) / total,
+                language,
+            )
+            for language, profile in self.profiles.items()
+        )
+        best_score, best_language = scores[-1]
+        # Confidence is the per-n-gram log-likelihood margin over the runner-up language.
+        confidence = best_score - scores[-2][0] if len(scores) > 1 else 1.0
+        if confidence < self.min_confidence:
+            return LanguageGuess("unknown", confidence)
+        return LanguageGuess(best_language, confidence)
+
+
+@lru_cache(maxsize=1)
+def get_language_detector() -> NgramLanguageDetector:
+    return NgramLanguageDetector()
+
+
+def primary_language(code: str) -> str:
+    return code.replace("_", "-").split("-", 1)[0].lower() or "unknown"
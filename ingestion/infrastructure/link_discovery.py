@@ -0,0 +1,84 @@
+import gzip
+import io
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+GZIP_MAGIC = b"\x1f\x8b"
+SKIPPED_EXTENSIONS = frozenset(
+    "7z avi bmp css csv doc docx eps gif gz ico jpeg jpg js json mov mp3 mp4 odt pdf png ppt pptx rar rss svg tar "
+    "tif tiff webm webp xls xlsx xml zip".split()
+)
+
+
+class SitemapError(ValueError):
+    pass
+
+
+@dataclass
+class Sitemap:
+    urls: list[str] = field(default_factory=list)
+    sitemaps: list[str] = field(default_factory=list)
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.hrefs: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag not in ("a", "area", "base"):
+            return
+        values = dict(attrs)
+        href = (values.get("href") or "").strip()
+        if not href:
+            return
+        if tag == "base":
+            self.base_url = urljoin(self.base_url, href)
+        elif "nofollow" not in (values.get("rel") or "").lower().split():
+            self.hrefs.append(href)
+
+
+def extract_links(html: str, base_url: str) -> list[str]:
+    parser = _LinkParser(base_url)
+    parser.feed(html)
+    parser.close()
+    links: list[str] = []
+    for href in parser.hrefs:
+        url, _ = urldefrag(urljoin(parser.base_url, href))
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            continue
+        filename = parts.path.rsplit("/", 1)[-1]
+        extension = filename.rpartition(".")[2].lower() if "." in filename else ""
+        if extension not in SKIPPED_EXTENSIONS:
+            links.append(url)
+    return links
+
+
+def _decompress(body: bytes, max_bytes: int) -> bytes:
+    if not body.startswith(GZIP_MAGIC):
+        return body
+    with gzip.GzipFile(fileobj=io.BytesIO(body)) as stream:
+        data = stream.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise SitemapError(f"Sitemap exceeds {max_bytes} bytes uncompressed")
+    return data
+
+
+def parse_sitemap(body: bytes, max_bytes: int = 50 * 1024 * 1024) -> Sitemap:
+    sitemap = Sitemap()
+    try:
+        for _, element in ET.iterparse(io.BytesIO(_decompress(body, max_bytes)), events=("end",)):
+            tag = element.tag.rpartition("}")[2]
+            if tag not in ("url", "sitemap"):
+                continue
+            location = next((child.text for child in element if child.tag.rpartition("}")[2] == "loc"), None)
+            if location and location.strip():
+                (sitemap.urls if tag == "url" else sitemap.sitemaps).append(location.strip())
+            element.clear()
+    except (ET.ParseError, OSError, EOFError) as exc:
+        raise SitemapError(f"Invalid sitemap: {exc}") from exc
+    return sitemap
@@ -12,7 +12,31 @@ class JsonFormatter(logging.Formatter):
             "logger": record.name,
             "message": record.getMessage(),
         }
-        for key in ("job_id", "task_id", "task_name", "state", "error", "duration_seconds"):
+        for key in (
+            "job_id",
+            "task_id",
+            "task_name",
+            "state",
+            "error",
+            "duration_seconds",
+            "browser_slot",
+            "reason",
+            "succeeded",
+            "failed",
+            "setup_seconds",
+            "chunk_count",
+            "cache_hits",
+            "deleted",
+            "token_usage",
+            "host",
+            "goto_ms",
+            "ready_ms",
+            "requests",
+            "blocked_requests",
+            "bytes_transferred",
+            "crawl_id",
+            "worker",
+        ):
             value = getattr(record, key, None)
             if value is not None:
                 payload[key] = value
@@ -0,0 +1,207 @@
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+from urllib.parse import urlparse
+
+from ingestion.infrastructure.redis_client import get_redis
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 45.0, 90.0, 180.0, math.inf)
+BUCKET_LABELS = tuple("+Inf" if bound == math.inf else repr(bound) for bound in LATENCY_BUCKETS)
+
+LATENCY_KEY = "metrics:latency"
+LATENCY_SUM_KEY = "metrics:latency:sum"
+EVENTS_KEY = "metrics:events"
+HOURLY_LATENCY_TTL_SECONDS = 2 * 24 * 3600
+THROUGHPUT_TTL_SECONDS = 24 * 3600
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).hostname or "-"
+
+
+def hourly_latency_key(hour: int) -> str:
+    return f"{LATENCY_KEY}:{hour}"
+
+
+def throughput_key(minute: int) -> str:
+    return f"metrics:throughput:{minute}"
+
+
+class StageMetricsRecorder:
+    def __init__(self, flush_interval_seconds: float = 5.0) -> None:
+        self.flush_interval_seconds = flush_interval_seconds
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._reset()
+
+    def observe(self, stage: str, host: str, seconds: float, ok: bool = True) -> None:
+        index = bisect_left(LATENCY_BUCKETS, seconds)
+        minute = int(time.time()) // 60
+        key = (stage, host)
+        with self._lock:
+            counts = self._histograms.get(key)
+            if counts is None:
+                counts = self._histograms[key] = [0] * len(LATENCY_BUCKETS)
+            counts[index] += 1
+            self._sums[key] += seconds
+            self._events[(minute, stage, "ok" if ok else "error")] += 1
+
+    def count(self, stage: str, outcome: str) -> None:
+        minute = int(time.time()) // 60
+        with self._lock:
+            self._events[(minute, stage, outcome)] += 1
+
+    def maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            histograms, sums, events = self._histograms, self._sums, self._events
+            self._reset()
+            self._last_flush = time.monotonic()
+        if not histograms and not events:
+            return
+
+        hour = int(time.time()) // 3600
+        with get_redis().pipeline(transaction=False) as pipe:
+            for (stage, host), counts in histograms.items():
+                for label, count in zip(BUCKET_LABELS, counts):
+                    if count:
+                        field = f"{stage}|{host}|{label}"
+                        pipe.hincrby(LATENCY_KEY, field, count)
+                        pipe.hincrby(hourly_latency_key(hour), field, count)
+                pipe.hincrbyfloat(LATENCY_SUM_KEY, f"{stage}|{host}", sums[(stage, host)])
+            pipe.expire(hourly_latency_key(hour), HOURLY_LATENCY_TTL_SECONDS)
+            for (minute, stage, outcome), count in events.items():
+                pipe.hincrby(EVENTS_KEY, f"{stage}|{outcome}", count)
+                pipe.hincrby(throughput_key(minute), f"{stage}|{outcome}", count)
+                pipe.expire(throughput_key(minute), THROUGHPUT_TTL_SECONDS)
+            pipe.execute()
+
+    def _reset(self) -> None:
+        self._histograms: dict[tuple[str, str], list[int]] = {}
+        self._sums: defaultdict[tuple[str, str], float] = defaultdict(float)
+        self._events: defaultdict[tuple[int, str, str], int] = defaultdict(int)
+
+
+_recorder = StageMetricsRecorder()
+
+
+def get_recorder() -> StageMetricsRecorder:
+    return _recorder
+
+
+def _reset_after_fork() -> None:
+    # Unflushed samples belong to the parent; the child starts from zero.
+    global _recorder
+    _recorder = StageMetricsRecorder(flush_interval_seconds=_recorder.flush_interval_seconds)
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+@contextmanager
+def stage_timer(stage: str, host: str) -> Iterator[None]:
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        _recorder.observe(stage, host, time.perf_counter() - start, ok=ok)
+
+
+def _parse_histograms(raw: dict[bytes, bytes]) -> dict[tuple[str, str], dict[str, int]]:
+    histograms: defaultdict[tuple[str, str], dict[str, int]] = defaultdict(dict)
+    for field, value in raw.items():
+        stage, host, label = field.decode().rsplit("|", 2)
+        histograms[(stage, host)][label] = int(value)
+    return histograms
+
+
+def _quantile(counts: dict[str, int], q: float) -> float:
+    total = sum(counts.values())
+    if not total:
+        return 0.0
+    running = 0
+    for bound, label in zip(LATENCY_BUCKETS, BUCKET_LABELS):
+        running += counts.get(label, 0)
+        if running >= q * total:
+            return bound
+    return LATENCY_BUCKETS[-1]
+
+
+def stage_latency_summary(host: str | None = None) -> list[dict]:
+    hour = int(time.time()) // 3600
+    per_stage: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for (stage, stage_host), counts in _parse_histograms(get_redis().hgetall(hourly_latency_key(hour))).items():
+        if host is None or stage_host == host:
+            for label, count in counts.items():
+                per_stage[stage][label] += count
+
+    minute = int(time.time()) // 60
+    with get_redis().pipeline(transaction=False) as pipe:
+        for offset in range(60):
+            pipe.hgetall(throughput_key(minute - offset))
+        minutes = pipe.execute()
+    events: defaultdict[str, int] = defaultdict(int)
+    for raw in minutes:
+        for field, value in raw.items():
+            events[field.decode()] += int(value)
+
+    summary = []
+    for stage in sorted(set(per_stage) | {field.rsplit("|", 1)[0] for field in events}):
+        counts = per_stage.get(stage, {})
+        summary.append(
+            {
+                "stage": stage,
+                "count": sum(counts.values()),
+                "p50": _quantile(counts, 0.5),
+                "p95": _quantile(counts, 0.95),
+                "ok_last_hour": events.get(f"{stage}|ok", 0),
+                "errors_last_hour": events.get(f"{stage}|error", 0),
+            }
+        )
+    return summary
+
+
+def render_prometheus(queue_depths: dict[str, int] | None = None) -> str:
+    client = get_redis()
+    histograms = _parse_histograms(client.hgetall(LATENCY_KEY))
+    sums = {field.decode(): float(value) for field, value in client.hgetall(LATENCY_SUM_KEY).items()}
+    events = {field.decode(): int(value) for field, value in client.hgetall(EVENTS_KEY).items()}
+
+    lines = [
+        "# HELP regingest_stage_duration_seconds Pipeline stage and task latency.",
+        "# TYPE regingest_stage_duration_seconds histogram",
+    ]
+    for (stage, host), counts in sorted(histograms.items()):
+        labels = f'stage="{stage}",host="{host}"'
+        cumulative = 0
+        for label in BUCKET_LABELS:
+            cumulative += counts.get(label, 0)
+            lines.append(f'regingest_stage_duration_seconds_bucket{{{labels},le="{label}"}} {cumulative}')
+        lines.append(f"regingest_stage_duration_seconds_sum{{{labels}}} {sums.get(f'{stage}|{host}', 0.0)}")
+        lines.append(f"regingest_stage_duration_seconds_count{{{labels}}} {cumulative}")
+
+    lines += [
+        "# HELP regingest_stage_events_total Pipeline stage and task outcomes.",
+        "# TYPE regingest_stage_events_total counter",
+    ]
+    for field, value in sorted(events.items()):
+        stage, outcome = field.rsplit("|", 1)
+        lines.append(f'regingest_stage_events_total{{stage="{stage}",outcome="{outcome}"}} {value}')
+
+    if queue_depths is not None:
+        lines += [
+            "# HELP regingest_queue_depth Messages waiting in each Celery queue.",
+            "# TYPE regingest_queue_depth gauge",
+        ]
+        lines += [f'regingest_queue_depth{{queue="{queue}"}} {depth}' for queue, depth in sorted(queue_depths.items())]
+    return "\n".join(lines) + "\n"
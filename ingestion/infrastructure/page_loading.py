@@ -0,0 +1,220 @@
+import json
+import time
+from dataclasses import dataclass, replace
+from urllib.parse import urlparse
+
+from django.conf import settings
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import Response as AsyncResponse
+from playwright.async_api import Route as AsyncRoute
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page, Response, Route
+
+READY_STATES = ("commit", "domcontentloaded", "load", "networkidle")
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "segment.io",
+    "newrelic.com",
+    "nr-data.net",
+    "matomo.cloud",
+    "siteimprove.com",
+    "cookiebot.com",
+    "onetrust.com",
+)
+
+# Resolves once the text of the main content root has stopped changing for `interval` ms.
+CONTENT_STABLE_SCRIPT = """
+(interval) => {
+    const root = document.querySelector("main, article, [role=main]") || document.body;
+    if (!root) return false;
+    const size = root.innerText.length;
+    const now = Date.now();
+    const state = window.__ingestionStable || (window.__ingestionStable = {size: -1, since: now});
+    if (size !== state.size) {
+        state.size = size;
+        state.since = now;
+        return false;
+    }
+    return size > 0 && now - state.since >= interval;
+}
+"""
+
+
+@dataclass(frozen=True)
+class PageLoadProfile:
+    wait_until: str = "domcontentloaded"
+    ready_selector: str = ""
+    wait_for_stable_content: bool = True
+    stable_interval_ms: int = 500
+    ready_timeout_ms: int = 10000
+    blocked_resource_types: frozenset[str] = frozenset(DEFAULT_BLOCKED_RESOURCE_TYPES)
+    block_trackers: bool = True
+
+    @property
+    def intercepts(self) -> bool:
+        return bool(self.blocked_resource_types) or self.block_trackers
+
+
+@dataclass
+class PageLoadStats:
+    goto_ms: int = 0
+    ready_ms: int = 0
+    requests: int = 0
+    blocked_requests: int = 0
+    bytes_transferred: int = 0
+    ready_timed_out: bool = False
+
+    @property
+    def load_ms(self) -> int:
+        return self.goto_ms + self.ready_ms
+
+
+def is_tracker(url: str) -> bool:
+    host = urlparse(url).hostname or ""
+    return any(host == domain or host.endswith(f".{domain}") for domain in TRACKER_DOMAINS)
+
+
+class PageLoadStrategy:
+    def __init__(self, default: PageLoadProfile | None = None, host_profiles: dict[str, PageLoadProfile] | None = None) -> None:
+        self.default = default or PageLoadProfile()
+        self.host_profiles = host_profiles or {}
+
+    def profile_for(self, url: str) -> PageLoadProfile:
+        host = urlparse(url).hostname or ""
+        while host:
+            if host in self.host_profiles:
+                return self.host_profiles[host]
+            host = host.partition(".")[2]
+        return self.default
+
+    def load(self, page: Page, url: str, timeout_ms: int) -> tuple[Response | None, PageLoadStats]:
+        profile = self.profile_for(url)
+        stats = PageLoadStats()
+        finished: list = []
+        if profile.intercepts:
+            page.route("**/*", lambda route: self._route(route, profile, stats))
+        page.on("requestfinished", finished.append)
+
+        start = time.perf_counter()
+        response = page.goto(url, wait_until=profile.wait_until, timeout=timeout_ms)
+        stats.goto_ms = int((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        try:
+            if profile.ready_selector:
+                page.wait_for_selector(profile.ready_selector, state="attached", timeout=profile.ready_timeout_ms)
+            if profile.wait_for_stable_content:
+                page.wait_for_function(
+                    CONTENT_STABLE_SCRIPT,
+                    arg=profile.stable_interval_ms,
+                    polling=100,
+                    timeout=profile.ready_timeout_ms,
+                )
+        except PlaywrightError:
+            # Readiness is best effort: whatever has rendered by now is still worth extracting.
+            stats.ready_timed_out = True
+        stats.ready_ms = int((time.perf_counter() - start) * 1000)
+
+        stats.requests = len(finished) + stats.blocked_requests
+        stats.bytes_transferred = sum(self._transfer_size(request) for request in finished)
+        return response, stats
+
+    async def aload(self, page: AsyncPage, url: str, timeout_ms: int) -> tuple[AsyncResponse | None, PageLoadStats]:
+        profile = self.profile_for(url)
+        stats = PageLoadStats()
+        finished: list = []
+        if profile.intercepts:
+            await page.route("**/*", lambda route: self._aroute(route, profile, stats))
+        page.on("requestfinished", finished.append)
+
+        start = time.perf_counter()
+        response = await page.goto(url, wait_until=profile.wait_until, timeout=timeout_ms)
+        stats.goto_ms = int((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        try:
+            if profile.ready_selector:
+                await page.wait_for_selector(profile.ready_selector, state="attached", timeout=profile.ready_timeout_ms)
+            if profile.wait_for_stable_content:
+                await page.wait_for_function(
+                    CONTENT_STABLE_SCRIPT,
+                    arg=profile.stable_interval_ms,
+                    polling=100,
+                    timeout=profile.ready_timeout_ms,
+                )
+        except PlaywrightError:
+            stats.ready_timed_out = True
+        stats.ready_ms = int((time.perf_counter() - start) * 1000)
+
+        stats.requests = len(finished) + stats.blocked_requests
+        for request in finished:
+            try:
+                stats.bytes_transferred += self._size_total(await request.sizes())
+            except PlaywrightError:
+                pass
+        return response, stats
+
+    def _should_block(self, request, profile: PageLoadProfile) -> bool:
+        if request.is_navigation_request():
+            return False
+        return request.resource_type in profile.blocked_resource_types or (profile.block_trackers and is_tracker(request.url))
+
+    def _route(self, route: Route, profile: PageLoadProfile, stats: PageLoadStats) -> None:
+        if self._should_block(route.request, profile):
+            stats.blocked_requests += 1
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _aroute(self, route: AsyncRoute, profile: PageLoadProfile, stats: PageLoadStats) -> None:
+        if self._should_block(route.request, profile):
+            stats.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _transfer_size(self, request) -> int:
+        try:
+            return self._size_total(request.sizes())
+        except PlaywrightError:
+            return 0
+
+    @staticmethod
+    def _size_total(sizes: dict) -> int:
+        return max(0, sizes.get("responseHeadersSize", 0)) + max(0, sizes.get("responseBodySize", 0))
+
+
+def _profile_from_config(base: PageLoadProfile, config: dict) -> PageLoadProfile:
+    overrides = {key: value for key, value in config.items() if key in PageLoadProfile.__dataclass_fields__}
+    if "blocked_resource_types" in overrides:
+        overrides["blocked_resource_types"] = frozenset(overrides["blocked_resource_types"])
+    profile = replace(base, **overrides)
+    if profile.wait_until not in READY_STATES:
+        raise ValueError(f"Unknown wait_until {profile.wait_until!r}; expected one of {', '.join(READY_STATES)}")
+    return profile
+
+
+def build_page_load_strategy() -> PageLoadStrategy:
+    default = _profile_from_config(
+        PageLoadProfile(),
+        {
+            "wait_until": settings.SCRAPER_WAIT_UNTIL,
+            "wait_for_stable_content": settings.SCRAPER_WAIT_FOR_STABLE_CONTENT,
+            "ready_timeout_ms": settings.SCRAPER_READY_TIMEOUT_MS,
+            "blocked_resource_types": [kind for kind in settings.SCRAPER_BLOCKED_RESOURCE_TYPES.split(",") if kind],
+            "block_trackers": settings.SCRAPER_BLOCK_TRACKERS,
+        },
+    )
+    host_profiles = {
+        host: _profile_from_config(default, config)
+        for host, config in json.loads(settings.SCRAPER_HOST_PAGE_PROFILES or "{}").items()
+    }
+    return PageLoadStrategy(default=default, host_profiles=host_profiles)
@@ -0,0 +1,114 @@
+import cProfile
+import logging
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from contextvars import ContextVar
+
+from django.conf import settings
+
+try:
+    import pyinstrument
+except ImportError:
+    pyinstrument = None
+
+logger = logging.getLogger(__name__)
+
+_active_session: ContextVar["ProfileSession | None"] = ContextVar("pipeline_profile_session", default=None)
+_DISABLED = nullcontext()
+
+
+class _Span:
+    __slots__ = ("session", "name", "start")
+
+    def __init__(self, session: "ProfileSession", name: str) -> None:
+        self.session = session
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *_) -> None:
+        self.session.add(self.name, time.perf_counter() - self.start)
+
+
+def span(name: str):
+    session = _active_session.get()
+    if session is None:
+        return _DISABLED
+    return _Span(session, name)
+
+
+class ProfileSession:
+    def __init__(self, label: str, dump_dir: str = "", profiler: str = "cprofile") -> None:
+        self.label = label
+        self.dump_dir = dump_dir
+        self.profiler_name = profiler
+        self.dump_path = ""
+        self._seconds: defaultdict[str, float] = defaultdict(float)
+        self._calls: defaultdict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._profiler = None
+        self._token = None
+        self._started_at = 0.0
+        self._total_seconds = 0.0
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._seconds[name] += seconds
+            self._calls[name] += 1
+
+    def __enter__(self) -> "ProfileSession":
+        self._token = _active_session.set(self)
+        if self.dump_dir:
+            if self.profiler_name == "pyinstrument" and pyinstrument is not None:
+                self._profiler = pyinstrument.Profiler()
+                self._profiler.start()
+            else:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+        self._started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._total_seconds = time.perf_counter() - self._started_at
+        _active_session.reset(self._token)
+        if self._profiler is not None:
+            self._dump()
+
+    def report(self) -> dict:
+        with self._lock:
+            spans = {
+                name: {"seconds": round(seconds, 6), "calls": self._calls[name]}
+                for name, seconds in sorted(self._seconds.items(), key=lambda item: item[1], reverse=True)
+            }
+        report = {"total_seconds": round(self._total_seconds, 6), "spans": spans}
+        if self.dump_path:
+            report["dump"] = self.dump_path
+        return report
+
+    def _dump(self) -> None:
+        os.makedirs(self.dump_dir, exist_ok=True)
+        stem = os.path.join(self.dump_dir, f"{self.label}-{int(time.time())}")
+        try:
+            if isinstance(self._profiler, cProfile.Profile):
+                self._profiler.disable()
+                self.dump_path = f"{stem}.prof"
+                self._profiler.dump_stats(self.dump_path)
+            else:
+                self._profiler.stop()
+                self.dump_path = f"{stem}.html"
+                with open(self.dump_path, "w", encoding="utf-8") as handle:
+                    handle.write(self._profiler.output_html())
+        except OSError as exc:
+            logger.warning("profiling.dump.failed", extra={"error": str(exc)})
+            self.dump_path = ""
+
+
+def start_profile_session(label: str, force: bool = False) -> ProfileSession | None:
+    if not force and random.random() >= settings.PIPELINE_PROFILE_SAMPLE_RATE:
+        return None
+    return ProfileSession(label, dump_dir=settings.PIPELINE_PROFILE_DUMP_DIR, profiler=settings.PIPELINE_PROFILER)
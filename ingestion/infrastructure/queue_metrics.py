@@ -0,0 +1,24 @@
+from django.conf import settings
+
+from ingestion.infrastructure.redis_client import get_redis
+
+# Celery's Redis transport stores non-default priorities in sibling lists named "<queue>\x06\x16<priority>".
+PRIORITY_SEPARATOR = "\x06\x16"
+PRIORITY_STEPS = (3, 6, 9)
+
+
+def pipeline_queues() -> list[str]:
+    return sorted(set(settings.PIPELINE_TASK_QUEUES.values()) | {settings.CELERY_TASK_DEFAULT_QUEUE})
+
+
+def queue_depths() -> dict[str, int]:
+    queues = pipeline_queues()
+    with get_redis().pipeline(transaction=False) as pipe:
+        for queue in queues:
+            pipe.llen(queue)
+            for priority in PRIORITY_STEPS:
+                pipe.llen(f"{queue}{PRIORITY_SEPARATOR}{priority}")
+        lengths = pipe.execute()
+
+    per_queue = len(PRIORITY_STEPS) + 1
+    return {queue: sum(lengths[index * per_queue : (index + 1) * per_queue]) for index, queue in enumerate(queues)}
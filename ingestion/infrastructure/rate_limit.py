@@ -0,0 +1,31 @@
+from ingestion.infrastructure.redis_client import get_redis
+
+# GCRA token bucket: the key holds the theoretical arrival time of the next request for the host.
+# Every call reserves the next free slot and returns the seconds until it starts ("0" to go now; a string keeps the
+# fraction). Waiters are spread one interval apart instead of all retrying at the same moment.
+HOST_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local start = math.max(now, tat - interval * (burst - 1))
+local next_tat = tat + interval
+redis.call('SET', KEYS[1], tostring(next_tat), 'PX', math.ceil((next_tat - now) * 1000) + 1000)
+return tostring(start - now)
+"""
+
+
+class HostRateLimiter:
+    def __init__(self, burst: int = 1) -> None:
+        self.burst = max(1, burst)
+
+    def acquire(self, host: str, interval_seconds: float) -> float:
+        if interval_seconds <= 0:
+            return 0.0
+        client = get_redis()
+        wait = client.register_script(HOST_BUCKET_SCRIPT)(keys=[f"ratelimit:host:{host}"], args=[interval_seconds, self.burst])
+        return float(wait)
@@ -0,0 +1,22 @@
+import os
+
+import redis
+from django.conf import settings
+
+_clients: dict[str, redis.Redis] = {}
+_clients_pid: int | None = None
+
+
+def get_redis(url: str | None = None) -> redis.Redis:
+    global _clients_pid
+    if _clients_pid != os.getpid():
+        _clients.clear()
+        _clients_pid = os.getpid()
+    url = url or settings.REDIS_URL
+    if url not in _clients:
+        _clients[url] = redis.Redis.from_url(url)
+    return _clients[url]
+
+
+def get_cache_redis() -> redis.Redis:
+    return get_redis(settings.CACHE_REDIS_URL)
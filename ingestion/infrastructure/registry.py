@@ -0,0 +1,152 @@
+import logging
+import os
+from functools import cached_property
+
+from django.conf import settings
+
+from ingestion.infrastructure.browser_pool import close_browser_pool
+from ingestion.infrastructure.crawl_frontier import CrawlFrontier
+from ingestion.infrastructure.page_loading import PageLoadStrategy, build_page_load_strategy
+from ingestion.infrastructure.rate_limit import HostRateLimiter
+from ingestion.infrastructure.robots import RobotsCache
+from ingestion.infrastructure.scraper import (
+    USER_AGENT,
+    AsyncPlaywrightScraperService,
+    PlaywrightScraperService,
+    StaticHttpFetcher,
+    TieredScraperService,
+)
+from ingestion.infrastructure.storage import S3StorageService, build_s3_client
+from ingestion.infrastructure.summarization import DummySummarizationService, MapReduceSummarizer, SummarizationService
+from ingestion.infrastructure.summary_cache import PartialSummaryCache, SummaryResultCache
+from ingestion.infrastructure.translation import DummyTranslationService, TranslationService
+from ingestion.infrastructure.translation_cache import TranslationCache, build_translation_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceRegistry:
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+
+    @cached_property
+    def s3_client(self):
+        return build_s3_client()
+
+    @cached_property
+    def storage(self) -> S3StorageService:
+        return S3StorageService(client=self.s3_client)
+
+    @cached_property
+    def robots(self) -> RobotsCache:
+        return RobotsCache(
+            user_agent=USER_AGENT,
+            ttl_seconds=settings.SCRAPER_ROBOTS_TTL_SECONDS,
+            error_ttl_seconds=settings.SCRAPER_ROBOTS_ERROR_TTL_SECONDS,
+        )
+
+    @cached_property
+    def host_limiter(self) -> HostRateLimiter:
+        return HostRateLimiter(burst=settings.SCRAPER_HOST_BURST)
+
+    @cached_property
+    def static_fetcher(self) -> StaticHttpFetcher:
+        return StaticHttpFetcher()
+
+    @cached_property
+    def crawl_frontier(self) -> CrawlFrontier:
+        return CrawlFrontier(ttl_seconds=settings.CRAWL_FRONTIER_TTL_SECONDS)
+
+    @cached_property
+    def page_loader(self) -> PageLoadStrategy:
+        return build_page_load_strategy()
+
+    @cached_property
+    def scraper(self) -> PlaywrightScraperService | TieredScraperService:
+        browser_scraper = PlaywrightScraperService(
+            respect_robots=settings.SCRAPER_RESPECT_ROBOTS,
+            robots=self.robots,
+            page_loader=self.page_loader,
+        )
+        if not settings.SCRAPER_STATIC_FIRST:
+            return browser_scraper
+        return TieredScraperService(
+            browser_scraper=browser_scraper,
+            static_fetcher=self.static_fetcher,
+            min_text_chars=settings.SCRAPER_STATIC_MIN_TEXT_CHARS,
+            respect_robots=settings.SCRAPER_RESPECT_ROBOTS,
+        )
+
+    @cached_property
+    def async_scraper(self) -> AsyncPlaywrightScraperService:
+        return AsyncPlaywrightScraperService(
+            respect_robots=settings.SCRAPER_RESPECT_ROBOTS,
+            max_concurrency=settings.SCRAPER_ASYNC_MAX_CONCURRENCY,
+            per_host_concurrency=settings.SCRAPER_ASYNC_PER_HOST_CONCURRENCY,
+            robots=self.robots,
+            page_loader=self.page_loader,
+        )
+
+    @cached_property
+    def translator(self) -> TranslationService:
+        return DummyTranslationService(
+            max_batch_items=settings.TRANSLATION_BATCH_MAX_ITEMS,
+            max_batch_tokens=settings.TRANSLATION_BATCH_MAX_TOKENS,
+            max_concurrency=settings.TRANSLATION_MAX_CONCURRENCY,
+            max_retries=settings.TRANSLATION_MAX_RETRIES,
+        )
+
+    @cached_property
+    def translation_cache(self) -> TranslationCache | None:
+        return build_translation_cache()
+
+    @cached_property
+    def summarizer(self) -> SummarizationService:
+        return DummySummarizationService()
+
+    @cached_property
+    def map_reduce_summarizer(self) -> MapReduceSummarizer:
+        return MapReduceSummarizer(
+            self.summarizer,
+            cache=PartialSummaryCache(ttl_seconds=settings.SUMMARY_PARTIAL_CACHE_TTL_SECONDS),
+            max_input_tokens=settings.SUMMARY_MAX_INPUT_TOKENS,
+            max_concurrency=settings.SUMMARY_MAX_CONCURRENCY,
+        )
+
+    @cached_property
+    def summary_cache(self) -> SummaryResultCache | None:
+        if not settings.SUMMARY_RESULT_CACHE_TTL_SECONDS:
+            return None
+        return SummaryResultCache(ttl_seconds=settings.SUMMARY_RESULT_CACHE_TTL_SECONDS)
+
+    def warm(self) -> None:
+        for name in ("s3_client", "storage", "robots", "host_limiter", "static_fetcher", "crawl_frontier", "page_loader", "scraper", "async_scraper", "translator", "translation_cache", "summarizer", "map_reduce_summarizer", "summary_cache"):
+            getattr(self, name)
+
+
+_registry: ServiceRegistry | None = None
+
+
+def get_service_registry() -> ServiceRegistry:
+    global _registry
+    if _registry is None or _registry.pid != os.getpid():
+        _registry = ServiceRegistry()
+    return _registry
+
+
+def reset_service_registry() -> None:
+    # Clients, connection pools and browser handles must never be shared across a fork.
+    global _registry
+    _registry = None
+    close_browser_pool()
+
+
+def init_service_registry() -> ServiceRegistry:
+    reset_service_registry()
+    registry = get_service_registry()
+    registry.warm()
+    logger.info("service_registry.initialized")
+    return registry
+
+
+os.register_at_fork(after_in_child=reset_service_registry)
@@ -0,0 +1,131 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import urllib3
+from redis.exceptions import RedisError
+
+from ingestion.infrastructure.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+ROBOTS_MAX_BYTES = 512 * 1024
+
+
+@dataclass
+class RobotsPolicy:
+    parser: RobotFileParser | None
+    disallow_all: bool
+    expires_at: float
+
+    def allowed(self, url: str, user_agent: str) -> bool:
+        if self.disallow_all:
+            return False
+        return self.parser is None or self.parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, user_agent: str) -> float:
+        if self.parser is None:
+            return 0.0
+        delay = float(self.parser.crawl_delay(user_agent) or 0)
+        rate = self.parser.request_rate(user_agent)
+        if rate and rate.requests:
+            delay = max(delay, rate.seconds / rate.requests)
+        return delay
+
+
+class RobotsCache:
+    def __init__(
+        self,
+        user_agent: str,
+        ttl_seconds: int = 86400,
+        error_ttl_seconds: int = 600,
+        max_entries: int = 1024,
+        timeout_seconds: float = 10.0,
+    ) -> None:
+        self.user_agent = user_agent
+        self.ttl_seconds = ttl_seconds
+        self.error_ttl_seconds = error_ttl_seconds
+        self.max_entries = max_entries
+        self._http = urllib3.PoolManager(
+            timeout=urllib3.Timeout(total=timeout_seconds),
+            retries=urllib3.Retry(total=2, redirect=5, raise_on_status=False),
+        )
+        self._policies: OrderedDict[str, RobotsPolicy] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allowed(self, url: str) -> bool:
+        return self.policy(url).allowed(url, self.user_agent)
+
+    def crawl_delay(self, url: str) -> float:
+        return self.policy(url).crawl_delay(self.user_agent)
+
+    def policy(self, url: str) -> RobotsPolicy:
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        with self._lock:
+            policy = self._policies.get(origin)
+            if policy is not None and policy.expires_at > time.time():
+                self._policies.move_to_end(origin)
+                return policy
+
+        record = self._load_shared(origin)
+        if record is None:
+            record = self._fetch(origin)
+            self._store_shared(origin, record)
+        policy = self._parse(record)
+        with self._lock:
+            self._policies[origin] = policy
+            self._policies.move_to_end(origin)
+            if len(self._policies) > self.max_entries:
+                self._policies.popitem(last=False)
+        return policy
+
+    def _fetch(self, origin: str) -> dict:
+        try:
+            response = self._http.request(
+                "GET",
+                f"{origin}/robots.txt",
+                headers={"User-Agent": self.user_agent},
+                preload_content=False,
+            )
+            try:
+                body = response.read(ROBOTS_MAX_BYTES).decode("utf-8", errors="replace")
+            finally:
+                response.release_conn()
+            status = response.status
+        except urllib3.exceptions.HTTPError as exc:
+            logger.warning("robots.fetch.failed", extra={"error": str(exc)})
+            body, status = "", 0
+        ttl = self.ttl_seconds if 200 <= status < 500 else self.error_ttl_seconds
+        return {"status": status, "body": body if status == 200 else "", "expires_at": time.time() + ttl}
+
+    def _parse(self, record: dict) -> RobotsPolicy:
+        status = record["status"]
+        # Same semantics as RobotFileParser.read(): 401/403 and unreachable hosts disallow, other 4xx allow all.
+        if status in (401, 403) or status == 0 or status >= 500:
+            return RobotsPolicy(parser=None, disallow_all=True, expires_at=record["expires_at"])
+        if status != 200:
+            return RobotsPolicy(parser=None, disallow_all=False, expires_at=record["expires_at"])
+        parser = RobotFileParser()
+        parser.parse(record["body"].splitlines())
+        return RobotsPolicy(parser=parser, disallow_all=False, expires_at=record["expires_at"])
+
+    def _load_shared(self, origin: str) -> dict | None:
+        try:
+            raw = get_redis().get(f"robots:{origin}")
+        except RedisError as exc:
+            logger.warning("robots.cache.unavailable", extra={"error": str(exc)})
+            return None
+        return json.loads(raw) if raw else None
+
+    def _store_shared(self, origin: str, record: dict) -> None:
+        ttl = max(1, int(record["expires_at"] - time.time()))
+        try:
+            get_redis().set(f"robots:{origin}", json.dumps(record), ex=ttl)
+        except RedisError as exc:
+            logger.warning("robots.cache.unavailable", extra={"error": str(exc)})
@@ -1,59 +1,336 @@
+import asyncio
 import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 from urllib.parse import urlparse
-from urllib.robotparser import RobotFileParser
 
-from bs4 import BeautifulSoup
+import urllib3
+from playwright.async_api import Browser as AsyncBrowser
+from playwright.async_api import async_playwright
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import sync_playwright
+
+from ingestion.infrastructure.browser_pool import BrowserPool, get_browser_pool
+from ingestion.infrastructure.extraction import TextExtractor, get_text_extractor
+from ingestion.infrastructure.page_loading import PageLoadStats, PageLoadStrategy
+from ingestion.infrastructure.profiling import span
+from ingestion.infrastructure.robots import RobotsCache
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "RegulatoryIngestionBot"
+
+SPA_ROOT_PATTERN = re.compile(
+    r"<div[^>]+id=[\"'](?:root|app|__next|__nuxt|q-app)[\"'][^>]*>\s*</div>",
+    re.IGNORECASE,
+)
+NOSCRIPT_PATTERN = re.compile(r"<noscript[^>]*>(.*?)</noscript>", re.IGNORECASE | re.DOTALL)
+NOSCRIPT_WARNING_PATTERN = re.compile(r"(enable|requires?|turn on)\s+javascript|javascript\s+(is\s+)?(disabled|required)", re.IGNORECASE)
+MAIN_PATTERN = re.compile(r"<main[^>]*>(.*?)</main>", re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+HTML_LANG_PATTERN = re.compile(r"<html[^>]*\blang=[\"']?([A-Za-z][\w-]*)", re.IGNORECASE)
+CHARSET_PATTERN = re.compile(r"charset=([\w-]+)", re.IGNORECASE)
+
 
 @dataclass
 class ScrapeResult:
     raw_html: str
     cleaned_text: str
     detected_language: str
+    fetch_mode: str = "browser"
+    fetch_reason: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    not_modified: bool = False
+    load_ms: int = 0
+    bytes_transferred: int = 0
+    blocked_requests: int = 0
+
+
+@dataclass
+class FetchValidators:
+    etag: str = ""
+    last_modified: str = ""
 
 
-class PlaywrightScraperService:
-    def __init__(self, timeout_ms: int = 45000, respect_robots: bool = False) -> None:
+@dataclass
+class StaticFetchResponse:
+    status: int
+    html: str
+    content_type: str
+    etag: str = ""
+    last_modified: str = ""
+
+
+class BaseScraperService:
+    def __init__(
+        self,
+        timeout_ms: int = 45000,
+        respect_robots: bool = False,
+        extractor: TextExtractor | None = None,
+        robots: RobotsCache | None = None,
+    ) -> None:
         self.timeout_ms = timeout_ms
         self.respect_robots = respect_robots
+        self.extractor = extractor or get_text_extractor()
+        self.robots = robots or RobotsCache(user_agent=USER_AGENT)
+
+    def _extract_text(self, html: str) -> str:
+        with span("scrape.extract_text"):
+            return self.extractor.extract(html)
 
-    def scrape_url(self, url: str) -> ScrapeResult:
+    def _log_page_load(self, url: str, stats: PageLoadStats) -> None:
+        logger.info(
+            "scrape.page_loaded",
+            extra={
+                "host": urlparse(url).hostname,
+                "duration_seconds": round(stats.load_ms / 1000, 3),
+                "goto_ms": stats.goto_ms,
+                "ready_ms": stats.ready_ms,
+                "requests": stats.requests,
+                "blocked_requests": stats.blocked_requests,
+                "bytes_transferred": stats.bytes_transferred,
+                "reason": "ready_timeout" if stats.ready_timed_out else None,
+            },
+        )
+
+    def _is_allowed_by_robots(self, url: str) -> bool:
+        with span("scrape.robots"):
+            return self.robots.allowed(url)
+
+
+class PlaywrightScraperService(BaseScraperService):
+    def __init__(
+        self,
+        timeout_ms: int = 45000,
+        respect_robots: bool = False,
+        browser_pool: BrowserPool | None = None,
+        extractor: TextExtractor | None = None,
+        robots: RobotsCache | None = None,
+        page_loader: PageLoadStrategy | None = None,
+    ) -> None:
+        super().__init__(timeout_ms=timeout_ms, respect_robots=respect_robots, extractor=extractor, robots=robots)
+        self.browser_pool = browser_pool
+        self.page_loader = page_loader or PageLoadStrategy()
+
+    def scrape_url(self, url: str, validators: FetchValidators | None = None) -> ScrapeResult:
         if self.respect_robots and not self._is_allowed_by_robots(url):
             raise ValueError(f"Crawling blocked by robots.txt for URL: {url}")
 
+        pool = self.browser_pool or get_browser_pool()
         try:
-            with sync_playwright() as playwright:
-                browser = playwright.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.goto(url, wait_until="networkidle", timeout=self.timeout_ms)
-                html = page.content()
-                lang = page.evaluate("document.documentElement.lang || 'unknown'")
-                browser.close()
+            with pool.page() as page:
+                with span("scrape.browser.goto"):
+                    response, stats = self.page_loader.load(page, url, self.timeout_ms)
+                with span("scrape.browser.content"):
+                    html = page.content()
+                    lang = page.evaluate("document.documentElement.lang || 'unknown'")
         except PlaywrightTimeoutError as exc:
             logger.error("scrape.timeout", extra={"error": str(exc)})
             raise
 
+        self._log_page_load(url, stats)
+        headers = response.headers if response else {}
         cleaned_text = self._extract_text(html)
-        return ScrapeResult(raw_html=html, cleaned_text=cleaned_text, detected_language=lang)
+        return ScrapeResult(
+            raw_html=html,
+            cleaned_text=cleaned_text,
+            detected_language=lang,
+            etag=headers.get("etag", ""),
+            last_modified=headers.get("last-modified", ""),
+            load_ms=stats.load_ms,
+            bytes_transferred=stats.bytes_transferred,
+            blocked_requests=stats.blocked_requests,
+        )
 
-    def _extract_text(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        for tag in soup(["script", "style", "noscript", "svg", "header", "footer", "nav", "form"]):
-            tag.decompose()
-        main = soup.find("main") or soup.find("article") or soup.body or soup
-        text = main.get_text(separator="\n", strip=True)
-        return re.sub(r"\n{2,}", "\n\n", text).strip()
 
-    def _is_allowed_by_robots(self, url: str) -> bool:
-        parsed = urlparse(url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-        parser = RobotFileParser()
-        parser.set_url(robots_url)
-        parser.read()
-        return parser.can_fetch("RegulatoryIngestionBot", url)
+class AsyncPlaywrightScraperService(BaseScraperService):
+    def __init__(
+        self,
+        timeout_ms: int = 45000,
+        respect_robots: bool = False,
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        extractor: TextExtractor | None = None,
+        robots: RobotsCache | None = None,
+        page_loader: PageLoadStrategy | None = None,
+    ) -> None:
+        super().__init__(timeout_ms=timeout_ms, respect_robots=respect_robots, extractor=extractor, robots=robots)
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.page_loader = page_loader or PageLoadStrategy()
+
+    async def scrape_many(self, urls: list[str]) -> list[ScrapeResult | BaseException]:
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: defaultdict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(self.per_host_concurrency))
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            try:
+                return await asyncio.gather(
+                    *(self._scrape_one(browser, url, global_limit, host_limits[urlparse(url).netloc]) for url in urls),
+                    return_exceptions=True,
+                )
+            finally:
+                await browser.close()
+
+    async def _scrape_one(
+        self,
+        browser: AsyncBrowser,
+        url: str,
+        global_limit: asyncio.Semaphore,
+        host_limit: asyncio.Semaphore,
+    ) -> ScrapeResult:
+        if self.respect_robots and not await asyncio.to_thread(self._is_allowed_by_robots, url):
+            raise ValueError(f"Crawling blocked by robots.txt for URL: {url}")
+
+        # Take the host slot first so a busy host never pins a global slot while it waits.
+        async with host_limit, global_limit:
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                response, stats = await self.page_loader.aload(page, url, self.timeout_ms)
+                html = await page.content()
+                lang = await page.evaluate("document.documentElement.lang || 'unknown'")
+            except PlaywrightTimeoutError as exc:
+                logger.error("scrape.timeout", extra={"error": str(exc)})
+                raise
+            finally:
+                await context.close()
+
+        self._log_page_load(url, stats)
+        headers = response.headers if response else {}
+        cleaned_text = await asyncio.to_thread(self._extract_text, html)
+        return ScrapeResult(
+            raw_html=html,
+            cleaned_text=cleaned_text,
+            detected_language=lang,
+            etag=headers.get("etag", ""),
+            last_modified=headers.get("last-modified", ""),
+            load_ms=stats.load_ms,
+            bytes_transferred=stats.bytes_transferred,
+            blocked_requests=stats.blocked_requests,
+        )
+
+
+class StaticHttpFetcher:
+    def __init__(self, timeout_ms: int = 15000, max_pool_size: int = 10) -> None:
+        self._http = urllib3.PoolManager(
+            maxsize=max_pool_size,
+            timeout=urllib3.Timeout(total=timeout_ms / 1000),
+            retries=urllib3.Retry(total=2, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+        )
+
+    def fetch(self, url: str, validators: FetchValidators | None = None) -> StaticFetchResponse:
+        headers = {"User-Agent": USER_AGENT}
+        if validators and validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators and validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+        response = self._http.request("GET", url, headers=headers)
+        content_type = response.headers.get("Content-Type", "")
+        charset_match = CHARSET_PATTERN.search(content_type)
+        charset = charset_match.group(1) if charset_match else "utf-8"
+        try:
+            html = response.data.decode(charset, errors="replace")
+        except LookupError:
+            html = response.data.decode("utf-8", errors="replace")
+        return StaticFetchResponse(
+            status=response.status,
+            html=html,
+            content_type=content_type,
+            etag=response.headers.get("ETag", ""),
+            last_modified=response.headers.get("Last-Modified", ""),
+        )
+
+    def fetch_bytes(self, url: str, max_bytes: int | None = None) -> tuple[int, bytes]:
+        # Reads at most max_bytes + 1 bytes, so callers can tell an oversized body from one that fits exactly.
+        response = self._http.request("GET", url, headers={"User-Agent": USER_AGENT}, preload_content=False)
+        try:
+            body = response.read() if max_bytes is None else response.read(max_bytes + 1)
+            if max_bytes is not None and len(body) > max_bytes:
+                # The rest of the body is still on the socket, so the connection must not be reused.
+                response.close()
+        finally:
+            response.release_conn()
+        return response.status, body
+
+
+class TieredScraperService(BaseScraperService):
+    def __init__(
+        self,
+        browser_scraper: PlaywrightScraperService,
+        static_fetcher: StaticHttpFetcher | None = None,
+        min_text_chars: int = 200,
+        respect_robots: bool = False,
+    ) -> None:
+        super().__init__(
+            timeout_ms=browser_scraper.timeout_ms,
+            respect_robots=respect_robots,
+            extractor=browser_scraper.extractor,
+            robots=browser_scraper.robots,
+        )
+        self.browser_scraper = browser_scraper
+        self.static_fetcher = static_fetcher or StaticHttpFetcher()
+        self.min_text_chars = min_text_chars
+
+    def scrape_url(self, url: str, validators: FetchValidators | None = None) -> ScrapeResult:
+        if self.respect_robots and not self._is_allowed_by_robots(url):
+            raise ValueError(f"Crawling blocked by robots.txt for URL: {url}")
+
+        try:
+            with span("scrape.static.fetch"):
+                response = self.static_fetcher.fetch(url, validators=validators)
+        except urllib3.exceptions.HTTPError as exc:
+            return self._escalate(url, f"static_fetch_error:{type(exc).__name__}")
+
+        if response.status == 304:
+            return ScrapeResult(
+                raw_html="",
+                cleaned_text="",
+                detected_language="unknown",
+                fetch_mode="static",
+                fetch_reason="not_modified",
+                etag=response.etag or (validators.etag if validators else ""),
+                last_modified=response.last_modified or (validators.last_modified if validators else ""),
+                not_modified=True,
+            )
+        if response.status != 200:
+            return self._escalate(url, f"static_status:{response.status}")
+        if "html" not in response.content_type.lower():
+            return self._escalate(url, "static_non_html")
+
+        cleaned_text = self._extract_text(response.html)
+        with span("scrape.static.heuristics"):
+            reason = self._escalation_reason(response.html, cleaned_text)
+        if reason:
+            return self._escalate(url, reason)
+
+        lang_match = HTML_LANG_PATTERN.search(response.html)
+        return ScrapeResult(
+            raw_html=response.html,
+            cleaned_text=cleaned_text,
+            detected_language=lang_match.group(1) if lang_match else "unknown",
+            fetch_mode="static",
+            fetch_reason="static_content_sufficient",
+            etag=response.etag,
+            last_modified=response.last_modified,
+        )
+
+    def _escalation_reason(self, html: str, cleaned_text: str) -> str:
+        if SPA_ROOT_PATTERN.search(html):
+            return "spa_root_empty"
+        for noscript in NOSCRIPT_PATTERN.findall(html):
+            if NOSCRIPT_WARNING_PATTERN.search(noscript):
+                return "noscript_javascript_required"
+        main = MAIN_PATTERN.search(html)
+        if main and not TAG_PATTERN.sub("", main.group(1)).strip():
+            return "empty_main"
+        if len(cleaned_text) < self.min_text_chars:
+            return "thin_text"
+        return ""
+
+    def _escalate(self, url: str, reason: str) -> ScrapeResult:
+        logger.info("scrape.escalated", extra={"reason": reason})
+        result = self.browser_scraper.scrape_url(url)
+        result.fetch_reason = reason
+        return result
@@ -1,21 +1,202 @@
-import uuid
+import contextvars
+import hashlib
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
 
 import boto3
+from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from ingestion.infrastructure.profiling import span
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_SUFFIXES = {"": "", "gzip": ".gz", "zstd": ".zst"}
+ENCODE_CHUNK_CHARS = 1024 * 1024
+MIN_MULTIPART_PART_BYTES = 5 * 1024 * 1024
+
+
+@dataclass
+class StoredArtifact:
+    uri: str
+    sha256: str
+    size_bytes: int
+    deduplicated: bool
+
+
+class KnownKeyIndex:
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self._keys: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                return True
+            return False
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+            if len(self._keys) > self.max_entries:
+                self._keys.popitem(last=False)
+
+
+_known_keys = KnownKeyIndex()
+
+
+def iter_encoded(html: str) -> Iterator[bytes]:
+    for offset in range(0, len(html), ENCODE_CHUNK_CHARS):
+        yield html[offset : offset + ENCODE_CHUNK_CHARS].encode("utf-8")
+
+
+def build_s3_client():
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
+        region_name=settings.AWS_DEFAULT_REGION,
+    )
 
 
 class S3StorageService:
-    def __init__(self) -> None:
-        self._client = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
-            region_name=settings.AWS_DEFAULT_REGION,
-        )
+    def __init__(self, compression: str | None = None, client=None) -> None:
+        self._client = client or build_s3_client()
         self.bucket = settings.AWS_S3_BUCKET
+        self.compression = settings.AWS_S3_HTML_COMPRESSION if compression is None else compression
+        if self.compression not in COMPRESSION_SUFFIXES:
+            raise ImproperlyConfigured(f"Unsupported HTML compression: {self.compression}")
+        if self.compression == "zstd" and zstandard is None:
+            raise ImproperlyConfigured("zstd compression requires the zstandard package")
+        self.multipart_threshold = settings.AWS_S3_MULTIPART_THRESHOLD_MB * 1024 * 1024
+        self.part_size = max(MIN_MULTIPART_PART_BYTES, settings.AWS_S3_MULTIPART_PART_MB * 1024 * 1024)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: list[Future] = []
+
+    def upload_html(self, html: str, job_id: int) -> StoredArtifact:
+        artifact, key = self._locate(html)
+        if artifact.deduplicated:
+            logger.info("storage.html.deduplicated", extra={"job_id": job_id})
+            return artifact
+        self._upload(html, key, artifact.sha256)
+        return artifact
+
+    def upload_html_in_background(self, html: str, job_id: int) -> StoredArtifact:
+        artifact, key = self._locate(html)
+        if artifact.deduplicated:
+            logger.info("storage.html.deduplicated", extra={"job_id": job_id})
+            return artifact
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=settings.AWS_S3_UPLOAD_WORKERS, thread_name_prefix="s3-upload")
+        context = contextvars.copy_context()
+        self._pending.append(self._executor.submit(context.run, self._upload, html, key, artifact.sha256))
+        return artifact
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        with span("storage.flush_wait"):
+            for future in pending:
+                future.result()
+
+    def _locate(self, html: str) -> tuple[StoredArtifact, str]:
+        digest = hashlib.sha256()
+        size_bytes = 0
+        with span("storage.hash"):
+            for chunk in iter_encoded(html):
+                digest.update(chunk)
+                size_bytes += len(chunk)
+        sha256 = digest.hexdigest()
+        key = f"raw/sha256/{sha256[:2]}/{sha256}.html{COMPRESSION_SUFFIXES[self.compression]}"
+        artifact = StoredArtifact(
+            uri=f"s3://{self.bucket}/{key}",
+            sha256=sha256,
+            size_bytes=size_bytes,
+            deduplicated=self._exists(key),
+        )
+        return artifact, key
+
+    def _upload(self, html: str, key: str, sha256: str) -> None:
+        with span("storage.upload"):
+            self._stream_upload(html, key, sha256)
+
+    def _stream_upload(self, html: str, key: str, sha256: str) -> None:
+        extra_args = {"ContentType": "text/html; charset=utf-8", "Metadata": {"sha256": sha256}}
+        if self.compression:
+            extra_args["ContentEncoding"] = self.compression
+
+        buffer = bytearray()
+        upload_id = None
+        parts: list[dict] = []
+        try:
+            for chunk in self._iter_body(html):
+                buffer += chunk
+                flush_at = self.part_size if upload_id else max(self.part_size, self.multipart_threshold)
+                if len(buffer) < flush_at:
+                    continue
+                if upload_id is None:
+                    upload_id = self._client.create_multipart_upload(Bucket=self.bucket, Key=key, **extra_args)["UploadId"]
+                parts.append(self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                self._client.put_object(Bucket=self.bucket, Key=key, Body=bytes(buffer), **extra_args)
+            else:
+                if buffer:
+                    parts.append(self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                self._client.complete_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except Exception:
+            if upload_id is not None:
+                self._client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            raise
+        _known_keys.add(key)
+
+    def _upload_part(self, key: str, upload_id: str, part_number: int, body: bytes) -> dict:
+        response = self._client.upload_part(Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body)
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _iter_body(self, html: str) -> Iterator[bytes]:
+        if not self.compression:
+            yield from iter_encoded(html)
+            return
+        if self.compression == "gzip":
+            compressor = zlib.compressobj(wbits=31)
+        else:
+            compressor = zstandard.ZstdCompressor().compressobj()
+        for chunk in iter_encoded(html):
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
 
-    def upload_html(self, html: str, job_id: int) -> str:
-        key = f"jobs/{job_id}/raw/{uuid.uuid4()}.html"
-        self._client.put_object(Bucket=self.bucket, Key=key, Body=html.encode("utf-8"), ContentType="text/html")
-        return f"s3://{self.bucket}/{key}"
+    def _exists(self, key: str) -> bool:
+        if key in _known_keys:
+            return True
+        try:
+            with span("storage.head"):
+                self._client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        _known_keys.add(key)
+        return True
@@ -1,5 +1,17 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from itertools import chain
+from typing import Iterable, Iterator
+
+from ingestion.infrastructure.hashing import text_hash
+from ingestion.infrastructure.summary_cache import PartialSummaryCache
+from ingestion.infrastructure.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+MAX_REDUCE_LEVELS = 6
 
 
 @dataclass
@@ -12,20 +24,159 @@ class SummaryResponse:
 
 
 class SummarizationService(ABC):
+    model_name: str
+    prompt_version: str
+    temperature: float
+
     @abstractmethod
     def summarize(self, text: str) -> SummaryResponse:
         raise NotImplementedError
 
+    def summarize_section(self, text: str) -> SummaryResponse:
+        return self.summarize(text)
+
+    def combine(self, summaries: list[str]) -> SummaryResponse:
+        return self.summarize("\n\n".join(summaries))
+
 
 class DummySummarizationService(SummarizationService):
+    model_name = "dummy-llm-v1"
+    prompt_version = "v1.0.0"
+    temperature = 0.2
+    max_chars = 650
+
     def summarize(self, text: str) -> SummaryResponse:
-        max_chars = 650
-        snippet = text[:max_chars]
-        summary = f"Executive summary:\n{snippet}"
+        return self._respond(f"Executive summary:\n{text[: self.max_chars]}", text[: self.max_chars])
+
+    def summarize_section(self, text: str) -> SummaryResponse:
+        snippet = text[: self.max_chars // 4]
+        return self._respond(snippet, snippet)
+
+    def combine(self, summaries: list[str]) -> SummaryResponse:
+        return self.summarize("\n".join(summaries))
+
+    def _respond(self, summary: str, snippet: str) -> SummaryResponse:
         return SummaryResponse(
             summary_text=summary,
-            model_name="dummy-llm-v1",
-            prompt_version="v1.0.0",
-            temperature=0.2,
+            model_name=self.model_name,
+            prompt_version=self.prompt_version,
+            temperature=self.temperature,
             token_usage=max(1, len(snippet.split())),
         )
+
+
+class MapReduceSummarizer:
+    def __init__(
+        self,
+        summarizer: SummarizationService,
+        cache: PartialSummaryCache | None = None,
+        max_input_tokens: int = 6000,
+        max_concurrency: int = 4,
+    ) -> None:
+        self.summarizer = summarizer
+        self.cache = cache
+        self.max_input_tokens = max_input_tokens
+        self.max_concurrency = max(1, max_concurrency)
+
+    @property
+    def model_name(self) -> str:
+        return self.summarizer.model_name
+
+    @property
+    def prompt_version(self) -> str:
+        return self.summarizer.prompt_version
+
+    @property
+    def temperature(self) -> float:
+        return self.summarizer.temperature
+
+    def summarize(self, texts: Iterable[str]) -> SummaryResponse:
+        return asyncio.run(self.asummarize(texts))
+
+    async def asummarize(self, texts: Iterable[str]) -> SummaryResponse:
+        texts = iter(texts)
+        head: list[str] = []
+        head_tokens = 0
+        for text in texts:
+            head.append(text)
+            head_tokens += estimate_tokens(text)
+            if head_tokens > self.max_input_tokens:
+                break
+        else:
+            return await asyncio.to_thread(self.summarizer.summarize, "\n".join(head))
+
+        usage = [0]
+        limit = asyncio.Semaphore(self.max_concurrency)
+        summaries: list[str] = []
+        window: list[list[str]] = []
+        for text in self._split_oversized(chain(head, texts)):
+            window.append([text])
+            if len(window) >= self.max_concurrency * 4:
+                summaries += await self._run_phase("map", window, limit, usage)
+                window = []
+        if window:
+            summaries += await self._run_phase("map", window, limit, usage)
+        chunk_count = len(summaries)
+
+        groups = self._pack(summaries)
+        for _ in range(MAX_REDUCE_LEVELS):
+            if len(groups) == 1:
+                break
+            groups = self._pack(await self._run_phase("reduce", groups, limit, usage))
+        if len(groups) > 1:
+            # Reduce passes stopped converging; give every remaining summary an equal share of one request's budget.
+            remaining = [summary for group in groups for summary in group]
+            share = max(1, (self.max_input_tokens * 4) // len(remaining) - 2)
+            groups = [[summary[:share] for summary in remaining]]
+            logger.warning("summarization.map_reduce.truncated", extra={"chunk_count": len(remaining)})
+        final = await self._run_phase("final", groups, limit, usage)
+        logger.info("summarization.map_reduce.completed", extra={"chunk_count": chunk_count, "token_usage": usage[0]})
+        return SummaryResponse(
+            summary_text=final[0],
+            model_name=self.summarizer.model_name,
+            prompt_version=self.summarizer.prompt_version,
+            temperature=self.summarizer.temperature,
+            token_usage=usage[0],
+        )
+
+    async def _run_phase(self, phase: str, inputs: list[list[str]], limit: asyncio.Semaphore, usage: list[int]) -> list[str]:
+        # Partial summaries are keyed by input hash, so an amended document only recomputes the changed chunks.
+        keys = [self._cache_key(phase, "\n\n".join(parts)) for parts in inputs]
+        cached = self.cache.get_many(list(set(keys))) if self.cache else {}
+        pending = {key: parts for key, parts in zip(keys, inputs) if key not in cached}
+
+        async def call(parts: list[str]) -> SummaryResponse:
+            async with limit:
+                if phase == "map":
+                    return await asyncio.to_thread(self.summarizer.summarize_section, parts[0])
+                return await asyncio.to_thread(self.summarizer.combine, parts)
+
+        responses = await asyncio.gather(*(call(parts) for parts in pending.values()))
+        fresh = {key: response.summary_text for key, response in zip(pending, responses)}
+        usage[0] += sum(response.token_usage for response in responses)
+        if self.cache:
+            self.cache.set_many(fresh)
+        return [cached[key] if key in cached else fresh[key] for key in keys]
+
+    def _cache_key(self, phase: str, text: str) -> str:
+        summarizer = self.summarizer
+        return f"{summarizer.model_name}:{summarizer.prompt_version}:{summarizer.temperature}:{phase}:{text_hash(text)}"
+
+    def _pack(self, summaries: list[str]) -> list[list[str]]:
+        groups: list[list[str]] = [[]]
+        tokens = 0
+        for summary in summaries:
+            summary = summary[: self.max_input_tokens * 4]
+            cost = estimate_tokens(summary)
+            if groups[-1] and tokens + cost > self.max_input_tokens:
+                groups.append([])
+                tokens = 0
+            groups[-1].append(summary)
+            tokens += cost
+        return groups
+
+    def _split_oversized(self, texts: Iterable[str]) -> Iterator[str]:
+        max_chars = self.max_input_tokens * 4
+        for text in texts:
+            for offset in range(0, len(text), max_chars):
+                yield text[offset : offset + max_chars]
@@ -0,0 +1,70 @@
+import json
+import logging
+from dataclasses import dataclass
+
+from redis.exceptions import RedisError
+
+from ingestion.infrastructure.redis_client import get_cache_redis
+
+logger = logging.getLogger(__name__)
+
+
+class PartialSummaryCache:
+    # The cache only saves provider calls, so an unavailable Redis degrades to misses and skipped writes.
+    def __init__(self, ttl_seconds: int) -> None:
+        self.ttl_seconds = ttl_seconds
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        if not keys:
+            return {}
+        try:
+            values = get_cache_redis().mget([f"summary:partial:{key}" for key in keys])
+        except RedisError as exc:
+            logger.warning("summary.cache.unavailable", extra={"error": str(exc)})
+            return {}
+        return {key: value.decode("utf-8") for key, value in zip(keys, values) if value is not None}
+
+    def set_many(self, entries: dict[str, str]) -> None:
+        if not entries:
+            return
+        try:
+            with get_cache_redis().pipeline(transaction=False) as pipe:
+                for key, summary in entries.items():
+                    pipe.set(f"summary:partial:{key}", summary, ex=self.ttl_seconds)
+                pipe.execute()
+        except RedisError as exc:
+            logger.warning("summary.cache.unavailable", extra={"error": str(exc)})
+
+
+@dataclass
+class CachedSummary:
+    summary_text: str
+    token_usage: int
+
+
+class SummaryResultCache:
+    # Entries expire after the TTL; under memory pressure the cache instance evicts least recently used keys first.
+    def __init__(self, ttl_seconds: int) -> None:
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(source_hash: str, model_name: str, prompt_version: str, temperature: float) -> str:
+        return f"summary:result:{model_name}:{prompt_version}:{temperature}:{source_hash}"
+
+    def get(self, key: str) -> CachedSummary | None:
+        try:
+            raw = get_cache_redis().getex(key, ex=self.ttl_seconds)
+        except RedisError as exc:
+            logger.warning("summary.cache.unavailable", extra={"error": str(exc)})
+            return None
+        if raw is None:
+            return None
+        payload = json.loads(raw)
+        return CachedSummary(summary_text=payload["summary_text"], token_usage=payload["token_usage"])
+
+    def set(self, key: str, summary: CachedSummary) -> None:
+        payload = json.dumps({"summary_text": summary.summary_text, "token_usage": summary.token_usage})
+        try:
+            get_cache_redis().set(key, payload, ex=self.ttl_seconds)
+        except RedisError as exc:
+            logger.warning("summary.cache.unavailable", extra={"error": str(exc)})
@@ -0,0 +1,3 @@
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for Latin-script text; good enough for budgeting requests.
+    return max(1, len(text) // 4)
@@ -1,5 +1,14 @@
+import asyncio
+import logging
+import random
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Iterator
+
+from ingestion.infrastructure.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -8,14 +17,116 @@ class TranslationResponse:
     engine: str
 
 
+class TranslationError(Exception):
+    pass
+
+
+def plan_batches(texts: list[str], max_items: int, max_tokens: int) -> Iterator[list[int]]:
+    batch: list[int] = []
+    tokens = 0
+    for index, text in enumerate(texts):
+        cost = estimate_tokens(text)
+        if batch and (len(batch) >= max_items or tokens + cost > max_tokens):
+            yield batch
+            batch, tokens = [], 0
+        batch.append(index)
+        tokens += cost
+    if batch:
+        yield batch
+
+
 class TranslationService(ABC):
+    name: str
+
+    def __init__(
+        self,
+        max_batch_items: int = 32,
+        max_batch_tokens: int = 8000,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+    ) -> None:
+        self.max_batch_items = max(1, max_batch_items)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+
     @abstractmethod
     def translate(self, text: str, source_language: str, target_language: str = "en") -> TranslationResponse:
         raise NotImplementedError
 
+    def translate_batch(self, texts: list[str], source_language: str, target_language: str = "en") -> list[TranslationResponse]:
+        # Vendor adapters override this with a single multi-segment request.
+        return [self.translate(text, source_language, target_language) for text in texts]
+
+    async def atranslate_batch(self, texts: list[str], source_language: str, target_language: str = "en") -> list[TranslationResponse]:
+        return await asyncio.to_thread(self.translate_batch, texts, source_language, target_language)
+
+    async def atranslate_many(self, texts: list[str], source_language: str, target_language: str = "en") -> list[TranslationResponse]:
+        limit = asyncio.Semaphore(self.max_concurrency)
+        batches = list(plan_batches(texts, self.max_batch_items, self.max_batch_tokens))
+
+        async def run(indices: list[int]) -> list[TranslationResponse]:
+            async with limit:
+                return await self._atranslate_with_retry([texts[index] for index in indices], source_language, target_language)
+
+        results: list[TranslationResponse | None] = [None] * len(texts)
+        for indices, responses in zip(batches, await asyncio.gather(*(run(indices) for indices in batches))):
+            for index, response in zip(indices, responses):
+                results[index] = response
+        return results
+
+    def translate_many(self, texts: list[str], source_language: str, target_language: str = "en") -> list[TranslationResponse]:
+        return asyncio.run(self.atranslate_many(texts, source_language, target_language))
+
+    async def _atranslate_with_retry(self, texts: list[str], source_language: str, target_language: str) -> list[TranslationResponse]:
+        attempt = 0
+        while True:
+            try:
+                responses = await self.atranslate_batch(texts, source_language, target_language)
+            except TranslationError as exc:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff_seconds * (2**attempt) * random.uniform(0.5, 1.5)
+                logger.warning("translation.batch.retry", extra={"error": str(exc), "duration_seconds": round(delay, 2)})
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if len(responses) != len(texts):
+                raise TranslationError(f"Expected {len(texts)} translations, got {len(responses)}")
+            return responses
+
 
 class DummyTranslationService(TranslationService):
+    name = "dummy"
+
+    def __init__(self, latency_seconds: float = 0.0, failure_rate: float = 0.0, **kwargs) -> None:
+        # Latency and failures are injected per request to emulate a remote vendor offline.
+        super().__init__(**kwargs)
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+
     def translate(self, text: str, source_language: str, target_language: str = "en") -> TranslationResponse:
+        return self.translate_batch([text], source_language, target_language)[0]
+
+    def translate_batch(self, texts: list[str], source_language: str, target_language: str = "en") -> list[TranslationResponse]:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        self._maybe_fail()
+        return [self._respond(text, source_language, target_language) for text in texts]
+
+    async def atranslate_batch(self, texts: list[str], source_language: str, target_language: str = "en") -> list[TranslationResponse]:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        self._maybe_fail()
+        return [self._respond(text, source_language, target_language) for text in texts]
+
+    def _maybe_fail(self) -> None:
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise TranslationError("Injected transient translation failure")
+
+    def _respond(self, text: str, source_language: str, target_language: str) -> TranslationResponse:
         if source_language.lower().startswith("en"):
             return TranslationResponse(translated_text=text, engine="dummy-noop")
         return TranslationResponse(
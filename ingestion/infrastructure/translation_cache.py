@@ -0,0 +1,155 @@
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import F
+from django.utils import timezone
+from redis.exceptions import RedisError
+
+from ingestion.domain.models import TranslationCacheEntry
+from ingestion.infrastructure.redis_client import get_cache_redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TranslationCacheKey:
+    text_hash: str
+    source_language: str
+    target_language: str
+    engine: str
+
+    @property
+    def redis_key(self) -> str:
+        return f"translation:{self.engine}:{self.source_language}:{self.target_language}:{self.text_hash}"
+
+
+@dataclass
+class CachedTranslation:
+    translated_text: str
+    engine: str
+
+
+class TranslationCache(ABC):
+    @abstractmethod
+    def get_many(self, keys: list[TranslationCacheKey]) -> dict[TranslationCacheKey, CachedTranslation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_many(self, entries: dict[TranslationCacheKey, CachedTranslation]) -> None:
+        raise NotImplementedError
+
+    def prune(self) -> int:
+        return 0
+
+
+class RedisTranslationCache(TranslationCache):
+    # Every hit slides the TTL forward; size is bounded by the LRU policy of the dedicated cache instance.
+    def __init__(self, ttl_seconds: int) -> None:
+        self.ttl_seconds = ttl_seconds
+
+    def get_many(self, keys: list[TranslationCacheKey]) -> dict[TranslationCacheKey, CachedTranslation]:
+        if not keys:
+            return {}
+        try:
+            with get_cache_redis().pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.getex(key.redis_key, ex=self.ttl_seconds)
+                values = pipe.execute()
+        except RedisError as exc:
+            # A cache outage costs provider calls, never the job.
+            logger.warning("translation_cache.unavailable", extra={"error": str(exc)})
+            return {}
+        found = {}
+        for key, raw in zip(keys, values):
+            if raw is not None:
+                payload = json.loads(raw)
+                found[key] = CachedTranslation(translated_text=payload["text"], engine=payload["engine"])
+        return found
+
+    def set_many(self, entries: dict[TranslationCacheKey, CachedTranslation]) -> None:
+        if not entries:
+            return
+        try:
+            with get_cache_redis().pipeline(transaction=False) as pipe:
+                for key, entry in entries.items():
+                    pipe.set(key.redis_key, json.dumps({"text": entry.translated_text, "engine": entry.engine}), ex=self.ttl_seconds)
+                pipe.execute()
+        except RedisError as exc:
+            logger.warning("translation_cache.unavailable", extra={"error": str(exc)})
+
+
+class DatabaseTranslationCache(TranslationCache):
+    def __init__(self, ttl_seconds: int, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    def get_many(self, keys: list[TranslationCacheKey]) -> dict[TranslationCacheKey, CachedTranslation]:
+        if not keys:
+            return {}
+        wanted = set(keys)
+        rows = TranslationCacheEntry.objects.filter(
+            text_hash__in={key.text_hash for key in keys},
+            source_language__in={key.source_language for key in keys},
+            target_language__in={key.target_language for key in keys},
+            engine__in={key.engine for key in keys},
+        ).values_list("id", "text_hash", "source_language", "target_language", "engine", "translated_text", "response_engine")
+
+        found = {}
+        hit_ids = []
+        for entry_id, text_hash, source_language, target_language, engine, translated_text, response_engine in rows:
+            key = TranslationCacheKey(text_hash, source_language, target_language, engine)
+            if key in wanted:
+                found[key] = CachedTranslation(translated_text=translated_text, engine=response_engine)
+                hit_ids.append(entry_id)
+        if hit_ids:
+            TranslationCacheEntry.objects.filter(id__in=hit_ids).update(last_used_at=timezone.now(), hit_count=F("hit_count") + 1)
+        return found
+
+    def set_many(self, entries: dict[TranslationCacheKey, CachedTranslation]) -> None:
+        TranslationCacheEntry.objects.bulk_create(
+            [
+                TranslationCacheEntry(
+                    text_hash=key.text_hash,
+                    source_language=key.source_language,
+                    target_language=key.target_language,
+                    engine=key.engine,
+                    translated_text=entry.translated_text,
+                    response_engine=entry.engine,
+                )
+                for key, entry in entries.items()
+            ],
+            ignore_conflicts=True,
+        )
+
+    def prune(self) -> int:
+        deleted, _ = TranslationCacheEntry.objects.filter(last_used_at__lt=timezone.now() - timedelta(seconds=self.ttl_seconds)).delete()
+        if self.max_entries:
+            cutoff = (
+                TranslationCacheEntry.objects.order_by("-last_used_at")
+                .values_list("last_used_at", flat=True)[self.max_entries : self.max_entries + 1]
+                .first()
+            )
+            if cutoff is not None:
+                evicted, _ = TranslationCacheEntry.objects.filter(last_used_at__lte=cutoff).delete()
+                deleted += evicted
+        logger.info("translation_cache.pruned", extra={"deleted": deleted})
+        return deleted
+
+
+def build_translation_cache() -> TranslationCache | None:
+    backend = settings.TRANSLATION_CACHE_BACKEND
+    if backend in ("", "none"):
+        return None
+    if backend == "redis":
+        return RedisTranslationCache(ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS)
+    if backend == "database":
+        return DatabaseTranslationCache(
+            ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS,
+            max_entries=settings.TRANSLATION_CACHE_MAX_ENTRIES,
+        )
+    raise ImproperlyConfigured(f"Unsupported translation cache backend: {backend}")
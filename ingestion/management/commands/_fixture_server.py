@@ -0,0 +1,51 @@
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator
+
+SYNTHETIC_PARAGRAPH = (
+    "<p>Member States shall ensure that the competent authorities supervise compliance with Article {index} "
+    "of regulation {token} and the delegated acts adopted under it.</p>"
+)
+
+
+def regulation_page(token: str, paragraphs: int = 40) -> str:
+    body = "".join(SYNTHETIC_PARAGRAPH.format(index=index, token=token) for index in range(paragraphs))
+    return (
+        f"<html lang='en'><head><title>Regulation {token}</title></head><body>"
+        f"<header><nav><a href='/'>Home</a></nav></header><main><h1>Regulation {token}</h1>{body}</main>"
+        "<footer>Legal notice</footer></body></html>"
+    )
+
+
+@contextmanager
+def serve_pages(resolve: Callable[[str], str | None], latency_ms: float = 0) -> Iterator[str]:
+    # Serves HTML from `resolve(path)` on an ephemeral localhost port; unknown paths (robots.txt included) are 404s.
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            html = resolve(self.path)
+            if html is None:
+                self.send_error(404)
+                return
+            body = html.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
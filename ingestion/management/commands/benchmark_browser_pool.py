@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ingestion.infrastructure.browser_pool import BrowserPool
+from ingestion.infrastructure.page_loading import PageLoadProfile, PageLoadStrategy
+from ingestion.infrastructure.scraper import PlaywrightScraperService
+
+from ._fixture_server import regulation_page, serve_pages
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare pages/minute for Playwright renders from a long-lived browser pool against launching Chromium per "
+        "URL, using a local fixture HTTP server."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", type=int, default=30)
+        parser.add_argument("--pool-size", type=int, default=1)
+        parser.add_argument("--max-pages-per-browser", type=int, default=100)
+        parser.add_argument("--latency-ms", type=float, default=0, help="Simulated server latency per request")
+
+    def handle(self, *args, **options):
+        # Readiness polling is identical in both modes, so it is switched off to isolate browser startup cost.
+        page_loader = PageLoadStrategy(default=PageLoadProfile(wait_for_stable_content=False))
+        with serve_pages(lambda path: regulation_page(path.strip("/")), latency_ms=options["latency_ms"]) as base_url:
+            urls = [f"{base_url}/doc-{index}" for index in range(options["pages"])]
+            self.stdout.write(f"{len(urls)} pages from {base_url}")
+            self.stdout.write(f"{'mode':<10} {'seconds':>8} {'pages/min':>10} {'speedup':>8}")
+
+            pool = BrowserPool(size=options["pool_size"], max_pages_per_browser=options["max_pages_per_browser"])
+            try:
+                pooled = self._run(urls, page_loader, pool)
+            finally:
+                pool.close()
+            per_call = self._run(urls, page_loader, None)
+
+        for mode, elapsed in (("per_call", per_call), ("pooled", pooled)):
+            rate = len(urls) / elapsed * 60 if elapsed else 0.0
+            self.stdout.write(f"{mode:<10} {elapsed:>8.2f} {rate:>10.1f} {per_call / elapsed:>7.2f}x")
+
+    def _run(self, urls: list[str], page_loader: PageLoadStrategy, pool: BrowserPool | None) -> float:
+        start = time.perf_counter()
+        for url in urls:
+            if pool is not None:
+                PlaywrightScraperService(browser_pool=pool, page_loader=page_loader).scrape_url(url)
+                continue
+            # The pre-pool behavior: a fresh Playwright driver and Chromium process for every URL.
+            launched = BrowserPool(size=1, max_pages_per_browser=1)
+            try:
+                PlaywrightScraperService(browser_pool=launched, page_loader=page_loader).scrape_url(url)
+            finally:
+                launched.close()
+        return time.perf_counter() - start
@@ -0,0 +1,121 @@
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ingestion.infrastructure.extraction import available_extractors, get_text_extractor
+
+SYNTHETIC_ARTICLE = (
+    "<section><h2>Article {index}</h2><p>Member States shall ensure that the competent authorities "
+    "supervise compliance with paragraph {index} &amp; the delegated acts adopted under it.</p>"
+    "<ul><li>point (a) of subparagraph 1</li><li>point (b) of subparagraph 2</li></ul>"
+    "<table><tr><td>Annex {index}</td><td>Threshold: 5 %</td></tr></table></section>"
+)
+
+
+# Shapes where a streaming parser most easily drifts from bs4; always checked for parity, never timed.
+PARITY_PAGES = {
+    "parity:no_main": "<html><head><title>Title</title></head><body><p>Body text</p></body></html>",
+    "parity:no_body": "<title>Title</title><p>Body text</p>",
+    "parity:article": "<body><nav>Menu</nav><article><h1>Heading</h1><p>Text &amp; more</p></article></body>",
+    "parity:comments": "<body><main><p>before<!-- note -->after</p><script>var x = '<p>';</script></main></body>",
+    "parity:after_body": "<html><body><main><p>Main</p></main></body><p>Trailing</p></html>",
+    "parity:template": "<body><main><p>Shown</p><template><p>Hidden</p></template><p>Also shown</p></main></body>",
+    "parity:main_in_template": "<body><template><main><p>Hidden</p></main></template><p>Shown</p></body>",
+    "parity:ruby": "<body><p><ruby>法<rp>(</rp><rt>hō</rt><rp>)</rp></ruby> text</p></body>",
+    "parity:unclosed": "<body><p><ruby>法<rt>hō</ruby> after</p><main><p>a<br>b</br></p></span></main></body>",
+    "parity:nested_main": "<main>Outer<main>Inner</main>After</main><main>Second</main>",
+}
+
+
+def synthetic_page(target_mb: float) -> str:
+    head = "<html lang='en'><head><style>body{margin:0}</style><script>window.x=1;</script></head><body>"
+    chrome = "<header><nav><a href='/'>Home</a><a href='/search'>Search</a></nav></header>"
+    articles = []
+    size, index = 0, 0
+    while size < target_mb * 1024 * 1024:
+        article = SYNTHETIC_ARTICLE.format(index=index)
+        articles.append(article)
+        size += len(article)
+        index += 1
+    return f"{head}{chrome}<main>{''.join(articles)}</main><footer>Legal notice</footer></body></html>"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the HTML-to-text extraction backends (throughput, peak memory) and fail if any backend's output "
+        "differs from bs4."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="*", help="HTML files or directories of *.html fixture pages")
+        parser.add_argument("--synthetic-mb", type=float, default=0, help="Add a generated page of this size")
+        parser.add_argument("--backend", action="append", dest="backends", help="Limit to these backends")
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        corpus = self._load_corpus(options["paths"])
+        if options["synthetic_mb"]:
+            corpus.append(("synthetic", synthetic_page(options["synthetic_mb"])))
+        if not corpus:
+            raise CommandError("Provide fixture paths or --synthetic-mb")
+
+        backends = options["backends"] or available_extractors()
+        total_mb = sum(len(html.encode("utf-8")) for _, html in corpus) / (1024 * 1024)
+        self.stdout.write(f"{len(corpus)} pages, {total_mb:.2f} MB, {options['repeat']} runs per backend")
+        parity_corpus = corpus + list(PARITY_PAGES.items())
+        reference = [get_text_extractor("bs4").extract(html) for _, html in parity_corpus]
+        mismatched_backends = []
+
+        for name in backends:
+            extractor = get_text_extractor(name)
+            best = float("inf")
+            for _ in range(max(1, options["repeat"])):
+                start = time.perf_counter()
+                outputs = [extractor.extract(html) for _, html in corpus]
+                best = min(best, time.perf_counter() - start)
+
+            tracemalloc.start()
+            for _, html in corpus:
+                extractor.extract(html)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            outputs += [extractor.extract(html) for html in PARITY_PAGES.values()]
+            mismatches = [
+                (page, output, expected)
+                for (page, _), output, expected in zip(parity_corpus, outputs, reference)
+                if output != expected
+            ]
+            self.stdout.write(
+                f"{name:<10} {total_mb / best:8.2f} MB/s  peak {peak / (1024 * 1024):8.1f} MB  "
+                f"matches bs4 on {len(parity_corpus) - len(mismatches)}/{len(parity_corpus)} pages"
+            )
+            for page, output, expected in mismatches:
+                self.stdout.write(f"  {page}: {self._first_difference(output, expected)}")
+            if mismatches:
+                mismatched_backends.append(name)
+
+        # Cleaned text feeds content hashes, chunk boundaries and cache keys, so any drift from bs4 is a failure.
+        if mismatched_backends:
+            raise CommandError(f"Output differs from bs4 for: {', '.join(mismatched_backends)}")
+
+    def _first_difference(self, output: str, expected: str) -> str:
+        output_lines, expected_lines = output.split("\n"), expected.split("\n")
+        for index, (got, want) in enumerate(zip(output_lines, expected_lines)):
+            if got != want:
+                return f"line {index + 1}: got {got[:60]!r}, bs4 {want[:60]!r}"
+        return f"{len(output_lines)} lines, bs4 {len(expected_lines)} lines"
+
+    def _load_corpus(self, paths: list[str]) -> list[tuple[str, str]]:
+        corpus = []
+        for raw_path in paths:
+            path = Path(raw_path)
+            files = sorted(path.glob("*.html")) if path.is_dir() else [path]
+            for file in files:
+                try:
+                    corpus.append((file.name, file.read_text(encoding="utf-8", errors="replace")))
+                except OSError as exc:
+                    raise CommandError(str(exc)) from exc
+        return corpus
@@ -0,0 +1,81 @@
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ingestion.infrastructure.browser_pool import BrowserPool
+from ingestion.infrastructure.scraper import PlaywrightScraperService, StaticHttpFetcher, TieredScraperService
+
+from ._fixture_server import regulation_page, serve_pages
+
+# One page per escalation heuristic next to plain server-rendered pages, which make up most of what we ingest.
+BUILTIN_PAGES = {
+    "spa_root.html": "<html><body><div id='root'></div><script>document.getElementById('root').innerHTML = "
+    "'<main><p>' + 'Rendered client side. '.repeat(40) + '</p></main>';</script></body></html>",
+    "noscript.html": "<html><body><noscript>Please enable JavaScript to view this regulation.</noscript>"
+    "<main><p>Loading…</p></main></body></html>",
+    "empty_main.html": "<html><body><header>Regulator</header><main>  </main><footer>Legal notice</footer></body></html>",
+    "thin_text.html": "<html><body><main><p>See the consolidated version.</p></main></body></html>",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the static-first tiered scraper and the browser-only scraper over local fixture pages and report how "
+        "many pages escalated to Playwright, and why, and the latency saved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="*", help="HTML files or directories of *.html fixture pages")
+        parser.add_argument("--static-pages", type=int, default=16, help="Generated server-rendered pages to add")
+        parser.add_argument("--latency-ms", type=float, default=0, help="Simulated server latency per request")
+
+    def handle(self, *args, **options):
+        pages = dict(BUILTIN_PAGES)
+        pages.update(self._load_corpus(options["paths"]))
+        for index in range(options["static_pages"]):
+            pages[f"static-{index}.html"] = regulation_page(f"static-{index}")
+
+        pool = BrowserPool(size=1)
+        browser_scraper = PlaywrightScraperService(browser_pool=pool)
+        tiered_scraper = TieredScraperService(browser_scraper=browser_scraper, static_fetcher=StaticHttpFetcher())
+        try:
+            with serve_pages(lambda path: pages.get(path.lstrip("/")), latency_ms=options["latency_ms"]) as base_url:
+                urls = [f"{base_url}/{name}" for name in pages]
+                # Warm the browser so neither pass pays Chromium startup.
+                browser_scraper.scrape_url(urls[0])
+                tiered_seconds, reasons = self._run(tiered_scraper, urls)
+                browser_seconds, _ = self._run(browser_scraper, urls)
+        finally:
+            pool.close()
+
+        escalated = sum(count for (mode, _), count in reasons.items() if mode == "browser")
+        self.stdout.write(f"{len(urls)} pages, {escalated} escalated to Playwright")
+        for (mode, reason), count in sorted(reasons.items()):
+            self.stdout.write(f"  {mode:<8} {reason:<32} {count:>4}")
+        saved = browser_seconds - tiered_seconds
+        self.stdout.write(
+            f"browser only {browser_seconds:.2f}s, tiered {tiered_seconds:.2f}s, saved {saved:.2f}s "
+            f"({saved / len(urls) * 1000:.0f} ms per page)"
+        )
+
+    def _run(self, scraper, urls: list[str]) -> tuple[float, Counter]:
+        reasons: Counter = Counter()
+        start = time.perf_counter()
+        for url in urls:
+            result = scraper.scrape_url(url)
+            reasons[(result.fetch_mode, result.fetch_reason or "-")] += 1
+        return time.perf_counter() - start, reasons
+
+    def _load_corpus(self, paths: list[str]) -> dict[str, str]:
+        corpus = {}
+        for raw_path in paths:
+            path = Path(raw_path)
+            files = sorted(path.glob("*.html")) if path.is_dir() else [path]
+            for file in files:
+                try:
+                    corpus[file.name] = file.read_text(encoding="utf-8", errors="replace")
+                except OSError as exc:
+                    raise CommandError(str(exc)) from exc
+        return corpus
@@ -0,0 +1,95 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from ingestion.application.audit_writer import AuditWriter
+from ingestion.application.job_service import JobApplicationService
+from ingestion.application.metrics_service import JobMetricsService, JobTransition
+from ingestion.domain.models import Job, JobAuditEvent, JobStatus
+
+BENCHMARK_URL = "https://benchmark.invalid/job-writes/{}"
+MODES = ("per_row", "coalesced", "batched")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure job status/audit write throughput (jobs/sec) against the configured Postgres. Compares the "
+        "fetch-then-save path, coalesced audit writes and batched status updates. Use a local database: benchmark "
+        "jobs are created and deleted, and their rollup counts are reverted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=2000)
+        parser.add_argument("--batch-size", type=int, default=100, help="Jobs per UPDATE in batched mode")
+        parser.add_argument("--modes", default=",".join(MODES))
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("benchmark_job_writes needs Postgres")
+        modes = [mode.strip() for mode in options["modes"].split(",") if mode.strip()]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f"Unknown modes: {', '.join(sorted(unknown))}")
+
+        metrics = JobMetricsService()
+        baseline = None
+        self.stdout.write(f"{'mode':<10} {'jobs':>6} {'seconds':>8} {'jobs/s':>9} {'speedup':>8}")
+        for mode in modes:
+            jobs = Job.objects.bulk_create([Job(url=BENCHMARK_URL.format(index)) for index in range(options["jobs"])])
+            metrics.record_created(jobs)
+            job_ids = [job.id for job in jobs]
+            try:
+                start = time.perf_counter()
+                getattr(self, f"_run_{mode}")(job_ids, options["batch_size"])
+                elapsed = time.perf_counter() - start
+            finally:
+                JobApplicationService().delete_jobs(job_ids)
+            rate = len(job_ids) / elapsed if elapsed else 0.0
+            baseline = baseline or rate
+            self.stdout.write(f"{mode:<10} {len(job_ids):>6} {elapsed:>8.2f} {rate:>9.1f} {rate / baseline:>7.2f}x")
+
+    def _run_per_row(self, job_ids: list[int], batch_size: int) -> None:
+        # The pre-coalescing write path: fetch, save, audit insert and rollup upsert per transition.
+        metrics = JobMetricsService()
+        for job_id in job_ids:
+            for status in (JobStatus.RUNNING, JobStatus.COMPLETED):
+                job = Job.objects.get(id=job_id)
+                old_status, old_completed_at = job.status, job.completed_at
+                job.status = status
+                if status == JobStatus.COMPLETED:
+                    job.completed_at = timezone.now()
+                job.save(update_fields=["status", "completed_at"])
+                JobAuditEvent.objects.create(job=job, stage=status, detail="benchmark")
+                metrics.record_transitions(
+                    [
+                        JobTransition(
+                            created_at=job.created_at,
+                            old_status=old_status,
+                            new_status=job.status,
+                            old_completed_at=old_completed_at,
+                            new_completed_at=job.completed_at,
+                        )
+                    ]
+                )
+
+    def _run_coalesced(self, job_ids: list[int], batch_size: int) -> None:
+        service = self._service()
+        for job_id in job_ids:
+            service.update_status(job_id, JobStatus.RUNNING, detail="benchmark")
+            service.update_status(job_id, JobStatus.COMPLETED, detail="benchmark")
+        service.audit.flush()
+
+    def _run_batched(self, job_ids: list[int], batch_size: int) -> None:
+        service = self._service()
+        for offset in range(0, len(job_ids), batch_size):
+            batch = job_ids[offset : offset + batch_size]
+            service.transition(batch, JobStatus.RUNNING, detail="benchmark")
+            service.transition(batch, JobStatus.COMPLETED, detail="benchmark")
+        service.audit.flush()
+
+    def _service(self) -> JobApplicationService:
+        service = JobApplicationService()
+        service.audit = AuditWriter(buffered=True)
+        return service
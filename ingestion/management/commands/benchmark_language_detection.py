@@ -0,0 +1,52 @@
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ingestion.infrastructure.language_detection import get_language_detector
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parents[2] / "infrastructure" / "language_data" / "benchmark.jsonl"
+
+
+class Command(BaseCommand):
+    help = "Report accuracy and throughput of the n-gram language detector on a labelled JSONL fixture set."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default=str(DEFAULT_FIXTURES), help="JSONL records with 'language' and 'text'")
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], encoding="utf-8") as handle:
+                samples = [json.loads(line) for line in handle if line.strip()]
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+        if not samples:
+            raise CommandError("No samples found")
+
+        detector = get_language_detector()
+        totals: Counter = Counter()
+        correct: Counter = Counter()
+        for sample in samples:
+            guess = detector.detect(sample["text"])
+            totals[sample["language"]] += 1
+            if guess.language == sample["language"]:
+                correct[sample["language"]] += 1
+            else:
+                self.stderr.write(f"{sample['language']} -> {guess.language} ({guess.confidence:.3f}): {sample['text'][:60]}")
+
+        for language in sorted(totals):
+            self.stdout.write(f"{language}: {correct[language]}/{totals[language]}")
+        self.stdout.write(f"accuracy: {sum(correct.values()) / len(samples):.1%} over {len(samples)} samples")
+
+        chars = sum(min(len(sample["text"]), detector.sample_chars) for sample in samples) * options["repeat"]
+        start = time.perf_counter()
+        for _ in range(options["repeat"]):
+            for sample in samples:
+                detector.detect(sample["text"])
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"throughput: {len(samples) * options['repeat'] / elapsed:.0f} samples/s, {chars / elapsed / 1024:.0f} KB/s"
+        )
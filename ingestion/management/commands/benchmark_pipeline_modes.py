@@ -0,0 +1,70 @@
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from ingestion.application.job_service import JobApplicationService
+from ingestion.domain.models import Job, JobStatus
+from ingestion.tasks import pipeline_workflow
+from reg_ingestion.celery import app
+
+from ._fixture_server import regulation_page, serve_pages
+
+MODES = ("chained", "fused")
+FINISHED = (JobStatus.COMPLETED, JobStatus.FAILED)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure end-to-end latency per job for the chained and fused pipeline modes against a local fixture server. "
+        "Tasks run eagerly in process by default; --broker dispatches through the configured broker to workers running "
+        "on this host, since the fixture server listens on 127.0.0.1. Needs Postgres and S3 like a real run. Benchmark "
+        "jobs are deleted and their rollup counts reverted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=20)
+        parser.add_argument("--modes", default=",".join(MODES))
+        parser.add_argument("--broker", action="store_true", help="Dispatch through the broker instead of eagerly")
+        parser.add_argument("--timeout", type=float, default=300, help="Seconds to wait for one job with --broker")
+
+    def handle(self, *args, **options):
+        modes = [mode.strip() for mode in options["modes"].split(",") if mode.strip()]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f"Unknown modes: {', '.join(sorted(unknown))}")
+        if not options["broker"]:
+            app.conf.task_always_eager = True
+
+        run_id = uuid.uuid4().hex[:8]
+        # Every page is unique per mode and job, so neither mode is served from the other's translation or summary caches.
+        with serve_pages(lambda path: regulation_page(path.strip("/"))) as base_url:
+            self.stdout.write(f"{'mode':<8} {'jobs':>5} {'failed':>6} {'mean s':>7} {'p50 s':>7} {'p95 s':>7}")
+            for mode in modes:
+                urls = [f"{base_url}/{run_id}-{mode}-{index}" for index in range(options["jobs"])]
+                job_ids = JobApplicationService().submit_bulk(urls).job_ids
+                try:
+                    with override_settings(SCRAPER_HOST_MIN_INTERVAL_SECONDS=0):
+                        latencies = [self._run_job(job_id, mode, options) for job_id in job_ids]
+                    failed = Job.objects.filter(id__in=job_ids, status=JobStatus.FAILED).count()
+                finally:
+                    JobApplicationService().delete_jobs(job_ids)
+                latencies.sort()
+                p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+                self.stdout.write(
+                    f"{mode:<8} {len(job_ids):>5} {failed:>6} {statistics.fmean(latencies):>7.2f} "
+                    f"{statistics.median(latencies):>7.2f} {p95:>7.2f}"
+                )
+
+    def _run_job(self, job_id: int, mode: str, options: dict) -> float:
+        start = time.perf_counter()
+        pipeline_workflow(job_id, mode).delay()
+        if options["broker"]:
+            deadline = start + options["timeout"]
+            while Job.objects.filter(id=job_id).values_list("status", flat=True).get() not in FINISHED:
+                if time.perf_counter() > deadline:
+                    raise CommandError(f"Job {job_id} did not finish within {options['timeout']}s")
+                time.sleep(0.05)
+        return time.perf_counter() - start
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ingestion.infrastructure.translation import DummyTranslationService
+
+SAMPLE_CHUNK = (
+    "Die zuständigen Behörden überwachen die Einhaltung der Anforderungen nach Absatz {index} "
+    "und der auf seiner Grundlage erlassenen delegierten Rechtsakte."
+)
+
+
+class Command(BaseCommand):
+    help = "Measure documents per second through the batched translation path against an injected-latency dummy vendor."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--documents", type=int, default=20)
+        parser.add_argument("--chunks-per-document", type=int, default=50)
+        parser.add_argument("--latency-ms", type=float, default=150.0, help="Simulated round trip per vendor request")
+        parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of vendor requests that fail transiently")
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument("--batch-sizes", default="1,8,32,64")
+
+    def handle(self, *args, **options):
+        documents = [
+            [SAMPLE_CHUNK.format(index=f"{document}.{chunk}") for chunk in range(options["chunks_per_document"])]
+            for document in range(options["documents"])
+        ]
+        self.stdout.write(
+            f"{options['documents']} documents x {options['chunks_per_document']} chunks, "
+            f"{options['latency_ms']:.0f} ms per request, concurrency {options['concurrency']}"
+        )
+        for batch_size in (int(size) for size in options["batch_sizes"].split(",")):
+            translator = DummyTranslationService(
+                latency_seconds=options["latency_ms"] / 1000,
+                failure_rate=options["failure_rate"],
+                max_batch_items=batch_size,
+                max_batch_tokens=batch_size * 1000,
+                max_concurrency=options["concurrency"],
+                retry_backoff_seconds=0.05,
+            )
+            start = time.perf_counter()
+            for chunks in documents:
+                translator.translate_many(chunks, "de")
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f"batch {batch_size:>4}: {len(documents) / elapsed:8.2f} documents/s ({elapsed:.2f}s)")
@@ -0,0 +1,83 @@
+import resource
+import time
+import tracemalloc
+import uuid
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ingestion.infrastructure.storage import S3StorageService, build_s3_client
+
+from .benchmark_extractors import synthetic_page
+
+MODES = ("single_put", "streaming", "background")
+
+
+class Command(BaseCommand):
+    help = (
+        "Upload large synthetic HTML artifacts to the configured S3-compatible endpoint (point AWS_S3_ENDPOINT_URL at "
+        "MinIO or moto) and report duration, caller blocking time and peak Python allocations per upload path."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes-mb", default="1,16,64")
+        parser.add_argument("--modes", default=",".join(MODES))
+        parser.add_argument("--compression", choices=("", "gzip", "zstd"), default=None)
+
+    def handle(self, *args, **options):
+        if not settings.AWS_S3_ENDPOINT_URL:
+            raise CommandError("Set AWS_S3_ENDPOINT_URL to a local S3 stand-in; the benchmark writes and deletes objects")
+        modes = [mode.strip() for mode in options["modes"].split(",") if mode.strip()]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f"Unknown modes: {', '.join(sorted(unknown))}")
+
+        client = build_s3_client()
+        self._ensure_bucket(client)
+        storage = S3StorageService(compression=options["compression"], client=client)
+        self.stdout.write(f"{'mode':<11} {'MB':>6} {'seconds':>8} {'blocked':>8} {'peak MB':>8}")
+        for size_mb in (float(size) for size in options["sizes_mb"].split(",")):
+            for mode in modes:
+                # A unique marker defeats content-addressed deduplication, so every run really uploads.
+                html = synthetic_page(size_mb).replace("<body>", f"<body><!-- {uuid.uuid4()} -->", 1)
+                tracemalloc.start()
+                start = time.perf_counter()
+                key, blocked = getattr(self, f"_run_{mode}")(storage, html)
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                client.delete_object(Bucket=storage.bucket, Key=key)
+                self.stdout.write(
+                    f"{mode:<11} {len(html) / (1024 * 1024):>6.1f} {elapsed:>8.2f} {blocked:>8.2f} {peak / (1024 * 1024):>8.1f}"
+                )
+        max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        self.stdout.write(f"process max RSS {max_rss_mb:.0f} MB")
+
+    def _run_single_put(self, storage: S3StorageService, html: str) -> tuple[str, float]:
+        # The pre-streaming path: one full encoded copy and a synchronous put_object.
+        start = time.perf_counter()
+        _, key = storage._locate(html)
+        storage._client.put_object(Bucket=storage.bucket, Key=key, Body=html.encode("utf-8"), ContentType="text/html; charset=utf-8")
+        return key, time.perf_counter() - start
+
+    def _run_streaming(self, storage: S3StorageService, html: str) -> tuple[str, float]:
+        start = time.perf_counter()
+        artifact = storage.upload_html(html, job_id=0)
+        return self._key(storage, artifact.uri), time.perf_counter() - start
+
+    def _run_background(self, storage: S3StorageService, html: str) -> tuple[str, float]:
+        start = time.perf_counter()
+        artifact = storage.upload_html_in_background(html, job_id=0)
+        blocked = time.perf_counter() - start
+        storage.flush()
+        return self._key(storage, artifact.uri), blocked
+
+    def _key(self, storage: S3StorageService, uri: str) -> str:
+        return uri.removeprefix(f"s3://{storage.bucket}/")
+
+    def _ensure_bucket(self, client) -> None:
+        try:
+            client.head_bucket(Bucket=settings.AWS_S3_BUCKET)
+        except ClientError:
+            client.create_bucket(Bucket=settings.AWS_S3_BUCKET)
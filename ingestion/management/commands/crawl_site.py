@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ingestion.application.crawl_service import CrawlApplicationService
+from ingestion.tasks import dispatch_crawl_expansion
+
+
+class Command(BaseCommand):
+    help = "Start a crawl from a seed page or sitemap.xml; discovered pages become ingestion jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("url", help="Seed page, sitemap.xml, sitemap index or .xml.gz")
+        parser.add_argument("--sitemap", action="store_true", help="Treat the URL as a sitemap (implied for *.xml / *.xml.gz)")
+        parser.add_argument("--path-prefix", default="", help="Only follow URLs whose path starts with this prefix")
+        parser.add_argument("--any-host", action="store_true", help="Follow links to other hosts")
+        parser.add_argument("--max-depth", type=int, help="Link hops to follow from seed pages")
+        parser.add_argument("--max-pages", type=int, help="Upper bound on jobs created by the crawl")
+
+    def handle(self, *args, **options):
+        url = options["url"]
+        sitemap = options["sitemap"] or url.lower().split("?", 1)[0].endswith((".xml", ".xml.gz"))
+        try:
+            crawl, expansion = CrawlApplicationService().start(
+                url,
+                sitemap=sitemap,
+                same_host=not options["any_host"],
+                path_prefix=options["path_prefix"],
+                max_depth=options["max_depth"],
+                max_pages=options["max_pages"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        dispatch_crawl_expansion(crawl.id, expansion)
+        self.stdout.write(self.style.SUCCESS(f"Started crawl #{crawl.id} ({'sitemap' if sitemap else 'links'}, max {crawl.max_pages} pages)"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from ingestion.infrastructure.translation_cache import build_translation_cache
+
+
+class Command(BaseCommand):
+    help = "Evict expired and least recently used entries from the translation cache."
+
+    def handle(self, *args, **options):
+        cache = build_translation_cache()
+        if cache is None:
+            self.stdout.write("Translation cache is disabled")
+            return
+        deleted = cache.prune()
+        self.stdout.write(self.style.SUCCESS(f"Evicted {deleted} translation cache entries"))
@@ -0,0 +1,71 @@
+import logging
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ingestion.application.audit_writer import configure_audit_writer
+from ingestion.application.job_queue import LeaseHeartbeat, PostgresJobQueue
+from ingestion.application.job_service import JobApplicationService
+from ingestion.application.pipeline_service import RegulatoryPipelineService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Process PENDING jobs by claiming them from Postgres (FOR UPDATE SKIP LOCKED) instead of Celery."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=settings.JOB_QUEUE_BATCH_SIZE)
+        parser.add_argument("--poll-seconds", type=float, default=settings.JOB_QUEUE_POLL_SECONDS)
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit")
+
+    def handle(self, *args, **options):
+        audit = configure_audit_writer(buffered=settings.AUDIT_WRITE_BUFFERING)
+        queue = PostgresJobQueue()
+        pipeline = RegulatoryPipelineService()
+        job_service = JobApplicationService()
+        heartbeat = LeaseHeartbeat(queue)
+        heartbeat.start()
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        processed = 0
+        next_recovery = 0.0
+        try:
+            while not self._stopping:
+                if time.monotonic() >= next_recovery:
+                    queue.recover_expired()
+                    next_recovery = time.monotonic() + queue.lease_seconds / 2
+                job_ids = queue.claim(options["batch_size"])
+                if not job_ids:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_seconds"])
+                    continue
+                for index, job_id in enumerate(job_ids):
+                    if self._stopping:
+                        # Unstarted jobs go straight back to PENDING rather than waiting for their lease to expire.
+                        queue.release(job_ids[index:])
+                        break
+                    try:
+                        # This process only runs queue jobs, so waiting out the host's crawl delay here is fine.
+                        time.sleep(pipeline.throttle_delay(job_id))
+                        pipeline.run(job_id)
+                    except Exception as exc:
+                        logger.exception("job_queue.job.failed", extra={"job_id": job_id})
+                        job_service.fail_job(job_id, str(exc))
+                    finally:
+                        # Discovered crawl jobs are already PENDING rows, i.e. already queued.
+                        pipeline.discovered_job_ids.clear()
+                        audit.flush()
+                    processed += 1
+        finally:
+            heartbeat.stop()
+            audit.flush()
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} jobs"))
+
+    def _request_stop(self, signum, frame) -> None:
+        self._stopping = True
@@ -0,0 +1,40 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ingestion.application.job_service import JobApplicationService
+from ingestion.application.url_sources import SUPPORTED_FORMATS, UrlSourceError, detect_format, iter_urls
+from ingestion.tasks import dispatch_jobs
+
+
+class Command(BaseCommand):
+    help = "Submit a list of URLs (txt, JSONL or CSV) as ingestion jobs in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File with one URL per line, JSONL records with a 'url' key, or CSV")
+        parser.add_argument("--format", choices=SUPPORTED_FORMATS, help="Override format detection by extension")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--no-dispatch", action="store_true", help="Create jobs without enqueuing them")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or detect_format(path)
+        try:
+            with open(path, encoding="utf-8", newline="") as handle:
+                urls = list(iter_urls(handle, fmt))
+        except (OSError, UrlSourceError, csv.Error) as exc:
+            # The whole file is parsed before any job is created, so a bad line submits nothing.
+            raise CommandError(f"{path}: {exc}") from exc
+
+        submission = JobApplicationService().submit_bulk(urls, batch_size=options["batch_size"])
+        if not options["no_dispatch"]:
+            dispatch_jobs(submission.job_ids)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {len(submission.job_ids)} jobs "
+                f"({submission.duplicates} duplicates, {len(submission.rejected)} rejected)"
+            )
+        )
+        for url in submission.rejected[:20]:
+            self.stderr.write(f"rejected: {url}")
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="fetch_mode",
+            field=models.CharField(default="browser", max_length=16),
+        ),
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="fetch_reason",
+            field=models.CharField(blank=True, max_length=128),
+        ),
+    ]
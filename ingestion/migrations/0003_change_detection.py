@@ -0,0 +1,43 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0002_scrapedcontent_fetch_mode"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="etag",
+            field=models.CharField(blank=True, max_length=256),
+        ),
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="last_modified",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="content_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="reused_from",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Earlier job whose unchanged content and results were reused",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="ingestion.job",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["url", "status"], name="idx_job_url_status"),
+        ),
+    ]
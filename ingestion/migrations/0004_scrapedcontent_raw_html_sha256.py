@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0003_change_detection"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="raw_html_sha256",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="raw_html_size",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,68 @@
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Sum
+from django.db.models.functions import TruncHour
+
+
+def backfill_rollups(apps, schema_editor):
+    Job = apps.get_model("ingestion", "Job")
+    JobMetricsRollup = apps.get_model("ingestion", "JobMetricsRollup")
+
+    buckets = defaultdict(dict)
+    status_counts = (
+        Job.objects.annotate(bucket=TruncHour("created_at")).values("bucket", "status").annotate(total=Count("id"))
+    )
+    for row in status_counts:
+        buckets[row["bucket"]][row["status"]] = row["total"]
+
+    duration = ExpressionWrapper(F("completed_at") - F("created_at"), output_field=DurationField())
+    finished = (
+        Job.objects.filter(completed_at__isnull=False)
+        .annotate(bucket=TruncHour("created_at"))
+        .values("bucket")
+        .annotate(total=Count("id"), duration_sum=Sum(duration))
+    )
+    for row in finished:
+        buckets[row["bucket"]]["finished_count"] = row["total"]
+        buckets[row["bucket"]]["duration_seconds_sum"] = row["duration_sum"].total_seconds() if row["duration_sum"] else 0.0
+
+    JobMetricsRollup.objects.bulk_create(
+        [JobMetricsRollup(bucket_start=bucket, **values) for bucket, values in buckets.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0004_scrapedcontent_raw_html_sha256"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobMetricsRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "bucket_start",
+                    models.DateTimeField(help_text="Hour in which the counted jobs were created", unique=True),
+                ),
+                ("pending", models.IntegerField(default=0)),
+                ("running", models.IntegerField(default=0)),
+                ("failed", models.IntegerField(default=0)),
+                ("completed", models.IntegerField(default=0)),
+                ("finished_count", models.IntegerField(default=0)),
+                ("duration_seconds_sum", models.FloatField(default=0.0)),
+            ],
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
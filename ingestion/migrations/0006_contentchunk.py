@@ -0,0 +1,38 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0005_jobmetricsrollup"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentChunk",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("position", models.PositiveIntegerField()),
+                ("kind", models.CharField(default="text", max_length=16)),
+                ("heading", models.CharField(blank=True, max_length=256)),
+                ("start_offset", models.PositiveIntegerField(help_text="Offset into ScrapedContent.cleaned_text")),
+                ("end_offset", models.PositiveIntegerField()),
+                ("text", models.TextField()),
+                ("text_hash", models.CharField(db_index=True, max_length=64)),
+                ("translated_text", models.TextField(blank=True)),
+                (
+                    "content",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chunks",
+                        to="ingestion.scrapedcontent",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["position"],
+                "constraints": [models.UniqueConstraint(fields=("content", "position"), name="uniq_chunk_position")],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0006_contentchunk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="translationresult",
+            name="chunk_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="translationresult",
+            name="cache_hits",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="TranslationCacheEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("text_hash", models.CharField(max_length=64)),
+                ("source_language", models.CharField(max_length=32)),
+                ("target_language", models.CharField(max_length=32)),
+                (
+                    "engine",
+                    models.CharField(help_text="Translation service that produced the entry", max_length=128),
+                ),
+                ("translated_text", models.TextField()),
+                ("response_engine", models.CharField(max_length=128)),
+                ("hit_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("last_used_at", models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("text_hash", "source_language", "target_language", "engine"),
+                        name="uniq_translation_cache_key",
+                    )
+                ],
+            },
+        ),
+    ]
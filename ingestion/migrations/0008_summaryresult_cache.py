@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0007_translation_cache"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="summaryresult",
+            name="source_hash",
+            field=models.CharField(blank=True, help_text="Hash of the summarized input text", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="summaryresult",
+            name="cached",
+            field=models.BooleanField(default=False, help_text="Served from the summary result cache"),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0008_summaryresult_cache"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contentchunk",
+            name="language",
+            field=models.CharField(blank=True, max_length=16),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0009_contentchunk_language"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="load_ms",
+            field=models.PositiveIntegerField(default=0, help_text="Browser navigation plus readiness wait"),
+        ),
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="bytes_transferred",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="scrapedcontent",
+            name="blocked_requests",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
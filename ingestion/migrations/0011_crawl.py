@@ -0,0 +1,41 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0010_scrapedcontent_page_load_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Crawl",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("seed_url", models.URLField(max_length=2048)),
+                ("sitemap", models.BooleanField(default=False, help_text="Seed URL is a sitemap or sitemap index")),
+                ("same_host", models.BooleanField(default=True)),
+                ("path_prefix", models.CharField(blank=True, max_length=512)),
+                ("max_depth", models.PositiveSmallIntegerField(default=2, help_text="Link hops followed from seed pages")),
+                ("max_pages", models.PositiveIntegerField(default=5000)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="crawl",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="jobs",
+                to="ingestion.crawl",
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="depth",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0011_crawl"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="lease_owner",
+            field=models.CharField(blank=True, help_text="Queue worker holding the job", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="lease_expires_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("status", "running")),
+                fields=["lease_expires_at"],
+                name="idx_job_running_lease",
+            ),
+        ),
+    ]
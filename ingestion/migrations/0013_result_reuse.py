@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0012_job_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="translationresult",
+            name="translator",
+            field=models.CharField(blank=True, help_text="Configured translation service", max_length=128),
+        ),
+        migrations.AddField(
+            model_name="translationresult",
+            name="target_language",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="translationresult",
+            name="reused",
+            field=models.BooleanField(default=False, help_text="Copied from the job whose content was unchanged"),
+        ),
+        migrations.AddField(
+            model_name="summaryresult",
+            name="reused",
+            field=models.BooleanField(default=False, help_text="Copied from the job whose content was unchanged"),
+        ),
+    ]
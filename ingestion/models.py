@@ -1,3 +1,13 @@
-from ingestion.domain.models import Job, JobAuditEvent, ScrapedContent, SummaryResult, TranslationResult
+from ingestion.domain.models import (
+    ContentChunk,
+    Crawl,
+    Job,
+    JobAuditEvent,
+    JobMetricsRollup,
+    ScrapedContent,
+    SummaryResult,
+    TranslationCacheEntry,
+    TranslationResult,
+)
 
-__all__ = ["Job", "ScrapedContent", "TranslationResult", "SummaryResult", "JobAuditEvent"]
+__all__ = ["Job", "ScrapedContent", "TranslationResult", "SummaryResult", "JobAuditEvent", "JobMetricsRollup", "ContentChunk", "TranslationCacheEntry", "Crawl"]
@@ -7,3 +7,22 @@ class JobSubmitForm(forms.Form):
         max_length=2048,
         widget=forms.URLInput(attrs={"class": "form-control", "placeholder": "https://example.gov/regulation"}),
     )
+
+
+class BulkJobSubmitForm(forms.Form):
+    urls = forms.CharField(
+        label="URLs (one per line)",
+        required=False,
+        widget=forms.Textarea(attrs={"class": "form-control", "rows": 10, "placeholder": "https://example.gov/regulation"}),
+    )
+    url_file = forms.FileField(
+        label="Or upload a file (.txt, .jsonl, .csv)",
+        required=False,
+        widget=forms.ClearableFileInput(attrs={"class": "form-control"}),
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get("urls") and not cleaned_data.get("url_file"):
+            raise forms.ValidationError("Provide URLs or upload a file.")
+        return cleaned_data
@@ -1,9 +1,19 @@
 from django.urls import path
 
-from ingestion.presentation.views import DashboardView, JobDetailView, JobSubmitView
+from ingestion.presentation.views import (
+    BulkJobSubmitView,
+    DashboardView,
+    JobDetailView,
+    JobSubmitView,
+    PrometheusMetricsView,
+    QueueDepthView,
+)
 
 urlpatterns = [
     path("", DashboardView.as_view(), name="dashboard"),
     path("jobs/submit/", JobSubmitView.as_view(), name="submit_job"),
+    path("jobs/submit/bulk/", BulkJobSubmitView.as_view(), name="submit_bulk"),
     path("jobs/<int:job_id>/", JobDetailView.as_view(), name="job_detail"),
+    path("metrics", PrometheusMetricsView.as_view(), name="prometheus_metrics"),
+    path("metrics/queues/", QueueDepthView.as_view(), name="queue_depths"),
 ]
@@ -1,11 +1,19 @@
+import csv
+import io
+
 from django.contrib import messages
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
 
 from ingestion.application.job_service import JobApplicationService
+from ingestion.application.url_sources import detect_format, iter_urls
 from ingestion.domain.models import Job
-from ingestion.presentation.forms import JobSubmitForm
-from ingestion.tasks import submit_job
+from ingestion.domain.urls import normalize_and_dedupe
+from ingestion.infrastructure.metrics import render_prometheus, stage_latency_summary
+from ingestion.infrastructure.queue_metrics import queue_depths
+from ingestion.presentation.forms import BulkJobSubmitForm, JobSubmitForm
+from ingestion.tasks import dispatch_bulk_submission, dispatch_jobs
 
 
 class DashboardView(View):
@@ -15,6 +23,7 @@ class DashboardView(View):
         service = JobApplicationService()
         context = {
             "metrics": service.dashboard_metrics(),
+            "stage_latency": stage_latency_summary(),
             "recent_jobs": Job.objects.order_by("-created_at")[:10],
         }
         return render(request, self.template_name, context)
@@ -33,11 +42,42 @@ class JobSubmitView(View):
 
         service = JobApplicationService()
         job = service.submit(form.cleaned_data["url"])
-        submit_job.delay(job.id)
+        dispatch_jobs([job.id])
         messages.success(request, f"Job #{job.id} submitted successfully")
         return redirect("job_detail", job_id=job.id)
 
 
+class BulkJobSubmitView(View):
+    template_name = "ingestion/submit_bulk.html"
+
+    def get(self, request):
+        return render(request, self.template_name, {"form": BulkJobSubmitForm()})
+
+    def post(self, request):
+        form = BulkJobSubmitForm(request.POST, request.FILES)
+        if not form.is_valid():
+            return render(request, self.template_name, {"form": form})
+
+        raw_urls = list(iter_urls(form.cleaned_data["urls"].splitlines()))
+        upload = form.cleaned_data["url_file"]
+        if upload:
+            lines = io.TextIOWrapper(upload.file, encoding="utf-8", errors="replace")
+            try:
+                raw_urls.extend(iter_urls(lines, detect_format(upload.name)))
+            except (ValueError, KeyError, csv.Error) as exc:
+                form.add_error("url_file", f"Could not parse file: {exc}")
+                return render(request, self.template_name, {"form": form})
+
+        urls, rejected = normalize_and_dedupe(raw_urls)
+        dispatch_bulk_submission(urls)
+        messages.success(
+            request,
+            f"Queued {len(urls)} unique URLs for ingestion ({len(rejected)} rejected, "
+            f"{len(raw_urls) - len(urls) - len(rejected)} duplicates)",
+        )
+        return redirect("dashboard")
+
+
 class JobDetailView(View):
     template_name = "ingestion/job_detail.html"
 
@@ -51,3 +91,13 @@ class JobDetailView(View):
             "audit_events": job.audit_events.order_by("-created_at")[:20],
         }
         return render(request, self.template_name, context)
+
+
+class QueueDepthView(View):
+    def get(self, request):
+        return JsonResponse({"queues": queue_depths()})
+
+
+class PrometheusMetricsView(View):
+    def get(self, request):
+        return HttpResponse(render_prometheus(queue_depths()), content_type="text/plain; version=0.0.4; charset=utf-8")
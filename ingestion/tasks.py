@@ -1,51 +1,184 @@
 import logging
+import time
 
-from celery import chain, shared_task
+from celery import Signature, Task, chain, group, shared_task
+from celery.exceptions import Ignore
+from django.conf import settings
 
+from ingestion.application.crawl_service import CrawlApplicationService, CrawlExpansion
 from ingestion.application.job_service import JobApplicationService
 from ingestion.application.pipeline_service import RegulatoryPipelineService
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, retry_kwargs={"max_retries": 3})
-def submit_job(self, job_id: int) -> str:
-    logger.info("task.submit_job", extra={"job_id": job_id})
-    workflow = chain(
-        scrape_task.s(job_id),
-        translate_task.s(),
-        summarize_task.s(),
+def get_pipeline(task_name: str) -> RegulatoryPipelineService:
+    start = time.perf_counter()
+    pipeline = RegulatoryPipelineService()
+    logger.info("task.setup", extra={"task_name": task_name, "setup_seconds": round(time.perf_counter() - start, 6)})
+    return pipeline
+
+
+def defer_if_throttled(
+    task: Task,
+    pipeline: RegulatoryPipelineService,
+    job_id: int,
+    reserved_retry: int | None,
+    not_before: float | None,
+) -> None:
+    if reserved_retry == task.request.retries:
+        # The limiter already reserved this attempt's slot when it was deferred; a failure retry takes a new one.
+        delay = (not_before or 0) - time.time()
+    else:
+        delay = pipeline.throttle_delay(job_id)
+        not_before = time.time() + delay
+    if delay <= 0:
+        return
+    # Re-publish for the reserved slot with the same chain and retry count instead of sleeping, so throttling
+    # neither blocks the worker nor eats into the failure retry budget. Long waits are covered in capped hops: an
+    # ETA message held past the broker's visibility timeout would be redelivered and scraped twice.
+    countdown = min(delay, settings.SCRAPER_THROTTLE_MAX_DEFER_SECONDS)
+    logger.info("task.throttled", extra={"job_id": job_id, "task_name": task.name, "duration_seconds": round(delay, 3)})
+    kwargs = {**task.request.kwargs, "throttle_reserved_retry": task.request.retries, "throttle_not_before": not_before}
+    task.signature_from_request(kwargs=kwargs, countdown=countdown, retries=task.request.retries).apply_async()
+    raise Ignore()
+
+
+def dispatch_jobs(job_ids: list[int]) -> None:
+    # With the Postgres dispatcher, PENDING rows are the queue; run_job_queue workers claim them directly.
+    if job_ids and settings.JOB_DISPATCHER != "postgres":
+        submit_job.chunks([(job_id,) for job_id in job_ids], settings.BULK_DISPATCH_CHUNK_SIZE).apply_async()
+
+
+def dispatch_bulk_submission(urls: list[str]) -> None:
+    batch_size = settings.BULK_SUBMIT_BATCH_SIZE
+    group(bulk_submit_task.s(urls[offset : offset + batch_size]) for offset in range(0, len(urls), batch_size)).apply_async()
+
+
+def dispatch_crawl_expansion(crawl_id: int, expansion: CrawlExpansion) -> None:
+    dispatch_jobs(expansion.job_ids)
+    for sitemap_url in expansion.sitemaps:
+        expand_sitemap_task.delay(crawl_id, sitemap_url)
+
+
+@shared_task(bind=True)
+def bulk_submit_task(self, urls: list[str]) -> int:
+    submission = JobApplicationService().submit_bulk(urls)
+    dispatch_jobs(submission.job_ids)
+    return len(submission.job_ids)
+
+
+def pipeline_workflow(job_id: int, mode: str, profile: bool = False, refresh_summary: bool = False) -> Signature:
+    if mode == "fused":
+        return run_pipeline_task.si(job_id, profile=profile, refresh_summary=refresh_summary)
+    return chain(
+        scrape_task.s(job_id, profile=profile),
+        translate_task.s(profile=profile),
+        summarize_task.s(profile=profile, refresh_summary=refresh_summary),
         complete_job.s(),
     )
-    workflow.delay()
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, retry_kwargs={"max_retries": 3})
+def submit_job(self, job_id: int, profile: bool = False, refresh_summary: bool = False) -> str:
+    logger.info("task.submit_job", extra={"job_id": job_id})
+    pipeline_workflow(job_id, settings.PIPELINE_EXECUTION_MODE, profile=profile, refresh_summary=refresh_summary).delay()
     return f"workflow_started:{job_id}"
 
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, retry_kwargs={"max_retries": 3})
-def scrape_task(self, job_id: int) -> int:
-    pipeline = RegulatoryPipelineService()
+def run_pipeline_task(
+    self,
+    job_id: int,
+    profile: bool = False,
+    refresh_summary: bool = False,
+    throttle_reserved_retry: int | None = None,
+    throttle_not_before: float | None = None,
+) -> int:
+    pipeline = get_pipeline(self.name)
     try:
-        return pipeline.scrape(job_id)
+        defer_if_throttled(self, pipeline, job_id, throttle_reserved_retry, throttle_not_before)
+        with pipeline.profiled(job_id, "pipeline", force=profile):
+            return pipeline.run(job_id, refresh_summary=refresh_summary)
+    except Ignore:
+        raise
     except Exception as exc:
         JobApplicationService().fail_job(job_id, str(exc))
         raise
+    finally:
+        dispatch_jobs(pipeline.discovered_job_ids)
 
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, retry_kwargs={"max_retries": 3})
-def translate_task(self, job_id: int) -> int:
-    pipeline = RegulatoryPipelineService()
+def scrape_task(
+    self,
+    job_id: int,
+    profile: bool = False,
+    throttle_reserved_retry: int | None = None,
+    throttle_not_before: float | None = None,
+) -> int:
+    pipeline = get_pipeline(self.name)
     try:
-        return pipeline.translate(job_id)
+        defer_if_throttled(self, pipeline, job_id, throttle_reserved_retry, throttle_not_before)
+        with pipeline.profiled(job_id, "scrape", force=profile):
+            return pipeline.scrape(job_id)
+    except Ignore:
+        raise
     except Exception as exc:
         JobApplicationService().fail_job(job_id, str(exc))
         raise
+    finally:
+        dispatch_jobs(pipeline.discovered_job_ids)
+
+
+@shared_task(bind=True)
+def scrape_batch_task(self, job_ids: list[int]) -> list[int]:
+    pipeline = get_pipeline(self.name)
+    succeeded: list[int] = []
+    failed: dict[int, str] = {}
+    try:
+        succeeded, failed = pipeline.scrape_batch(job_ids)
+    except Exception as exc:
+        failed = dict.fromkeys(job_ids, str(exc) or type(exc).__name__)
+        raise
+    finally:
+        dispatch_jobs(pipeline.discovered_job_ids)
+        # Every job was moved to RUNNING up front, so anything that did not succeed is failed here, including
+        # when the browser launch or the whole batch blew up.
+        job_service = JobApplicationService()
+        finished = set(succeeded)
+        for job_id in job_ids:
+            if job_id not in finished:
+                job_service.fail_job(job_id, failed.get(job_id, "Batch scrape did not complete"))
+    for job_id in succeeded:
+        chain(translate_task.s(job_id), summarize_task.s(), complete_job.s()).delay()
+    return succeeded
 
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, retry_kwargs={"max_retries": 3})
-def summarize_task(self, job_id: int) -> int:
-    pipeline = RegulatoryPipelineService()
+def expand_sitemap_task(self, crawl_id: int, sitemap_url: str) -> int:
+    expansion = CrawlApplicationService().expand_sitemap(crawl_id, sitemap_url)
+    dispatch_crawl_expansion(crawl_id, expansion)
+    return len(expansion.job_ids)
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, retry_kwargs={"max_retries": 3})
+def translate_task(self, job_id: int, profile: bool = False) -> int:
+    pipeline = get_pipeline(self.name)
+    try:
+        with pipeline.profiled(job_id, "translate", force=profile):
+            return pipeline.translate(job_id)
+    except Exception as exc:
+        JobApplicationService().fail_job(job_id, str(exc))
+        raise
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, retry_kwargs={"max_retries": 3})
+def summarize_task(self, job_id: int, profile: bool = False, refresh_summary: bool = False) -> int:
+    pipeline = get_pipeline(self.name)
     try:
-        return pipeline.summarize(job_id)
+        with pipeline.profiled(job_id, "summarize", force=profile):
+            return pipeline.summarize(job_id, refresh_summary=refresh_summary)
     except Exception as exc:
         JobApplicationService().fail_job(job_id, str(exc))
         raise
@@ -53,5 +186,5 @@ def summarize_task(self, job_id: int) -> int:
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_jitter=True, retry_kwargs={"max_retries": 3})
 def complete_job(self, job_id: int) -> int:
-    pipeline = RegulatoryPipelineService()
+    pipeline = get_pipeline(self.name)
     return pipeline.complete(job_id)
@@ -0,0 +1,33 @@
+from unittest import mock
+
+from celery import states
+from django.test import SimpleTestCase
+
+from ingestion.infrastructure.metrics import StageMetricsRecorder
+from reg_ingestion.celery import task_postrun_handler, task_prerun_handler
+
+
+class TaskPostrunMetricsTests(SimpleTestCase):
+    def setUp(self):
+        self.recorder = StageMetricsRecorder(flush_interval_seconds=3600)
+        patcher = mock.patch("ingestion.infrastructure.metrics.get_recorder", return_value=self.recorder)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.task = mock.Mock()
+        self.task.name = "ingestion.tasks.scrape_task"
+
+    def run_task(self, state: str) -> None:
+        task_prerun_handler(task_id="task-1", task=self.task)
+        task_postrun_handler(task_id="task-1", task=self.task, state=state)
+
+    def outcomes(self) -> dict[str, int]:
+        return {outcome: count for (_, _, outcome), count in self.recorder._events.items()}
+
+    def test_ignored_task_is_not_an_error(self):
+        self.run_task(states.IGNORED)
+        self.assertEqual(self.outcomes(), {"ignored": 1})
+        self.assertEqual(self.recorder._histograms, {})
+
+    def test_failed_task_is_an_error(self):
+        self.run_task(states.FAILURE)
+        self.assertEqual(self.outcomes(), {"error": 1})
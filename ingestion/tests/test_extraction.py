@@ -0,0 +1,30 @@
+from django.test import SimpleTestCase, override_settings
+
+from ingestion.infrastructure.extraction import (
+    BeautifulSoupTextExtractor,
+    StreamingTextExtractor,
+    available_extractors,
+    get_text_extractor,
+    iter_html_chunks,
+)
+from ingestion.management.commands.benchmark_extractors import PARITY_PAGES, synthetic_page
+
+
+class TextExtractorParityTests(SimpleTestCase):
+    def test_backends_match_bs4(self):
+        pages = {**PARITY_PAGES, "synthetic": synthetic_page(0.05)}
+        reference = BeautifulSoupTextExtractor()
+        for name in available_extractors():
+            extractor = get_text_extractor(name)
+            for page, html in pages.items():
+                with self.subTest(backend=name, page=page):
+                    self.assertEqual(extractor.extract(html), reference.extract(html))
+
+    def test_streaming_ignores_chunk_boundaries(self):
+        html = synthetic_page(0.05)
+        extractor = StreamingTextExtractor()
+        self.assertEqual(extractor.extract_stream(iter_html_chunks(html, chunk_chars=7)), extractor.extract(html))
+
+    @override_settings(SCRAPER_TEXT_EXTRACTOR="auto")
+    def test_auto_is_bs4(self):
+        self.assertEqual(get_text_extractor().name, BeautifulSoupTextExtractor.name)
@@ -0,0 +1,28 @@
+import tempfile
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from ingestion.application.url_sources import UrlSourceError, iter_urls
+
+
+class IterUrlsTests(SimpleTestCase):
+    def test_jsonl_accepts_records_and_bare_strings(self):
+        lines = ['{"url": " https://example.eu/a "}', "", "# comment", '"https://example.eu/b"']
+        self.assertEqual(list(iter_urls(lines, "jsonl")), ["https://example.eu/a", "https://example.eu/b"])
+
+    def test_jsonl_rejects_bad_lines_with_line_number(self):
+        for line in ("{not json", '{"href": "https://example.eu"}', '{"url": null}', '{"url": 42}', "17"):
+            with self.subTest(line=line), self.assertRaisesMessage(UrlSourceError, "Line 2:"):
+                list(iter_urls(['{"url": "https://example.eu/ok"}', line], "jsonl"))
+
+
+class SubmitUrlsCommandTests(SimpleTestCase):
+    def test_malformed_jsonl_fails_before_submitting(self):
+        # SimpleTestCase rejects database queries, so reaching submit_bulk would fail differently.
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "urls.jsonl"
+            path.write_text('{"url": "https://example.eu/a"}\n{"url": "https://example.eu/b"\n', encoding="utf-8")
+            with self.assertRaisesMessage(CommandError, "Line 2: invalid JSON"):
+                call_command("submit_urls", str(path), "--no-dispatch")
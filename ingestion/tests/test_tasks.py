@@ -0,0 +1,46 @@
+import time
+from unittest import mock
+
+from celery.exceptions import Ignore
+from django.test import SimpleTestCase, override_settings
+
+from ingestion.tasks import defer_if_throttled
+
+
+@override_settings(SCRAPER_THROTTLE_MAX_DEFER_SECONDS=60)
+class DeferIfThrottledTests(SimpleTestCase):
+    def setUp(self):
+        self.task = mock.Mock()
+        self.task.name = "ingestion.tasks.scrape_task"
+        self.task.request.retries = 0
+        self.task.request.kwargs = {"profile": False}
+        self.pipeline = mock.Mock()
+
+    def republished(self) -> dict:
+        return self.task.signature_from_request.call_args.kwargs
+
+    def test_long_reservation_is_deferred_in_capped_hops(self):
+        self.pipeline.throttle_delay.return_value = 3600
+        with self.assertRaises(Ignore):
+            defer_if_throttled(self.task, self.pipeline, 1, None, None)
+        republished = self.republished()
+        self.assertEqual(republished["countdown"], 60)
+        self.assertEqual(republished["kwargs"]["throttle_reserved_retry"], 0)
+        self.assertAlmostEqual(republished["kwargs"]["throttle_not_before"], time.time() + 3600, delta=5)
+
+    def test_hop_before_reserved_slot_does_not_acquire_again(self):
+        with self.assertRaises(Ignore):
+            defer_if_throttled(self.task, self.pipeline, 1, 0, time.time() + 90)
+        self.pipeline.throttle_delay.assert_not_called()
+        self.assertEqual(self.republished()["countdown"], 60)
+
+    def test_runs_once_reserved_slot_is_reached(self):
+        defer_if_throttled(self.task, self.pipeline, 1, 0, time.time() - 1)
+        self.pipeline.throttle_delay.assert_not_called()
+        self.task.signature_from_request.assert_not_called()
+
+    def test_failure_retry_acquires_a_new_slot(self):
+        self.task.request.retries = 1
+        self.pipeline.throttle_delay.return_value = 0
+        defer_if_throttled(self.task, self.pipeline, 1, 0, time.time() + 90)
+        self.pipeline.throttle_delay.assert_called_once_with(1)
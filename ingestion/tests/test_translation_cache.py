@@ -0,0 +1,25 @@
+from unittest import mock
+
+import redis
+from django.test import SimpleTestCase
+
+from ingestion.infrastructure.translation_cache import CachedTranslation, RedisTranslationCache, TranslationCacheKey
+
+
+class RedisTranslationCacheTests(SimpleTestCase):
+    def setUp(self):
+        # Nothing listens on port 1, so every command fails with a ConnectionError.
+        unreachable = redis.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+        patcher = mock.patch("ingestion.infrastructure.translation_cache.get_cache_redis", return_value=unreachable)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = RedisTranslationCache(ttl_seconds=60)
+        self.key = TranslationCacheKey("abc123", "de", "en", "dummy")
+
+    def test_get_many_treats_outage_as_misses(self):
+        with self.assertLogs("ingestion.infrastructure.translation_cache", level="WARNING"):
+            self.assertEqual(self.cache.get_many([self.key]), {})
+
+    def test_set_many_skips_write_on_outage(self):
+        with self.assertLogs("ingestion.infrastructure.translation_cache", level="WARNING"):
+            self.cache.set_many({self.key: CachedTranslation(translated_text="Hello", engine="dummy-prefix")})
@@ -1,7 +1,8 @@
 import os
+import time
 
-from celery import Celery
-from celery.signals import task_failure, task_prerun, task_postrun
+from celery import Celery, states
+from celery.signals import task_failure, task_prerun, task_postrun, worker_process_init, worker_process_shutdown
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "reg_ingestion.settings")
 
@@ -9,9 +10,12 @@ app = Celery("reg_ingestion")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
+_task_started_at: dict[str, float] = {}
+
 
 @task_prerun.connect
 def task_prerun_handler(*_, task_id: str, task, **__) -> None:
+    _task_started_at[task_id] = time.perf_counter()
     task.logger.info("celery.task.started", extra={"task_id": task_id, "task_name": task.name})
 
 
@@ -21,6 +25,22 @@ def task_postrun_handler(*_, task_id: str, task, state: str, **__) -> None:
         "celery.task.finished",
         extra={"task_id": task_id, "task_name": task.name, "state": state},
     )
+    from ingestion.application.audit_writer import get_audit_writer
+
+    # Runs before the late ack, so buffered audit rows are durable once the broker sees the task as done.
+    get_audit_writer().flush()
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is not None:
+        from ingestion.infrastructure.metrics import get_recorder
+
+        recorder = get_recorder()
+        stage = f"task:{task.name.rsplit('.', 1)[-1]}"
+        if state == states.IGNORED:
+            # Throttled tasks are re-published and end in Ignore; they are neither a failure nor a real run duration.
+            recorder.count(stage, "ignored")
+        else:
+            recorder.observe(stage, "-", time.perf_counter() - started_at, ok=state == states.SUCCESS)
+        recorder.maybe_flush()
 
 
 @task_failure.connect
@@ -30,3 +50,25 @@ def task_failure_handler(*_, task_id: str, exception: Exception, sender=None, **
         "celery.task.failed",
         extra={"task_id": task_id, "task_name": task_name, "error": str(exception)},
     )
+
+
+@worker_process_init.connect
+def worker_process_init_handler(*_, **__) -> None:
+    from django.conf import settings
+
+    from ingestion.application.audit_writer import configure_audit_writer
+    from ingestion.infrastructure.registry import init_service_registry
+
+    configure_audit_writer(buffered=settings.AUDIT_WRITE_BUFFERING)
+    init_service_registry()
+
+
+@worker_process_shutdown.connect
+def worker_process_shutdown_handler(*_, **__) -> None:
+    from ingestion.application.audit_writer import get_audit_writer
+    from ingestion.infrastructure.metrics import get_recorder
+    from ingestion.infrastructure.registry import reset_service_registry
+
+    get_audit_writer().flush()
+    get_recorder().flush()
+    reset_service_registry()
@@ -75,6 +75,17 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+# Evictable caches (dashboard, translations, summaries). Keep them off the broker instance, which must never evict.
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", REDIS_URL)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": CACHE_REDIS_URL,
+        "KEY_PREFIX": "reg_ingestion",
+    }
+}
+DASHBOARD_METRICS_CACHE_TTL = int(os.getenv("DASHBOARD_METRICS_CACHE_TTL", "15"))
+
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_TASK_ACKS_LATE = True
@@ -86,11 +97,112 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_ACCEPT_CONTENT = ["json"]
 
+PIPELINE_TASK_QUEUES = {
+    "ingestion.tasks.bulk_submit_task": "bookkeeping",
+    "ingestion.tasks.submit_job": "bookkeeping",
+    "ingestion.tasks.run_pipeline_task": "pipeline",
+    "ingestion.tasks.scrape_task": "scrape",
+    "ingestion.tasks.scrape_batch_task": "scrape",
+    "ingestion.tasks.expand_sitemap_task": "scrape",
+    "ingestion.tasks.translate_task": "translate",
+    "ingestion.tasks.summarize_task": "summarize",
+    "ingestion.tasks.complete_job": "bookkeeping",
+}
+PIPELINE_QUEUE_TIME_LIMITS = {
+    "scrape": int(os.getenv("CELERY_SCRAPE_TIME_LIMIT", str(CELERY_TASK_TIME_LIMIT))),
+    "translate": int(os.getenv("CELERY_TRANSLATE_TIME_LIMIT", "120")),
+    "summarize": int(os.getenv("CELERY_SUMMARIZE_TIME_LIMIT", "180")),
+    "bookkeeping": int(os.getenv("CELERY_BOOKKEEPING_TIME_LIMIT", "30")),
+}
+# The fused task runs scrape, translate and summarize back to back, so its budget covers all three stages.
+PIPELINE_QUEUE_TIME_LIMITS["pipeline"] = int(
+    os.getenv(
+        "CELERY_PIPELINE_TIME_LIMIT",
+        str(sum(PIPELINE_QUEUE_TIME_LIMITS[queue] for queue in ("scrape", "translate", "summarize"))),
+    )
+)
+CELERY_TASK_DEFAULT_QUEUE = "bookkeeping"
+CELERY_TASK_ROUTES = {task: {"queue": queue} for task, queue in PIPELINE_TASK_QUEUES.items()}
+CELERY_TASK_ANNOTATIONS = {
+    task: {
+        "time_limit": PIPELINE_QUEUE_TIME_LIMITS[queue],
+        "soft_time_limit": max(1, PIPELINE_QUEUE_TIME_LIMITS[queue] - 10),
+    }
+    for task, queue in PIPELINE_TASK_QUEUES.items()
+}
+
+# Job submission and dispatch: "celery" publishes one workflow per job; "postgres" leaves PENDING rows for
+# run_job_queue workers to claim.
+BULK_SUBMIT_BATCH_SIZE = int(os.getenv("BULK_SUBMIT_BATCH_SIZE", "5000"))
+BULK_DISPATCH_CHUNK_SIZE = int(os.getenv("BULK_DISPATCH_CHUNK_SIZE", "100"))
+JOB_DISPATCHER = os.getenv("JOB_DISPATCHER", "celery")
+JOB_QUEUE_BATCH_SIZE = int(os.getenv("JOB_QUEUE_BATCH_SIZE", "10"))
+JOB_QUEUE_POLL_SECONDS = float(os.getenv("JOB_QUEUE_POLL_SECONDS", "2"))
+JOB_QUEUE_LEASE_SECONDS = int(os.getenv("JOB_QUEUE_LEASE_SECONDS", "300"))
+JOB_QUEUE_MAX_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "3"))
+# RUNNING jobs without a lease (started by Celery workers) are requeued after this long without a status change.
+JOB_QUEUE_STALE_SECONDS = int(os.getenv("JOB_QUEUE_STALE_SECONDS", "3600"))
+
+# Worker processes buffer audit events and flush them in batches, and always at task postrun.
+AUDIT_WRITE_BUFFERING = os.getenv("AUDIT_WRITE_BUFFERING", "True").lower() == "true"
+AUDIT_BUFFER_MAX_EVENTS = int(os.getenv("AUDIT_BUFFER_MAX_EVENTS", "500"))
+AUDIT_BUFFER_FLUSH_INTERVAL_SECONDS = float(os.getenv("AUDIT_BUFFER_FLUSH_INTERVAL_SECONDS", "1.0"))
+
+CRAWL_DEFAULT_MAX_DEPTH = int(os.getenv("CRAWL_DEFAULT_MAX_DEPTH", "2"))
+CRAWL_DEFAULT_MAX_PAGES = int(os.getenv("CRAWL_DEFAULT_MAX_PAGES", "5000"))
+CRAWL_ENQUEUE_BATCH_SIZE = int(os.getenv("CRAWL_ENQUEUE_BATCH_SIZE", "1000"))
+CRAWL_FRONTIER_TTL_SECONDS = int(os.getenv("CRAWL_FRONTIER_TTL_SECONDS", str(7 * 24 * 3600)))
+CRAWL_SITEMAP_MAX_BYTES = int(os.getenv("CRAWL_SITEMAP_MAX_BYTES", str(50 * 1024 * 1024)))
+
+PIPELINE_EXECUTION_MODE = os.getenv("PIPELINE_EXECUTION_MODE", "chained")
+PIPELINE_PROFILE_SAMPLE_RATE = float(os.getenv("PIPELINE_PROFILE_SAMPLE_RATE", "0"))
+PIPELINE_PROFILE_DUMP_DIR = os.getenv("PIPELINE_PROFILE_DUMP_DIR", "")
+PIPELINE_PROFILER = os.getenv("PIPELINE_PROFILER", "cprofile")
+
+SCRAPER_STATIC_FIRST = os.getenv("SCRAPER_STATIC_FIRST", "True").lower() == "true"
+SCRAPER_STATIC_MIN_TEXT_CHARS = int(os.getenv("SCRAPER_STATIC_MIN_TEXT_CHARS", "200"))
+SCRAPER_TEXT_EXTRACTOR = os.getenv("SCRAPER_TEXT_EXTRACTOR", "bs4")
+CONTENT_CHUNK_MAX_CHARS = int(os.getenv("CONTENT_CHUNK_MAX_CHARS", "4000"))
+TRANSLATION_TARGET_LANGUAGE = os.getenv("TRANSLATION_TARGET_LANGUAGE", "en")
+TRANSLATION_BATCH_MAX_ITEMS = int(os.getenv("TRANSLATION_BATCH_MAX_ITEMS", "32"))
+TRANSLATION_BATCH_MAX_TOKENS = int(os.getenv("TRANSLATION_BATCH_MAX_TOKENS", "8000"))
+TRANSLATION_MAX_CONCURRENCY = int(os.getenv("TRANSLATION_MAX_CONCURRENCY", "4"))
+TRANSLATION_MAX_RETRIES = int(os.getenv("TRANSLATION_MAX_RETRIES", "3"))
+TRANSLATION_CACHE_BACKEND = os.getenv("TRANSLATION_CACHE_BACKEND", "redis")
+TRANSLATION_CACHE_TTL_SECONDS = int(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "1000000"))
+SUMMARY_MAX_INPUT_TOKENS = int(os.getenv("SUMMARY_MAX_INPUT_TOKENS", "6000"))
+SUMMARY_MAX_CONCURRENCY = int(os.getenv("SUMMARY_MAX_CONCURRENCY", "4"))
+SUMMARY_PARTIAL_CACHE_TTL_SECONDS = int(os.getenv("SUMMARY_PARTIAL_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+SUMMARY_RESULT_CACHE_TTL_SECONDS = int(os.getenv("SUMMARY_RESULT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+SCRAPER_BROWSER_POOL_SIZE = int(os.getenv("SCRAPER_BROWSER_POOL_SIZE", "1"))
+SCRAPER_BROWSER_MAX_PAGES = int(os.getenv("SCRAPER_BROWSER_MAX_PAGES", "100"))
+SCRAPER_BROWSER_MAX_HEAP_MB = int(os.getenv("SCRAPER_BROWSER_MAX_HEAP_MB", "512"))
+SCRAPER_ASYNC_MAX_CONCURRENCY = int(os.getenv("SCRAPER_ASYNC_MAX_CONCURRENCY", "8"))
+SCRAPER_ASYNC_PER_HOST_CONCURRENCY = int(os.getenv("SCRAPER_ASYNC_PER_HOST_CONCURRENCY", "2"))
+SCRAPER_WAIT_UNTIL = os.getenv("SCRAPER_WAIT_UNTIL", "domcontentloaded")
+SCRAPER_WAIT_FOR_STABLE_CONTENT = os.getenv("SCRAPER_WAIT_FOR_STABLE_CONTENT", "True").lower() == "true"
+SCRAPER_READY_TIMEOUT_MS = int(os.getenv("SCRAPER_READY_TIMEOUT_MS", "10000"))
+SCRAPER_BLOCKED_RESOURCE_TYPES = os.getenv("SCRAPER_BLOCKED_RESOURCE_TYPES", "image,media,font")
+SCRAPER_BLOCK_TRACKERS = os.getenv("SCRAPER_BLOCK_TRACKERS", "True").lower() == "true"
+SCRAPER_HOST_PAGE_PROFILES = os.getenv("SCRAPER_HOST_PAGE_PROFILES", "")
+SCRAPER_RESPECT_ROBOTS = os.getenv("SCRAPER_RESPECT_ROBOTS", "False").lower() == "true"
+SCRAPER_ROBOTS_TTL_SECONDS = int(os.getenv("SCRAPER_ROBOTS_TTL_SECONDS", str(24 * 3600)))
+SCRAPER_ROBOTS_ERROR_TTL_SECONDS = int(os.getenv("SCRAPER_ROBOTS_ERROR_TTL_SECONDS", "600"))
+SCRAPER_HOST_MIN_INTERVAL_SECONDS = float(os.getenv("SCRAPER_HOST_MIN_INTERVAL_SECONDS", "0"))
+SCRAPER_HOST_BURST = int(os.getenv("SCRAPER_HOST_BURST", "1"))
+# Longest single countdown for a throttled task; keep well below the broker visibility timeout (1h by default).
+SCRAPER_THROTTLE_MAX_DEFER_SECONDS = float(os.getenv("SCRAPER_THROTTLE_MAX_DEFER_SECONDS", "60"))
+
 AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET", "regulatory-artifacts")
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID", "")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY", "")
 AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL", "")
 AWS_DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+AWS_S3_HTML_COMPRESSION = os.getenv("AWS_S3_HTML_COMPRESSION", "")
+AWS_S3_MULTIPART_THRESHOLD_MB = int(os.getenv("AWS_S3_MULTIPART_THRESHOLD_MB", "8"))
+AWS_S3_MULTIPART_PART_MB = int(os.getenv("AWS_S3_MULTIPART_PART_MB", "8"))
+AWS_S3_UPLOAD_WORKERS = int(os.getenv("AWS_S3_UPLOAD_WORKERS", "2"))
 
 LOGGING = {
     "version": 1,